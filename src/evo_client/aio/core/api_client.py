@@ -6,6 +6,11 @@ from loguru import logger
 from pydantic import BaseModel
 
 from ...core.configuration import Configuration
+from ...utils.rate_limit_utils import (
+    AsyncTokenBucketRateLimiter,
+    get_shared_rate_limiter,
+    rate_limit_key,
+)
 from .request_handler import AsyncRequestHandler
 
 T = TypeVar("T", bound=BaseModel)
@@ -32,6 +37,16 @@ class AsyncApiClient:
         """
         self.configuration = configuration or Configuration()
         self.request_handler = AsyncRequestHandler(self.configuration)
+        self.rate_limiter = AsyncTokenBucketRateLimiter(
+            get_shared_rate_limiter(
+                rate_limit_key(self.configuration),
+                max_requests=self.configuration.rate_limit_max_requests,
+                time_window=self.configuration.rate_limit_time_window,
+                burst=self.configuration.rate_limit_burst,
+                state_dir=self.configuration.rate_limit_state_dir,
+                adaptive=self.configuration.rate_limit_adaptive,
+            )
+        )
 
         # Initialize headers
         self.default_headers: Dict[str, str | None] = {}
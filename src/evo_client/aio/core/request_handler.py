@@ -1,19 +1,17 @@
 """Async HTTP request handler using aiohttp."""
 
 import asyncio
-import json
 from typing import (
     Any,
     Dict,
     Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
     cast,
-    get_args,
-    get_origin,
 )
 
 import aiohttp
@@ -21,9 +19,22 @@ from loguru import logger
 from pydantic import BaseModel
 
 from ...core.configuration import Configuration
+from ...core.response import response_validator
+from ...utils import json_utils
+from ...utils.cache_utils import (
+    request_key,
+    response_cache_for,
+    revalidation_cache_for,
+)
+from ...utils.logging_utils import payload_preview
+from ...utils.record_utils import construct_records, resolve_record_mode
+from ...utils.single_flight_utils import get_shared_async_single_flight
 
 T = TypeVar("T", bound=BaseModel)
 
+# Marks a response whose body has not been parsed yet
+_UNPARSED = object()
+
 
 class AsyncRequestHandler:
     """Handles async HTTP request preparation and execution using aiohttp."""
@@ -36,6 +47,13 @@ class AsyncRequestHandler:
             )
 
         self.configuration = configuration
+        self.response_cache = response_cache_for(configuration)
+        self.revalidation_cache = revalidation_cache_for(configuration)
+        self.single_flight = (
+            get_shared_async_single_flight()
+            if configuration.single_flight_enabled
+            else None
+        )
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self) -> "AsyncRequestHandler":
@@ -107,6 +125,15 @@ class AsyncRequestHandler:
 
         return prepared
 
+    def _log_payload(self, label: str, payload: Any) -> None:
+        """Log a size-capped payload when payload logging is enabled."""
+        if payload is None or not self.configuration.log_payloads:
+            return
+        max_bytes = self.configuration.log_payload_max_bytes
+        logger.opt(lazy=True).debug(
+            label + ": {}", lambda: payload_preview(payload, max_bytes)
+        )
+
     async def execute(
         self, response_type: Optional[Type[T] | Type[Iterable[T]]] = None, **kwargs
     ) -> Union[T, List[T], Any]:
@@ -122,18 +149,16 @@ class AsyncRequestHandler:
         raw_response = kwargs.get("raw_response", False)
         _return_http_data_only = kwargs.get("_return_http_data_only", True)
 
-        # Log the full URL and request details
-        logger.debug(f"Making async {method} request to {url}")
-        logger.debug(f"Host: {self.configuration.host}")
-        logger.debug(f"Resource path: {kwargs.get('resource_path', '')}")
+        # Messages are formatted by loguru only when debug logging is on
+        logger.debug("Making async {} request to {}", method, url)
 
         # Prepare request parameters
         headers = self._prepare_headers(kwargs.get("header_params"))
         query_params = self._prepare_params(kwargs.get("query_params"))
         body = kwargs.get("body")
 
-        logger.debug(f"Request headers: {headers}")
-        logger.debug(f"Request body: {body}")
+        logger.debug("Request headers: {}", headers)
+        self._log_payload("Request body", body)
 
         # Prepare authentication
         auth = None
@@ -163,9 +188,47 @@ class AsyncRequestHandler:
             else:
                 data = body
 
+        # Only deserialized responses are cached; raw callers get the live one
+        cache = self.response_cache
+        cache_key, cache_ttl = None, 0.0
+        if cache and not raw_response and _return_http_data_only:
+            cache_ttl = cache.ttl_for(method, kwargs.get("resource_path", ""))
+            if cache_ttl > 0:
+                cache_key = cache.key(
+                    self.configuration,
+                    method,
+                    kwargs.get("resource_path", ""),
+                    query_params,
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Serving {} {} from the response cache", method, url)
+                    return self._deserialize_response(
+                        AsyncRESTResponse(
+                            status=cached.status,
+                            headers=cached.headers,
+                            data=cached.data,
+                            url=url,
+                        ),
+                        response_type,
+                    )
+
+        # Revalidate a stored body instead of downloading it again
+        revalidation = self.revalidation_cache
+        revalidation_key, validated = None, None
+        if revalidation and revalidation.applies_to(
+            method, kwargs.get("resource_path", "")
+        ):
+            revalidation_key = request_key(
+                self.configuration, method, url, query_params
+            )
+            validated = revalidation.get(revalidation_key)
+            if validated is not None:
+                headers.update(revalidation.conditional_headers(validated))
+
         session = await self._ensure_session()
 
-        try:
+        async def send() -> Tuple[aiohttp.ClientResponse, bytes]:
             async with session.request(
                 method=method,
                 url=url,
@@ -175,102 +238,124 @@ class AsyncRequestHandler:
                 json=json_data,
                 auth=auth,
             ) as response:
-                logger.debug(f"Response status: {response.status}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+                logger.debug("Response status: {}", response.status)
+                logger.opt(lazy=True).debug(
+                    "Response headers: {}", lambda: dict(response.headers)
+                )
+
+                # A 304 has no body; the stored one is reused instead
+                if response.status == 304:
+                    return response, b""
 
                 # Read response data
                 response_data = await response.read()
-                logger.debug(f"Raw response data length: {len(response_data)}")
+                logger.debug("Response data length: {}", len(response_data))
+                self._log_payload("Response body", response_data)
+                return response, response_data
+
+        try:
+            # Concurrent identical GETs share one request
+            if self.single_flight and method.upper() == "GET" and body is None:
+                # Only callers able to handle a 304 share a conditional request
+                flight_key = request_key(self.configuration, method, url, query_params)
+                if validated is not None:
+                    flight_key += " conditional"
+                response, response_data = await self.single_flight.do(flight_key, send)
+            else:
+                response, response_data = await send()
 
-                # Create a RESTResponse-like object for compatibility
+            if response.status == 304 and validated is not None:
+                logger.debug("{} not modified, reusing the stored body", url)
                 rest_response = AsyncRESTResponse(
-                    status=response.status,
-                    headers=dict(response.headers),
-                    data=response_data,
+                    status=validated.status,
+                    headers=validated.headers,
+                    data=validated.data,
                     url=str(response.url),
                 )
-
-                # Return raw response if requested or if it's a non-JSON content type
-                content_type = response.headers.get("Content-Type", "")
-                if (
-                    raw_response
-                    or not _return_http_data_only
-                    or "application/json" not in content_type.lower()
-                ):
-                    logger.debug("Returning raw response")
+                if raw_response or not _return_http_data_only:
                     return rest_response
+                if cache and cache_key is not None:
+                    cache.put(
+                        cache_key,
+                        cache_ttl,
+                        validated.status,
+                        validated.headers,
+                        validated.data,
+                    )
+                return self._deserialize_response(rest_response, response_type)
+
+            if revalidation and revalidation_key is not None:
+                revalidation.put(
+                    revalidation_key,
+                    response.status,
+                    dict(response.headers),
+                    response_data,
+                )
+
+            # Create a RESTResponse-like object for compatibility
+            rest_response = AsyncRESTResponse(
+                status=response.status,
+                headers=dict(response.headers),
+                data=response_data,
+                url=str(response.url),
+            )
+
+            # Return raw response if requested or if it's a non-JSON content type
+            content_type = response.headers.get("Content-Type", "")
+            if (
+                raw_response
+                or not _return_http_data_only
+                or "application/json" not in content_type.lower()
+            ):
+                logger.debug("Returning raw response")
+                return rest_response
+
+            # Check for error status codes
+            if response.status >= 400:
+                logger.error(f"Request failed with status {response.status}")
+                logger.error(
+                    "Error response: {}",
+                    payload_preview(
+                        response_data, self.configuration.log_payload_max_bytes
+                    ),
+                )
+
+                # Raise appropriate exception based on status code
+                if response.status == 401:
+                    raise aiohttp.ClientResponseError(
+                        request_info=response.request_info,
+                        history=response.history,
+                        status=response.status,
+                        headers=response.headers,
+                        message="Unauthorized - check your credentials",
+                    )
+                elif response.status == 404:
+                    raise aiohttp.ClientResponseError(
+                        request_info=response.request_info,
+                        history=response.history,
+                        status=response.status,
+                        headers=response.headers,
+                        message="Resource not found",
+                    )
+                else:
+                    raise aiohttp.ClientResponseError(
+                        request_info=response.request_info,
+                        history=response.history,
+                        status=response.status,
+                        headers=response.headers,
+                        message=f"HTTP {response.status} error",
+                    )
+
+            if cache and cache_key is not None:
+                cache.put(
+                    cache_key,
+                    cache_ttl,
+                    response.status,
+                    dict(response.headers),
+                    response_data,
+                )
 
-                # Check for error status codes
-                if response.status >= 400:
-                    logger.error(f"Request failed with status {response.status}")
-                    try:
-                        error_text = response_data.decode("utf-8", errors="replace")
-                        logger.error(f"Error response: {error_text}")
-                    except Exception:
-                        pass
-
-                    # Raise appropriate exception based on status code
-                    if response.status == 401:
-                        raise aiohttp.ClientResponseError(
-                            request_info=response.request_info,
-                            history=response.history,
-                            status=response.status,
-                            message="Unauthorized - check your credentials",
-                        )
-                    elif response.status == 404:
-                        raise aiohttp.ClientResponseError(
-                            request_info=response.request_info,
-                            history=response.history,
-                            status=response.status,
-                            message="Resource not found",
-                        )
-                    else:
-                        raise aiohttp.ClientResponseError(
-                            request_info=response.request_info,
-                            history=response.history,
-                            status=response.status,
-                            message=f"HTTP {response.status} error",
-                        )
-
-                # Try to decode response data
-                decoded_data = None
-                if response_data:
-                    try:
-                        decoded_data = response_data.decode("utf-8", errors="replace")
-                        logger.debug(
-                            f"Decoded response: {decoded_data[:500]}..."
-                        )  # Log first 500 chars
-                    except Exception as e:
-                        logger.warning(f"Failed to decode response: {e}")
-
-                # If a specific response type is expected, try to deserialize
-                if response_type:
-                    try:
-                        return rest_response.deserialize(response_type)
-                    except Exception as e:
-                        logger.warning(f"Failed to deserialize response: {e}")
-                        if 200 <= response.status < 300:
-                            logger.debug(
-                                f"Request succeeded with status {response.status} despite deserialization failure"
-                            )
-                            return rest_response
-                        raise ValueError(f"Failed to deserialize response: {str(e)}")
-
-                # Try to parse as JSON
-                try:
-                    if decoded_data:
-                        return json.loads(decoded_data)
-                    return {}
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse response as JSON: {e}")
-                    # Return response object for successful status codes even if parsing fails
-                    if 200 <= response.status < 300:
-                        logger.debug(
-                            f"Request succeeded with status {response.status} despite parsing failure"
-                        )
-                        return rest_response
-                    logger.error(f"Request failed with status {response.status}")
-                    raise ValueError(f"Failed to parse response: {str(e)}")
+            return self._deserialize_response(rest_response, response_type)
 
         except aiohttp.ClientError as e:
             logger.error(f"HTTP client error: {e}")
@@ -282,6 +367,43 @@ class AsyncRequestHandler:
             logger.error(f"Unexpected error in async request: {e}")
             raise
 
+    def _deserialize_response(
+        self,
+        rest_response: "AsyncRESTResponse",
+        response_type: Optional[Type[T] | Type[Iterable[T]]],
+    ) -> Union[T, List[T], Any]:
+        """Deserialize a successful JSON response."""
+        # If a specific response type is expected, try to deserialize
+        if response_type:
+            try:
+                return rest_response.deserialize(
+                    response_type, resolve_record_mode(self.configuration)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to deserialize response: {e}")
+                if 200 <= rest_response.status < 300:
+                    logger.debug(
+                        f"Request succeeded with status {rest_response.status} despite deserialization failure"
+                    )
+                    return rest_response
+                raise ValueError(f"Failed to deserialize response: {str(e)}")
+
+        # Try to parse as JSON
+        try:
+            if rest_response.data:
+                return rest_response.json()
+            return {}
+        except ValueError as e:
+            logger.warning(f"Failed to parse response as JSON: {e}")
+            # Return response object for successful status codes even if parsing fails
+            if 200 <= rest_response.status < 300:
+                logger.debug(
+                    f"Request succeeded with status {rest_response.status} despite parsing failure"
+                )
+                return rest_response
+            logger.error(f"Request failed with status {rest_response.status}")
+            raise ValueError(f"Failed to parse response: {str(e)}")
+
 
 class AsyncRESTResponse:
     """Async-compatible response wrapper that mimics RESTResponse interface."""
@@ -291,33 +413,34 @@ class AsyncRESTResponse:
         self._headers = headers
         self.data = data
         self.url = url
+        self._json: Any = _UNPARSED
 
     def getheaders(self) -> Dict[str, str]:
         """Get response headers."""
         return self._headers
 
     def json(self) -> Any:
-        """Parse response as JSON."""
-        if isinstance(self.data, bytes):
-            text = self.data.decode("utf-8", errors="replace")
-        else:
-            text = self.data
-        return json.loads(text)
+        """Parse response as JSON, parsing the body only once."""
+        if self._json is _UNPARSED:
+            self._json = json_utils.loads(self.data)
+        return self._json
 
     def deserialize(
-        self, response_type: Type[T] | Type[Iterable[T]]
+        self, response_type: Type[T] | Type[Iterable[T]], record_mode: str = "model"
     ) -> Union[T, List[T]]:
-        """Deserialize response to the specified type."""
-        if isinstance(response_type, type) and issubclass(response_type, BaseModel):
-            return cast(T, response_type.model_validate(self.json()))
-
-        # Handle generic types like List[SomeBaseModel]
-        origin = get_origin(response_type)
-        if origin is list:
-            item_type = get_args(response_type)[0]
-            return cast(
-                List[T], [item_type.model_validate(item) for item in self.json()]
-            )
+        """Deserialize response to the specified type.
 
-        # Direct construction for simple types
-        return cast(Union[T, List[T]], response_type(**self.json()))
+        ``record_mode`` selects unvalidated records instead of validated models;
+        see :mod:`evo_client.utils.record_utils`.
+        """
+        if record_mode == "dict":
+            return self.json()
+        if record_mode == "construct":
+            return construct_records(response_type, self.json())
+        validator = response_validator(response_type)
+        if validator is None:
+            # Direct construction for simple types
+            return cast(Union[T, List[T]], response_type(**self.json()))
+        if self._json is _UNPARSED:
+            return validator.validate_json(self.data)
+        return validator.validate_python(self._json)
@@ -1,8 +1,9 @@
+import hashlib
 import json
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
-from typing import Annotated, List, Optional
+from typing import Annotated, Iterable, List, Optional
 
 import typer
 from loguru import logger
@@ -14,6 +15,7 @@ from rich.tree import Tree
 from ..core.configuration import Configuration
 from ..models.gym_model import GymKnowledgeBase
 from ..models.webhook_model import WebhookEventType
+from ..services.columnar_export import ColumnarExportService
 from ..services.data_fetchers import BranchApiClientManager
 from ..services.data_fetchers.gym_metrics_data_fetcher import GymMetricsDataFetcher
 from ..services.data_fetchers.overdue_members_data_fetcher import (
@@ -25,9 +27,37 @@ from ..services.member_files.member_files_data_fetcher import MemberFilesDataFet
 from ..services.operating_data.operating_data_fetcher import OperatingDataFetcher
 from ..services.webhook_management.webhook_management import WebhookManagementService
 from ..sync.core.api_client import SyncApiClient
+from ..utils.cache_utils import DiskCache
 
 console = Console()
 
+# Reference data such as branch configurations is cached here across CLI runs
+RESPONSE_CACHE_DIR = Path(".config") / "cache"
+
+
+def _response_cache_dir(username: str) -> Path:
+    """Response cache directory of one credential."""
+    # One directory per credential, so logging one out leaves the others cached
+    return RESPONSE_CACHE_DIR / hashlib.sha256(username.encode()).hexdigest()[:16]
+
+
+def _clear_response_caches(creds: Iterable[dict]) -> None:
+    """Drop the cached responses of the given branch credentials."""
+    for branch_creds in creds:
+        DiskCache(_response_cache_dir(branch_creds["username"])).clear()
+
+
+def _branch_configuration(branch_creds: dict) -> Configuration:
+    """Build the configuration of a branch client from its credentials."""
+    return Configuration(
+        username=branch_creds["username"],
+        password=branch_creds["password"],
+        response_cache_enabled=True,
+        response_cache_dir=str(_response_cache_dir(branch_creds["username"])),
+        conditional_requests_enabled=True,
+    )
+
+
 app = typer.Typer(
     help="Gym Management CLI", no_args_is_help=True, rich_markup_mode="rich"
 )
@@ -59,9 +89,11 @@ app.add_typer(
 # New subcommands
 overdue_app = typer.Typer(help="Retrieve overdue members for campaigns")
 metrics_app = typer.Typer(help="Retrieve advanced metrics like MRR, LTV, NRR, etc.")
+export_app = typer.Typer(help="Export paginated data for analytics")
 
 app.add_typer(overdue_app, name="overdue", help="Overdue members retrieval")
 app.add_typer(metrics_app, name="metrics", help="Advanced KPI metrics")
+app.add_typer(export_app, name="export", help="Columnar data export")
 
 
 class State:
@@ -126,11 +158,8 @@ class State:
 
             branch_api_clients = {}
             for branch_id, branch_creds in creds.items():
-                configuration = Configuration()
-                configuration.username = branch_creds["username"]
-                configuration.password = branch_creds["password"]
                 branch_api_clients[str(branch_id)] = SyncApiClient(
-                    configuration=configuration
+                    configuration=_branch_configuration(branch_creds)
                 )
             self._client_manager = BranchApiClientManager(
                 branch_api_clients=branch_api_clients
@@ -181,11 +210,7 @@ def get_gym_api() -> GymApi:
     # Use the most recently modified credential file
     latest_cred_file = max(cred_files, key=lambda f: f.stat().st_mtime)
     gym_name = latest_cred_file.stem.split(".")[1]
-    config_file = config_dir / f"branch_configs.{gym_name}.json"
-
-    logger.debug(
-        f"Processing gym {gym_name}, config will be saved to: {config_file.absolute()}"
-    )
+    logger.debug(f"Processing gym {gym_name}")
 
     # Read credentials
     with open(latest_cred_file) as f:
@@ -199,61 +224,24 @@ def get_gym_api() -> GymApi:
     # Initialize branch API clients
     branch_api_clients = {}
     for branch_id, branch_creds in creds.items():
-        configuration = Configuration()
-        configuration.username = branch_creds["username"]
-        configuration.password = branch_creds["password"]
-        branch_api_clients[str(branch_id)] = SyncApiClient(configuration=configuration)
+        branch_api_clients[str(branch_id)] = SyncApiClient(
+            configuration=_branch_configuration(branch_creds)
+        )
 
     client_manager = BranchApiClientManager(branch_api_clients=branch_api_clients)
     gym_api = GymApi(client_manager=client_manager)
 
-    # Only validate/fetch configurations if cache doesn't exist
-    if not config_file.exists():
-        logger.debug("No cached configurations found, fetching from API...")
-        try:
-            configs = (
-                gym_api.configuration_data_fetcher.validate_and_cache_configurations()
-            )
-            logger.debug(f"Retrieved {len(configs)} configurations from API")
-
-            # Save configurations using same naming pattern as credentials
-            for cred_file in cred_files:
-                gym_name = cred_file.stem.split(".")[1]
-                config_file = config_dir / f"branch_configs.{gym_name}.json"
-
-                # Convert configurations to JSON-serializable format
-                serializable_configs = []
-                for config in configs:
-                    config_dict = config.model_dump()
-                    # Convert any datetime objects to ISO format strings
-                    for key, value in config_dict.items():
-                        if isinstance(value, datetime):
-                            config_dict[key] = value.isoformat()
-                    serializable_configs.append(config_dict)
-
-                cache_data = {
-                    "last_updated": datetime.now().isoformat(),
-                    "configurations": serializable_configs,
-                }
-
-                with open(config_file, "w") as f:
-                    json.dump(cache_data, f, indent=2)
-                logger.debug(f"Saved configuration to: {config_file.absolute()}")
-
-                # Verify file exists and has content
-                if config_file.exists():
-                    logger.debug(
-                        f"Configuration file size: {config_file.stat().st_size} bytes"
-                    )
-                else:
-                    logger.error(f"Configuration file was not created: {config_file}")
-
-        except Exception as e:
-            logger.error(f"Failed to validate configurations: {str(e)}")
-            console.print(
-                "[red]Error validating branch configurations. Please check credentials.[/red]"
-            )
-            raise typer.Exit(1)
+    # Validates the credentials. Repeated runs with the same credentials are
+    # served from the response cache; a changed password misses it
+    try:
+        configs = gym_api.configuration_data_fetcher.validate_and_cache_configurations()
+        logger.debug(f"Retrieved {len(configs)} branch configurations")
+    except Exception as e:
+        logger.error(f"Failed to validate configurations: {str(e)}")
+        console.print(
+            "[red]Error validating branch configurations. Please check credentials.[/red]"
+        )
+        raise typer.Exit(1)
 
     return gym_api
 
@@ -377,44 +365,21 @@ def auth_login_file(
         # Initialize API client and fetch configurations
         branch_api_clients = {}
         for branch_id, branch_creds in creds.items():
-            configuration = Configuration()
-            configuration.username = branch_creds["username"]
-            configuration.password = branch_creds["password"]
             branch_api_clients[str(branch_id)] = SyncApiClient(
-                configuration=configuration
+                configuration=_branch_configuration(branch_creds)
             )
 
         client_manager = BranchApiClientManager(branch_api_clients=branch_api_clients)
         api_client = GymApi(client_manager=client_manager)
 
-        # Fetch and save branch configurations
+        # Fetch branch configurations, which also fills the response cache
         logger.debug("Fetching branch configurations...")
         configs = (
             api_client.configuration_data_fetcher.validate_and_cache_configurations()
         )
 
-        # Convert configurations to JSON-serializable format
-        serializable_configs = []
-        for config in configs:
-            config_dict = config.model_dump()
-            # Convert any datetime objects to ISO format strings
-            for key, value in config_dict.items():
-                if isinstance(value, datetime):
-                    config_dict[key] = value.isoformat()
-            serializable_configs.append(config_dict)
-
-        # Save configurations
-        config_file = config_dir / f"branch_configs.{gym_name}.json"
-        cache_data = {
-            "last_updated": datetime.now().isoformat(),
-            "configurations": serializable_configs,
-        }
-
-        with open(config_file, "w") as f:
-            json.dump(cache_data, f, indent=2)
-
         rich_print(
-            f"[green]✓[/green] Fetched and saved configurations for {len(configs)} branches"
+            f"[green]✓[/green] Fetched and cached configurations for {len(configs)} branches"
         )
 
     except Exception as e:
@@ -443,6 +408,8 @@ def auth_logout(
     if all:
         # Remove all credential files
         for cred_file in config_dir.glob("credentials.*.json"):
+            with open(cred_file) as f:
+                _clear_response_caches(json.load(f).values())
             cred_file.unlink()
             rich_print(
                 f"[green]✓[/green] Removed credentials for {cred_file.stem.split('.')[1]}"
@@ -454,7 +421,6 @@ def auth_logout(
         return
 
     config_file = config_dir / f"credentials.{gym_name}.json"
-    config_cache = config_dir / f"branch_configs.{gym_name}.json"
 
     if not config_file.exists():
         rich_print(f"[yellow]No credentials found for {gym_name}[/yellow]")
@@ -465,7 +431,7 @@ def auth_logout(
 
     if branch_id:
         if branch_id in config:
-            del config[branch_id]
+            _clear_response_caches([config.pop(branch_id)])
             rich_print(
                 f"[green]✓[/green] Credentials removed for {gym_name} branch {branch_id}"
             )
@@ -473,8 +439,7 @@ def auth_logout(
             rich_print(f"[yellow]No credentials found for branch {branch_id}[/yellow]")
     else:
         config_file.unlink()
-        if config_cache.exists():
-            config_cache.unlink()
+        _clear_response_caches(config.values())
         rich_print(f"[green]✓[/green] All credentials removed for {gym_name}")
         return
 
@@ -483,8 +448,6 @@ def auth_logout(
             json.dump(config, f, indent=2)
     else:
         config_file.unlink()
-        if config_cache.exists():
-            config_cache.unlink()
 
 
 @auth_app.command("list")
@@ -558,8 +521,9 @@ def contracts_categories():
 @finance_app.command("list")
 def finance_list():
     """List receivables."""
-    receivables = state.gym_api.receivables_data_fetcher.fetch_receivables()
-    console.print(receivables)
+    # Print as pages arrive instead of holding every receivable in memory
+    for receivable in state.gym_api.receivables_data_fetcher.iter_receivables():
+        console.print(receivable)
 
 
 def _display_kb_table(kb: GymKnowledgeBase):
@@ -819,6 +783,51 @@ def metrics_advanced(
         console.print(f"Campaign Effectiveness: {campaign_effect}")
 
 
+@export_app.command("parquet")
+def export_parquet(
+    entities: str = typer.Option(
+        "members,receivables,entries,sales",
+        "--entities",
+        "-e",
+        help="Comma-separated entities to export",
+    ),
+    output_dir: Path = typer.Option(
+        Path("export"), "--output-dir", "-o", help="Root directory of the dataset"
+    ),
+    branch_ids: str = typer.Option(
+        "", "--branch-ids", help="Comma-separated branch IDs"
+    ),
+    granularity: str = typer.Option(
+        "day", "--granularity", help="Date partitions: day or month"
+    ),
+):
+    client_manager = state.get_client_manager()
+    exporter = ColumnarExportService(client_manager)
+
+    branches = None
+    if branch_ids.strip():
+        branches = [
+            int(b.strip()) for b in branch_ids.split(",") if b.strip().isdigit()
+        ]
+
+    table = Table(title=f"Parquet export to {output_dir}")
+    table.add_column("Entity")
+    table.add_column("Branch ID", justify="right")
+    table.add_column("Records", justify="right")
+
+    for entity in [e.strip() for e in entities.split(",") if e.strip()]:
+        try:
+            exported = exporter.export(
+                entity, output_dir, branch_ids=branches, date_granularity=granularity
+            )
+        except (ImportError, ValueError) as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+        for branch_id, count in exported.items():
+            table.add_row(entity, str(branch_id), str(count))
+    console.print(table)
+
+
 @webhooks_app.command("subscribe")
 def webhook_subscribe(
     url: str = typer.Option(..., "--url", "-u", help="Webhook callback URL"),
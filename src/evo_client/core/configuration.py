@@ -7,13 +7,15 @@ from __future__ import annotations
 
 import multiprocessing
 import sys
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 from loguru import logger
 from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from requests.auth import HTTPBasicAuth
 
+from ..utils.record_utils import validate_record_mode
+
 
 class Configuration(BaseModel):
     """Configuration settings for the API client."""
@@ -48,6 +50,39 @@ class Configuration(BaseModel):
     proxy: Optional[str] = None
     safe_chars_for_path_param: str = ""
 
+    # Rate limiting (shared by every client using the same credential)
+    rate_limit_max_requests: int = 40
+    rate_limit_time_window: float = 60.0
+    # Requests issued back to back before pacing starts; set it to
+    # rate_limit_max_requests to burst until the budget is exhausted
+    rate_limit_burst: int = 1
+    rate_limit_state_dir: Optional[str] = None
+    rate_limit_adaptive: bool = False
+
+    # Response cache for near-static GET endpoints (see utils.cache_utils);
+    # ttls override the per-path defaults, 0 disables a path
+    response_cache_enabled: bool = False
+    response_cache_ttls: Dict[str, float] = Field(default_factory=dict)
+    response_cache_max_entries: int = 256
+    # Keep entries on disk, shared across processes, instead of in memory
+    response_cache_dir: Optional[str] = None
+    # Revalidate repeat GETs with ETag/Last-Modified and reuse the stored
+    # body on 304; entries share the response cache backend. Only the given
+    # paths are revalidated (None uses the reference-data defaults)
+    conditional_requests_enabled: bool = False
+    conditional_requests_max_age: float = 86400
+    conditional_requests_paths: Optional[List[str]] = None
+    # Let concurrent identical GETs share one network request
+    single_flight_enabled: bool = True
+
+    # Debug logging of request and response bodies (opt-in, truncated)
+    log_payloads: bool = False
+    log_payload_max_bytes: int = 1024
+
+    # How responses are built: "model" (validated), "construct" (unvalidated
+    # models) or "dict" (raw JSON); see utils.record_utils
+    record_mode: str = "model"
+
     # Branch configurations
     branch_configs: list = []
 
@@ -71,6 +106,12 @@ class Configuration(BaseModel):
             raise ValueError("Timeout must be positive")
         return v
 
+    @field_validator("record_mode")
+    @classmethod
+    def validate_record_mode(cls, v: str) -> str:
+        """Validate record_mode is a known mode."""
+        return validate_record_mode(v)
+
     @field_validator("cert_file", "key_file")
     @classmethod
     def validate_cert_key_files(
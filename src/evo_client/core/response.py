@@ -1,4 +1,5 @@
 import io
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -9,16 +10,41 @@ from typing import (
     TypeVar,
     Union,
     cast,
-    get_args,
     get_origin,
     overload,
 )
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from ..utils import json_utils
+from ..utils.record_utils import construct_records
 
 T = TypeVar("T", bound=BaseModel)
 
+# Marks a response whose body has not been parsed yet
+_UNPARSED = object()
+
+
+@lru_cache(maxsize=256)
+def _type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def response_validator(response_type: Any) -> Optional[TypeAdapter]:
+    """Return the cached adapter validating a model or list response type.
+
+    Adapters validate a whole body in pydantic-core, straight from the JSON
+    bytes when it has not been parsed yet. Other types return None and are
+    built from the parsed body instead.
+    """
+    if get_origin(response_type) is list or (
+        isinstance(response_type, type) and issubclass(response_type, BaseModel)
+    ):
+        return _type_adapter(response_type)
+    return None
+
 
 class RESTResponse(io.IOBase):
     """Wrapper for requests Response object."""
@@ -28,6 +54,23 @@ class RESTResponse(io.IOBase):
         self.status = response.status_code
         self.reason = response.reason
         self.data = response.content
+        self._json: Any = _UNPARSED
+
+    @classmethod
+    def from_content(
+        cls,
+        status: int,
+        headers: Dict[str, str],
+        data: bytes,
+        reason: Optional[str] = None,
+    ) -> "RESTResponse":
+        """Build a response from a stored status, headers and body."""
+        response = Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = data
+        return cls(response)
 
     def getheaders(self) -> Dict[str, str]:
         """Returns response headers dictionary."""
@@ -38,38 +81,46 @@ class RESTResponse(io.IOBase):
         return self.requests_response.headers.get(name, default)
 
     def json(self) -> Any:
-        """Returns response data as JSON."""
-        try:
-            # Try to parse as JSON regardless of Content-Type
-            return self.requests_response.json()
-        except Exception as e:
-            # If parsing fails, check if it's due to Content-Type
-            content_type = self.getheader("Content-Type", "")
-            if content_type and "application/json" not in content_type:
-                raise ValueError("Response content is not in JSON format")
-            # Otherwise, re-raise the original error
-            raise e
+        """Returns response data as JSON, parsing the body only once."""
+        if self._json is _UNPARSED:
+            try:
+                # Parse regardless of Content-Type
+                self._json = json_utils.loads(self.data)
+            except ValueError:
+                # If parsing fails, check if it's due to Content-Type
+                content_type = self.getheader("Content-Type", "")
+                if content_type and "application/json" not in content_type:
+                    raise ValueError("Response content is not in JSON format")
+                # Otherwise, re-raise the original error
+                raise
+        return self._json
 
     @overload
-    def deserialize(self, response_type: Type[T]) -> T:
+    def deserialize(self, response_type: Type[T], record_mode: str = ...) -> T:
         ...
 
     @overload
-    def deserialize(self, response_type: Type[Iterable[T]]) -> List[T]:
+    def deserialize(
+        self, response_type: Type[Iterable[T]], record_mode: str = ...
+    ) -> List[T]:
         ...
 
-    def deserialize(self, response_type: Type[T] | Type[Iterable[T]]) -> T | List[T]:
-        """Deserialize response data into the specified type."""
-        if isinstance(response_type, type) and issubclass(response_type, BaseModel):
-            return cast(T, response_type.model_validate(self.json()))
-
-        # Handle generic types like List[SomeBaseModel]
-        origin = get_origin(response_type)
-        if origin is list:
-            item_type = get_args(response_type)[0]
-            return cast(
-                List[T], [item_type.model_validate(item) for item in self.json()]
-            )
-
-        # Direct construction for simple types
-        return cast(Union[T, List[T]], response_type(**self.json()))
+    def deserialize(
+        self, response_type: Type[T] | Type[Iterable[T]], record_mode: str = "model"
+    ) -> T | List[T]:
+        """Deserialize response data into the specified type.
+
+        ``record_mode`` selects unvalidated records instead of validated models;
+        see :mod:`evo_client.utils.record_utils`.
+        """
+        if record_mode == "dict":
+            return self.json()
+        if record_mode == "construct":
+            return construct_records(response_type, self.json())
+        validator = response_validator(response_type)
+        if validator is None:
+            # Direct construction for simple types
+            return cast(Union[T, List[T]], response_type(**self.json()))
+        if self._json is _UNPARSED:
+            return validator.validate_json(self.data)
+        return validator.validate_python(self._json)
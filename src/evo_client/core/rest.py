@@ -1,6 +1,8 @@
 from typing import Any, Dict, Optional, TypeVar, Union
+from urllib.parse import urlsplit
 
 import requests
+from loguru import logger
 from pydantic import BaseModel
 from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
@@ -8,6 +10,7 @@ from requests.sessions import Session
 
 from ..core.configuration import Configuration
 from ..exceptions.api_exceptions import ApiException
+from ..utils.cache_utils import request_key, revalidation_cache_for
 from .response import RESTResponse
 
 T = TypeVar("T", bound=BaseModel)
@@ -24,6 +27,7 @@ class RESTClient:
     ):
         self.session = self._create_session(configuration, pools_size, maxsize)
         self.configuration = configuration
+        self.revalidation_cache = revalidation_cache_for(configuration)
 
     def _create_session(
         self, config: Configuration, pools_size: int, maxsize: Optional[int]
@@ -66,6 +70,19 @@ class RESTClient:
         headers = headers or {"Content-Type": "application/json"}
         auth = auth or self.configuration.get_basic_auth_token()
 
+        # Revalidate a stored body instead of downloading it again
+        cache = self.revalidation_cache
+        cache_key, cached = None, None
+        if (
+            cache
+            and preload_content
+            and cache.applies_to(method, self._resource_path(url))
+        ):
+            cache_key = request_key(self.configuration, method, url, query_params)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                headers = {**headers, **cache.conditional_headers(cached)}
+
         try:
             response = self.session.request(
                 method=method,
@@ -79,8 +96,22 @@ class RESTClient:
                 auth=auth,
             )
 
+            if response.status_code == 304 and cached is not None:
+                logger.debug("{} not modified, reusing the stored body", url)
+                return RESTResponse.from_content(
+                    cached.status, cached.headers, cached.data
+                )
+
             rest_response = RESTResponse(response)
 
+            if cache and cache_key is not None:
+                cache.put(
+                    cache_key,
+                    response.status_code,
+                    rest_response.getheaders(),
+                    rest_response.data,
+                )
+
             if not 200 <= response.status_code <= 299:
                 raise ApiException(http_resp=rest_response)
 
@@ -89,6 +120,13 @@ class RESTClient:
         except requests.exceptions.RequestException as e:
             raise ApiException(status=0, reason=f"{type(e).__name__}: {str(e)}")
 
+    def _resource_path(self, url: str) -> str:
+        """Return the path of ``url`` relative to the configured host."""
+        host = self.configuration.host
+        if url.startswith(host):
+            return urlsplit(url[len(host) :]).path
+        return urlsplit(url).path
+
     @staticmethod
     def _get_timeout(
         timeout_value: Optional[Union[float, tuple]],
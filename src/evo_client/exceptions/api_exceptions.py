@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from ..core.response import RESTResponse
+from ..utils.rate_limit_utils import RateLimitInfo
 
 
 class ApiClientError(Exception):
@@ -30,14 +31,17 @@ class ApiException(Exception):
         status: Optional[int] = None,
         reason: Optional[str] = None,
         http_resp: Optional[RESTResponse] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         self.status = status
         self.reason = reason
         self.http_resp = http_resp
+        self.headers: Dict[str, str] = dict(headers or {})
 
         if http_resp:
             self.status = http_resp.status
             self.reason = http_resp.reason
+            self.headers = http_resp.getheaders()
             message_parts = [
                 f"({self.status})",
                 f"Reason: {self.reason}",
@@ -57,3 +61,8 @@ class ApiException(Exception):
             self.message = "Unknown API error"
 
         super().__init__(self.message)
+
+    @property
+    def rate_limit(self) -> RateLimitInfo:
+        """Structured rate-limit metadata (status, Retry-After, X-RateLimit-*)."""
+        return RateLimitInfo.from_headers(self.status, self.headers)
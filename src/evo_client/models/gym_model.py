@@ -1,12 +1,23 @@
 # /src/evo_client/models/gym_model.py
 
+from collections import Counter, defaultdict
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum, IntEnum
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from loguru import logger
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from .atividade_list_api_view_model import AtividadeListApiViewModel
 from .configuracao_api_view_model import ConfiguracaoApiViewModel
@@ -556,6 +567,18 @@ class MemberSegment(BaseModel):
     member_ids: List[int] = Field(default_factory=list)
 
 
+class SegmentThresholds(BaseModel):
+    """Thresholds classifying active members into segments.
+
+    Members without visits are inactive, members with fewer than
+    ``min_regular_visits`` visits are at risk, and the rest are premium when
+    their revenue exceeds ``premium_min_revenue`` and regular otherwise.
+    """
+
+    min_regular_visits: int = Field(default=4)
+    premium_min_revenue: Decimal = Field(default=Decimal("1000"))
+
+
 class GymOperatingData(BaseModel):
     """Enhanced operational data metrics for a gym branch."""
 
@@ -602,6 +625,7 @@ class GymOperatingData(BaseModel):
     retention_rate: Decimal = Field(default=Decimal("0.00"))
     membership_growth_rate: Decimal = Field(default=Decimal("0.00"))
     member_segments: Dict[str, MemberSegment] = Field(default_factory=dict)
+    segment_thresholds: SegmentThresholds = Field(default_factory=SegmentThresholds)
 
     # Multi-Unit Metrics
     cross_branch_revenue: Decimal = Field(
@@ -654,8 +678,13 @@ class GymOperatingData(BaseModel):
         return result
 
     def _segment_members(self) -> None:
-        """Segment members based on behavior and value."""
+        """Segment members based on behavior and value.
+
+        Visits and revenue are indexed by member in one pass over the entries
+        and receivables, so each member is classified in constant time.
+        """
         self.logger.debug("Segmenting members")
+        thresholds = self.segment_thresholds
 
         segments = {
             "premium": MemberSegment(segment_name="Premium"),
@@ -664,36 +693,41 @@ class GymOperatingData(BaseModel):
             "inactive": MemberSegment(segment_name="Inactive"),
         }
 
+        visits_by_member = Counter(e.member_id for e in self.recent_entries)
+        revenue_by_member: Dict[Optional[int], Decimal] = defaultdict(Decimal)
+        for r in self.receivables:
+            revenue_by_member[r.member_id] += r.amount
+
+        segment_revenue = {key: Decimal("0.00") for key in segments}
         for member in self.active_members:
-            member_id = member.get("id")
+            # Members dumped from the API carry their ID as ``id_member``
+            member_id = member.get("id") or member.get("id_member")
             if not member_id:
                 continue
 
             # Calculate member metrics
-            visit_count = len(
-                [e for e in self.recent_entries if e.member_id == member_id]
-            )
-            revenue = sum(
-                r.amount for r in self.receivables if r.member_id == member_id
-            )
+            visit_count = visits_by_member.get(member_id, 0)
+            revenue = revenue_by_member.get(member_id, Decimal("0.00"))
 
             # Determine segment
             if visit_count == 0:
-                segment = segments["inactive"]
-            elif visit_count < 4:
-                segment = segments["at_risk"]
-            elif revenue > 1000:
-                segment = segments["premium"]
+                key = "inactive"
+            elif visit_count < thresholds.min_regular_visits:
+                key = "at_risk"
+            elif revenue > thresholds.premium_min_revenue:
+                key = "premium"
             else:
-                segment = segments["regular"]
+                key = "regular"
 
             # Update segment metrics
+            segment = segments[key]
             segment.member_count += 1
             segment.member_ids.append(member_id)
+            segment_revenue[key] += revenue
+
+        for key, segment in segments.items():
             if segment.member_count > 0:
-                segment.average_revenue = (
-                    segment.average_revenue * (segment.member_count - 1) + revenue
-                ) / segment.member_count
+                segment.average_revenue = segment_revenue[key] / segment.member_count
 
         self.member_segments = segments
 
@@ -1154,6 +1188,15 @@ class MemberProfile(BaseModel):
         )
 
 
+class _MemberContribution(NamedTuple):
+    """What one member added to the MembersFiles aggregates."""
+
+    active: bool
+    paid: Decimal
+    closed_months: Decimal
+    open_contract_starts: Tuple[datetime, ...]
+
+
 class MembersFiles(BaseModel):
     """Comprehensive data about a list of members.
 
@@ -1179,40 +1222,97 @@ class MembersFiles(BaseModel):
     total_revenue: Decimal = Field(default=Decimal("0.00"))
     average_lifetime: Decimal = Field(default=Decimal("0.00"))  # In months
 
+    # Running aggregates kept in step with ``members``
+    _closed_months: Decimal = PrivateAttr(default=Decimal("0.00"))
+    # Each member's share as of when it was added, since profiles are mutable
+    _contributions: Dict[int, _MemberContribution] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the aggregates of the members passed at construction."""
+        if not self.members:
+            return
+        self.total_members = 0
+        self.active_members = 0
+        self.total_revenue = Decimal("0.00")
+        for member_id, profile in self.members.items():
+            self._add_contribution(member_id, self._contribution(profile))
+        self.finalize()
+
     def add_member(self, profile: MemberProfile) -> None:
-        """Add a member profile to the collection."""
+        """Add a member profile to the collection.
+
+        Counts and revenue are updated in constant time. The average lifetime
+        depends on the current time, so it is only updated by :meth:`finalize`.
+        """
+        previous = self._contributions.pop(profile.member_id, None)
+        if previous is not None:
+            self._apply_contribution(previous, sign=-1)
         self.members[profile.member_id] = profile
-        self._update_metrics()
-
-    def _update_metrics(self) -> None:
-        """Update aggregated metrics based on member data."""
-        self.total_members = len(self.members)
-        self.active_members = sum(1 for m in self.members.values() if m.is_active)
-
-        # Calculate total revenue using Decimal
-        total = Decimal("0.00")
-        for member in self.members.values():
-            total += member.total_paid
-        self.total_revenue = total
-
-        # Calculate average lifetime
-        total_months = Decimal("0.00")
-        for member in self.members.values():
-            if member.contracts_history:
-                # Sum up months from all contracts
-                for contract in member.contracts_history:
-                    if contract.start_date:
-                        end_date = contract.end_date or datetime.now()
-                        months = (end_date - contract.start_date).days / Decimal(
-                            "30.44"
-                        )  # Average month length
-                        total_months += Decimal(str(months))
+        self._add_contribution(profile.member_id, self._contribution(profile))
+
+    def add_members(self, profiles: Iterable[MemberProfile]) -> None:
+        """Add many member profiles and compute every aggregated metric."""
+        for profile in profiles:
+            self.add_member(profile)
+        self.finalize()
+
+    def finalize(self, now: Optional[datetime] = None) -> None:
+        """Compute the time-dependent metrics once all members are added.
+
+        Args:
+            now: End date of contracts that are still open (defaults to now)
+        """
+        now = now or datetime.now()
+        total_months = self._closed_months
+        for contribution in self._contributions.values():
+            for start_date in contribution.open_contract_starts:
+                total_months += self._contract_months(start_date, now)
 
         if self.total_members > 0:
             self.average_lifetime = total_months / Decimal(str(self.total_members))
         else:
             self.average_lifetime = Decimal("0.00")
 
+    def _contribution(self, profile: MemberProfile) -> _MemberContribution:
+        """Snapshot what a profile adds to the aggregates."""
+        closed_months = Decimal("0.00")
+        open_contract_starts = []
+        for contract in profile.contracts_history:
+            if not contract.start_date:
+                continue
+            if contract.end_date:
+                closed_months += self._contract_months(
+                    contract.start_date, contract.end_date
+                )
+            else:
+                open_contract_starts.append(contract.start_date)
+        return _MemberContribution(
+            active=profile.is_active,
+            paid=profile.total_paid,
+            closed_months=closed_months,
+            open_contract_starts=tuple(open_contract_starts),
+        )
+
+    def _add_contribution(
+        self, member_id: int, contribution: _MemberContribution
+    ) -> None:
+        """Record a member's share and add it to the running aggregates."""
+        self._contributions[member_id] = contribution
+        self._apply_contribution(contribution, sign=1)
+
+    def _apply_contribution(self, contribution: _MemberContribution, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a member's share of the aggregates."""
+        self.total_members += sign
+        self.active_members += sign if contribution.active else 0
+        self.total_revenue += sign * contribution.paid
+        self._closed_months += sign * contribution.closed_months
+
+    @staticmethod
+    def _contract_months(start_date: datetime, end_date: datetime) -> Decimal:
+        """Length of a contract in average months."""
+        months = (end_date - start_date).days / Decimal("30.44")
+        return Decimal(str(months))
+
 
 # At the end, update forward references
 MembershipContract.model_rebuild()
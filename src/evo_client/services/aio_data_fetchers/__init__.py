@@ -0,0 +1,220 @@
+"""Async data fetchers mirroring :mod:`evo_client.services.data_fetchers`.
+
+The async fetchers use :class:`~evo_client.aio.core.api_client.AsyncApiClient`
+and fan out across branches concurrently, bounded by a semaphore owned by
+the client manager.
+"""
+
+import abc
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+from evo_client.aio.core.api_client import AsyncApiClient
+from evo_client.services.data_fetchers import MemberBranchRoutes
+from evo_client.utils.pagination_utils import DEFAULT_PACING_PROFILES, PacingProfile
+from evo_client.utils.rate_limit_utils import (
+    AsyncTokenBucketRateLimiter,
+    get_rate_limit_info,
+)
+
+T = TypeVar("T")
+
+
+class AsyncBranchApiClientManager:
+    """Manager for async branch API clients."""
+
+    def __init__(
+        self,
+        branch_api_clients: Dict[str, AsyncApiClient],
+        max_concurrent_branches: int = 5,
+    ):
+        """Initialize the client manager.
+
+        Args:
+            branch_api_clients: Dictionary mapping branch IDs to their async API clients.
+                              Only the provided branch clients will be used for fetching data.
+            max_concurrent_branches: Maximum number of branches queried at the same time
+        """
+        if max_concurrent_branches <= 0:
+            raise ValueError("max_concurrent_branches must be positive")
+
+        self.branch_api_clients = branch_api_clients or {}
+        # Store branch IDs as integers for easier access
+        self.branch_ids = (
+            [int(bid) for bid in self.branch_api_clients.keys()]
+            if branch_api_clients
+            else []
+        )
+        self.max_concurrent_branches = max_concurrent_branches
+        # Shared by every fetcher using this manager
+        self.member_routes = MemberBranchRoutes()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent branch requests on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_branches)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def close(self) -> None:
+        """Close every branch client session."""
+        for client in self.branch_api_clients.values():
+            await client.__aexit__(None, None, None)
+
+    async def __aenter__(self) -> "AsyncBranchApiClientManager":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+
+class AsyncBaseDataFetcher(abc.ABC):
+    """Base class for all async data fetchers."""
+
+    def __init__(
+        self,
+        client_manager: AsyncBranchApiClientManager,
+        pacing_profiles: Optional[Dict[str, PacingProfile]] = None,
+    ):
+        """Initialize the data fetcher.
+
+        Args:
+            client_manager: The client manager instance
+            pacing_profiles: Per-endpoint pacing overriding the defaults
+        """
+        self.client_manager = client_manager
+        self.pacing_profiles = {**DEFAULT_PACING_PROFILES, **(pacing_profiles or {})}
+
+    def get_branch_api(self, branch_id: int) -> Optional[AsyncApiClient]:
+        """Get a branch-specific API client.
+
+        Args:
+            branch_id: The branch ID
+
+        Returns:
+            Branch-specific API client or None if not found
+        """
+        return self.client_manager.branch_api_clients.get(str(branch_id))
+
+    def get_available_branch_ids(self) -> List[int]:
+        """Get list of branch IDs for which we have API clients.
+
+        Returns:
+            List of branch IDs
+        """
+        return self.client_manager.branch_ids
+
+    def get_pacing(self, endpoint: str) -> Dict[str, Any]:
+        """Get paginated-call keyword arguments for an endpoint's pacing profile.
+
+        Args:
+            endpoint: Endpoint name, e.g. "members" or "receivables"
+
+        Returns:
+            Keyword arguments for the paginated API call
+        """
+        return self.pacing_profiles.get(endpoint, PacingProfile()).as_kwargs()
+
+    def resolve_branch_ids(self, branch_ids: Optional[List[int]] = None) -> List[int]:
+        """Resolve an optional branch scope against the available branches.
+
+        Args:
+            branch_ids: Branch IDs to restrict the fetch to, or None for all branches
+
+        Returns:
+            Requested branch IDs that have an API client, in the requested order
+        """
+        available = self.get_available_branch_ids()
+        if branch_ids is None:
+            return list(available)
+        return [int(bid) for bid in branch_ids if int(bid) in available]
+
+    async def _call_throttled(
+        self, branch_id: int, api_func: Callable[..., Awaitable[T]], **kwargs: Any
+    ) -> T:
+        """Make a single call under the branch client's shared rate limit.
+
+        The paginated helpers throttle their own requests, but calls made
+        directly on an API class have to take a token themselves.
+        """
+        rate_limiter = getattr(self.get_branch_api(branch_id), "rate_limiter", None)
+        if not isinstance(rate_limiter, AsyncTokenBucketRateLimiter):
+            return await api_func(**kwargs)
+
+        await rate_limiter.acquire()
+        try:
+            result = await api_func(**kwargs)
+        except Exception as e:
+            info = get_rate_limit_info(e)
+            if info is not None and info.is_rate_limited:
+                rate_limiter.on_rate_limited(info)
+            raise
+        rate_limiter.on_success()
+        return result
+
+    async def gather_branches(
+        self,
+        fetch: Callable[[int, AsyncApiClient], Awaitable[T]],
+        branch_ids: Optional[List[int]] = None,
+        raise_on_error: bool = True,
+        context: str = "data",
+    ) -> List[Tuple[int, T]]:
+        """Run ``fetch`` for every branch concurrently.
+
+        Concurrency is bounded by the client manager semaphore, so several
+        fetchers sharing one manager never exceed ``max_concurrent_branches``
+        in-flight branch operations.
+
+        Args:
+            fetch: Coroutine function receiving the branch ID and its client
+            branch_ids: Branches to query (defaults to all available branches)
+            raise_on_error: Re-raise the first branch failure instead of skipping it
+            context: Description used when logging skipped branches
+
+        Returns:
+            List of (branch_id, result) tuples in branch order
+        """
+        if branch_ids is None:
+            branch_ids = self.get_available_branch_ids()
+
+        async def run(branch_id: int, client: AsyncApiClient) -> T:
+            async with self.client_manager.semaphore:
+                return await fetch(branch_id, client)
+
+        scheduled: List[Tuple[int, Awaitable[T]]] = []
+        for branch_id in branch_ids:
+            client = self.get_branch_api(branch_id)
+            if client is None:
+                continue
+            scheduled.append((branch_id, run(branch_id, client)))
+
+        outcomes = await asyncio.gather(
+            *(coro for _, coro in scheduled), return_exceptions=True
+        )
+
+        results: List[Tuple[int, T]] = []
+        for (branch_id, _), outcome in zip(scheduled, outcomes):
+            if isinstance(outcome, BaseException):
+                if raise_on_error:
+                    raise outcome
+                logger.warning(
+                    f"Failed to fetch {context} for branch {branch_id}: {outcome}"
+                )
+                continue
+            results.append((branch_id, outcome))
+
+        return results
+
+
+__all__ = [
+    "AsyncBaseDataFetcher",
+    "AsyncBranchApiClientManager",
+]
@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from ...aio.api.activities_api import AsyncActivitiesApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.atividade_list_api_view_model import AtividadeListApiViewModel
+from ...models.atividade_sessao_participante_api_view_model import (
+    AtividadeSessaoParticipanteApiViewModel,
+)
+from ...utils.async_pagination_utils import async_paginated_api_call
+from . import AsyncBaseDataFetcher
+
+
+class AsyncActivityDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing activity-related data asynchronously."""
+
+    async def fetch_activities_with_schedule(
+        self,
+        # Activity filters
+        search: Optional[str] = None,
+        # Schedule filters
+        activity_date: Optional[datetime] = None,
+        id_member: Optional[int] = None,
+    ) -> Dict[str, List]:
+        """Fetch activities and their schedules from all branches concurrently.
+
+        Args:
+            search: Filter activities by name, group name or tags
+            activity_date: Filter schedule by activity date
+            id_member: Filter schedule by member ID
+
+        Returns:
+            Dict containing:
+                'activities': List[AtividadeListApiViewModel] - List of activities
+                'schedules': List[AtividadeSessaoParticipanteApiViewModel] - List of scheduled activities
+        """
+
+        async def fetch_branch(
+            branch_id: int, client: AsyncApiClient
+        ) -> Tuple[List, List]:
+            branch_api = AsyncActivitiesApi(api_client=client)
+            activities = await async_paginated_api_call(
+                api_func=branch_api.get_activities,
+                **self.get_pacing("activities"),
+                branch_id=branch_id,
+                search=search,
+                supports_pagination=False,
+            )
+            schedules = await async_paginated_api_call(
+                api_func=branch_api.get_schedule,
+                **self.get_pacing("activities"),
+                branch_id=branch_id,
+                show_full_week=True,
+                date=activity_date,
+                member_id=id_member,
+                supports_pagination=False,
+            )
+            return activities or [], schedules or []
+
+        activities: List = []
+        schedules: List = []
+        for _, (branch_activities, branch_schedules) in await self.gather_branches(
+            fetch_branch
+        ):
+            activities.extend(branch_activities)
+            schedules.extend(branch_schedules)
+
+        # Convert raw data to dictionaries first, then to models
+        return {
+            "activities": [
+                AtividadeListApiViewModel(**activity.to_dict())
+                for activity in activities
+            ],
+            "schedules": [
+                AtividadeSessaoParticipanteApiViewModel(**schedule.to_dict())
+                for schedule in schedules
+            ],
+        }
@@ -0,0 +1,80 @@
+from typing import List
+
+from loguru import logger
+
+from ...aio.api.configuration_api import AsyncConfigurationApi
+from ...aio.core.api_client import AsyncApiClient
+from ...exceptions.api_exceptions import ApiException
+from ...models.configuracao_api_view_model import ConfiguracaoApiViewModel
+from . import AsyncBaseDataFetcher
+
+
+class AsyncConfigurationDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing branch configuration-related data asynchronously."""
+
+    async def fetch_branch_configurations(self) -> List[ConfiguracaoApiViewModel]:
+        """Fetch branch configurations from all branches concurrently.
+
+        Returns:
+            List[ConfiguracaoApiViewModel]: List of branch configurations
+        """
+        try:
+
+            async def fetch_branch(
+                branch_id: int, client: AsyncApiClient
+            ) -> List[ConfiguracaoApiViewModel]:
+                return await AsyncConfigurationApi(api_client=client).get_branch_config()
+
+            configs: List[ConfiguracaoApiViewModel] = []
+            for _, branch_result in await self.gather_branches(
+                fetch_branch, raise_on_error=False, context="config"
+            ):
+                if branch_result:
+                    configs.extend(branch_result)
+
+            # Remove duplicates based on branch ID
+            seen_branches = set()
+            unique_configs = []
+            for config in configs:
+                if config.id_branch and config.id_branch not in seen_branches:
+                    seen_branches.add(config.id_branch)
+                    unique_configs.append(config)
+
+            return unique_configs
+
+        except Exception as e:
+            logger.error(f"Error fetching branch configurations: {str(e)}")
+            raise ValueError(f"Error fetching branch configurations: {str(e)}")
+
+    async def validate_and_cache_configurations(
+        self,
+    ) -> List[ConfiguracaoApiViewModel]:
+        """Validate credentials and cache branch configurations.
+
+        Returns:
+            List[ConfiguracaoApiViewModel]: List of validated branch configurations
+
+        Raises:
+            ValueError: If no valid configurations are found
+            ApiException: If authentication fails
+        """
+        try:
+            configs = await self.fetch_branch_configurations()
+
+            if not configs:
+                raise ValueError("No branch configurations found - check credentials")
+
+            branch_summary = [
+                f"{c.id_branch}:{c.name}" for c in configs if c.id_branch and c.name
+            ]
+            logger.info(
+                f"Validated configurations for {len(configs)} branches: "
+                f"{', '.join(branch_summary)}"
+            )
+
+            return configs
+
+        except ApiException as e:
+            if e.status == 401:
+                raise ValueError("Invalid credentials") from e
+            raise ValueError(f"Error validating and caching configurations: {str(e)}")
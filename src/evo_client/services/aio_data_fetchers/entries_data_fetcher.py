@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from loguru import logger
+
+from ...aio.api.entries_api import AsyncEntriesApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.entradas_resumo_api_view_model import EntradasResumoApiViewModel
+from ...models.gym_model import GymEntry
+from ...utils.async_pagination_utils import (
+    async_iter_items,
+    async_paginated_api_call,
+)
+from ...utils.checkpoint_utils import CheckpointStore
+from . import AsyncBaseDataFetcher
+
+
+class AsyncEntriesDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing entry-related data asynchronously."""
+
+    async def fetch_entries(
+        self,
+        register_date_start: Optional[datetime] = None,
+        register_date_end: Optional[datetime] = None,
+        id_entry: Optional[int] = None,
+        id_member: Optional[int] = None,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[GymEntry]:
+        """Fetch entries with various filters from all branches concurrently.
+
+        Args:
+            register_date_start: Filter by registration start date (YYYY-MM-DDTHH:mm:ssZ)
+            register_date_end: Filter by registration end date (YYYY-MM-DDTHH:mm:ssZ)
+            id_entry: Filter by entry ID
+            id_member: Filter by member ID
+            branch_ids: Restrict the fetch to these branches (defaults to all)
+
+        Returns:
+            List[GymEntry]: List of entries matching the filters
+        """
+        try:
+
+            async def fetch_branch(
+                branch_id: int, client: AsyncApiClient
+            ) -> List[EntradasResumoApiViewModel]:
+                branch_api = AsyncEntriesApi(api_client=client)
+                return await async_paginated_api_call(
+                    api_func=branch_api.get_entries,
+                    **self.get_pacing("entries"),
+                    branch_id_logging=str(branch_id),
+                    register_date_start=register_date_start,
+                    register_date_end=register_date_end,
+                    entry_id=id_entry,
+                    member_id=id_member,
+                )
+
+            entries: List[EntradasResumoApiViewModel] = []
+            for _, branch_result in await self.gather_branches(
+                fetch_branch,
+                branch_ids=self.resolve_branch_ids(branch_ids),
+                raise_on_error=False,
+                context="entries",
+            ):
+                if branch_result:
+                    entries.extend(branch_result)
+
+            return [GymEntry.model_validate(entry) for entry in entries]
+
+        except Exception as e:
+            logger.error(f"Error fetching entries: {str(e)}")
+            raise ValueError(f"Error fetching entries: {str(e)}")
+
+    async def iter_entries(
+        self,
+        register_date_start: Optional[datetime] = None,
+        register_date_end: Optional[datetime] = None,
+        id_entry: Optional[int] = None,
+        id_member: Optional[int] = None,
+        branch_ids: Optional[List[int]] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> AsyncIterator[GymEntry]:
+        """Stream entries branch by branch, page by page.
+
+        Takes the same filters as :meth:`fetch_entries`. A branch that fails
+        is logged and skipped, as in :meth:`fetch_entries`. With a
+        ``checkpoint_store`` each branch resumes from its last completed page.
+
+        Yields:
+            GymEntry: Entries matching the filters
+        """
+        for branch_id in self.resolve_branch_ids(branch_ids):
+            branch_api = AsyncEntriesApi(api_client=self.get_branch_api(branch_id))
+            try:
+                async for entry in async_iter_items(
+                    api_func=branch_api.get_entries,
+                    **self.get_pacing("entries"),
+                    branch_id_logging=str(branch_id),
+                    checkpoint_store=checkpoint_store,
+                    register_date_start=register_date_start,
+                    register_date_end=register_date_end,
+                    entry_id=id_entry,
+                    member_id=id_member,
+                ):
+                    yield GymEntry.model_validate(entry)
+            except Exception as e:
+                logger.warning(f"Failed to fetch entries for branch {branch_id}: {e}")
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from ...models.gym_model import GymOperatingData
+from ...services.operating_data.operating_data_computer import OperatingDataComputer
+from . import AsyncBaseDataFetcher
+from .entries_data_fetcher import AsyncEntriesDataFetcher
+from .member_data_fetcher import AsyncMemberDataFetcher
+from .membership_data_fetcher import AsyncMembershipDataFetcher
+from .prospects_data_fetcher import AsyncProspectsDataFetcher
+from .receivables_data_fetcher import AsyncReceivablesDataFetcher
+
+
+class AsyncGymMetricsDataFetcher(AsyncBaseDataFetcher):
+    """
+    Provides advanced KPI computations like churn, MRR, LTV, GRR, NRR.
+    Current and previous period datasets are fetched concurrently and the
+    metrics computed using OperatingDataComputer.
+    """
+
+    def __init__(self, client_manager):
+        super().__init__(client_manager)
+        self.member_fetcher = AsyncMemberDataFetcher(client_manager)
+        self.membership_fetcher = AsyncMembershipDataFetcher(client_manager)
+        self.prospects_fetcher = AsyncProspectsDataFetcher(client_manager)
+        self.receivables_fetcher = AsyncReceivablesDataFetcher(client_manager)
+        self.entries_fetcher = AsyncEntriesDataFetcher(client_manager)
+        self.computer = OperatingDataComputer()
+
+    async def _fetch_period(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        branch_ids: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch every dataset needed for one period concurrently."""
+        (
+            active_members,
+            non_renewed,
+            prospects,
+            receivables,
+            entries,
+            active_contracts,
+        ) = await asyncio.gather(
+            self.member_fetcher.fetch_members(
+                membership_start_date_start=from_date,
+                membership_start_date_end=to_date,
+                status=1,
+                branch_ids=branch_ids,
+            ),
+            self.member_fetcher.fetch_members(
+                membership_cancel_date_start=from_date,
+                membership_cancel_date_end=to_date,
+                status=2,
+                branch_ids=branch_ids,
+            ),
+            self.prospects_fetcher.fetch_prospects(
+                register_date_start=from_date,
+                register_date_end=to_date,
+                branch_ids=branch_ids,
+            ),
+            self.receivables_fetcher.fetch_receivables(
+                due_date_start=from_date,
+                due_date_end=to_date,
+                branch_ids=branch_ids,
+            ),
+            self.entries_fetcher.fetch_entries(
+                register_date_start=from_date,
+                register_date_end=to_date,
+                branch_ids=branch_ids,
+            ),
+            self.membership_fetcher.fetch_memberships(
+                active=True, branch_ids=branch_ids
+            ),
+        )
+        return {
+            "active_members": active_members,
+            "non_renewed": non_renewed,
+            "prospects": prospects,
+            "receivables": receivables,
+            "entries": entries,
+            "active_contracts": active_contracts,
+        }
+
+    async def fetch_advanced_metrics(
+        self,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        branch_ids: Optional[List[int]] = None,
+    ) -> GymOperatingData:
+        """
+        Fetch advanced metrics by comparing current and previous month's data.
+        If no previous month data is available, we default GRR and NRR to 100%.
+
+        Returns:
+            GymOperatingData with advanced metrics filled in.
+        """
+        if not from_date or not to_date:
+            to_date = datetime.now()
+            from_date = to_date - timedelta(days=30)
+
+        # Previous month:
+        prev_to_date = from_date
+        prev_from_date = prev_to_date - timedelta(days=30)
+
+        current, previous = await asyncio.gather(
+            self._fetch_period(from_date, to_date, branch_ids),
+            self._fetch_period(prev_from_date, prev_to_date, branch_ids),
+        )
+
+        previous_data = self.computer.compute_metrics(
+            **previous,
+            from_date=prev_from_date,
+            to_date=prev_to_date,
+            previous_data=None,  # no data before previous
+        )
+
+        return self.computer.compute_metrics(
+            **current,
+            from_date=from_date,
+            to_date=to_date,
+            previous_data=previous_data,
+        )
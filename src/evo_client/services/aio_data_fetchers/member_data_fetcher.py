@@ -0,0 +1,184 @@
+import asyncio
+from datetime import datetime
+from typing import List, Optional
+
+from loguru import logger
+
+from ...aio.api.members_api import AsyncMembersApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.cliente_detalhes_basicos_api_view_model import (
+    ClienteDetalhesBasicosApiViewModel,
+)
+from ...models.members_api_view_model import MembersApiViewModel
+from ...utils.async_pagination_utils import async_paginated_api_call
+from . import AsyncBaseDataFetcher
+
+
+class AsyncMemberDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing member-related data asynchronously."""
+
+    async def fetch_member_by_id(
+        self, member_id: str, branch_id: Optional[int] = None
+    ) -> Optional[ClienteDetalhesBasicosApiViewModel]:
+        """Fetch a specific member by their ID.
+
+        The preferred branch is queried first; on a miss every other branch is
+        probed concurrently and the first profile found is returned.
+
+        Args:
+            member_id: The ID of the member to fetch
+            branch_id: Optional branch to query first
+
+        Returns:
+            Optional[ClienteDetalhesBasicosApiViewModel]: The member data if found, None otherwise
+        """
+        try:
+            branch_ids = self.get_available_branch_ids()
+            if branch_id and branch_id in branch_ids:
+                branch_api = AsyncMembersApi(api_client=self.get_branch_api(branch_id))
+                try:
+                    result = await self._call_throttled(
+                        branch_id,
+                        branch_api.get_member_profile,
+                        id_member=int(member_id),
+                    )
+                    if result:
+                        return result
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to fetch member {member_id} from branch {branch_id}: {e}"
+                    )
+
+            async def probe(
+                probe_branch_id: int, client: AsyncApiClient
+            ) -> Optional[ClienteDetalhesBasicosApiViewModel]:
+                try:
+                    return await self._call_throttled(
+                        probe_branch_id,
+                        AsyncMembersApi(api_client=client).get_member_profile,
+                        id_member=int(member_id),
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to fetch member {member_id} from branch {probe_branch_id}: {e}"
+                    )
+                    return None
+
+            async def bounded_probe(
+                probe_branch_id: int, client: AsyncApiClient
+            ) -> Optional[ClienteDetalhesBasicosApiViewModel]:
+                async with self.client_manager.semaphore:
+                    return await probe(probe_branch_id, client)
+
+            tasks = []
+            for probe_branch_id in branch_ids:
+                client = self.get_branch_api(probe_branch_id)
+                if client is not None:
+                    tasks.append(
+                        asyncio.ensure_future(bounded_probe(probe_branch_id, client))
+                    )
+
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    result = await next_done
+                    if result:
+                        return result
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Error fetching member {member_id}: {str(e)}")
+            raise ValueError(f"Error fetching member {member_id}: {str(e)}")
+
+    async def fetch_members(
+        self,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+        document: Optional[str] = None,
+        phone: Optional[str] = None,
+        conversion_date_start: Optional[datetime] = None,
+        conversion_date_end: Optional[datetime] = None,
+        register_date_start: Optional[datetime] = None,
+        register_date_end: Optional[datetime] = None,
+        membership_start_date_start: Optional[datetime] = None,
+        membership_start_date_end: Optional[datetime] = None,
+        membership_cancel_date_start: Optional[datetime] = None,
+        membership_cancel_date_end: Optional[datetime] = None,
+        status: Optional[int] = None,
+        token_gympass: Optional[str] = None,
+        ids_members: Optional[str] = None,
+        only_personal: bool = False,
+        personal_type: Optional[int] = None,
+        show_activity_data: bool = False,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[MembersApiViewModel]:
+        """Fetch members with various filters from all branches concurrently.
+
+        Args:
+            name: Filter by member name
+            email: Filter by email
+            document: Filter by document number
+            phone: Filter by phone number
+            conversion_date_start: Filter by conversion start date
+            conversion_date_end: Filter by conversion end date
+            register_date_start: Filter by registration start date
+            register_date_end: Filter by registration end date
+            membership_start_date_start: Filter by membership start date
+            membership_start_date_end: Filter by membership end date
+            membership_cancel_date_start: Filter by cancellation start date
+            membership_cancel_date_end: Filter by cancellation end date
+            status: Filter by member status
+            token_gympass: Filter by Gympass token
+            ids_members: Comma-separated list of member IDs
+            only_personal: Filter for personal training members only
+            personal_type: Filter by personal training type
+            show_activity_data: Include activity data in response
+            branch_ids: Restrict the fetch to these branches (defaults to all)
+
+        Returns:
+            List[MembersApiViewModel]: List of members matching the filters
+        """
+        try:
+
+            async def fetch_branch(
+                branch_id: int, client: AsyncApiClient
+            ) -> List[MembersApiViewModel]:
+                branch_api = AsyncMembersApi(api_client=client)
+                return await async_paginated_api_call(
+                    api_func=branch_api.get_members,
+                    **self.get_pacing("members"),
+                    branch_id_logging=str(branch_id),
+                    name=name,
+                    email=email,
+                    document=document,
+                    phone=phone,
+                    conversion_date_start=conversion_date_start,
+                    conversion_date_end=conversion_date_end,
+                    register_date_start=register_date_start,
+                    register_date_end=register_date_end,
+                    membership_start_date_start=membership_start_date_start,
+                    membership_start_date_end=membership_start_date_end,
+                    membership_cancel_date_start=membership_cancel_date_start,
+                    membership_cancel_date_end=membership_cancel_date_end,
+                    status=status,
+                    token_gympass=token_gympass,
+                    ids_members=ids_members,
+                    only_personal=only_personal,
+                    personal_type=personal_type,
+                    show_activity_data=show_activity_data,
+                )
+
+            members: List[MembersApiViewModel] = []
+            for _, branch_members in await self.gather_branches(
+                fetch_branch, branch_ids=self.resolve_branch_ids(branch_ids)
+            ):
+                members.extend(branch_members)
+
+            return members
+
+        except Exception as e:
+            logger.error(f"Error fetching members: {str(e)}")
+            raise ValueError(f"Error fetching members: {str(e)}")
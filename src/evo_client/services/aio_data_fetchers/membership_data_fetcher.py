@@ -0,0 +1,107 @@
+from typing import Any, List, Optional
+
+from loguru import logger
+
+from ...aio.api.membership_api import AsyncMembershipApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.contratos_resumo_api_view_model import (
+    ContratosResumoApiViewModel,
+    ContratosResumoContainerViewModel,
+)
+from ...models.w12_utils_category_membership_view_model import (
+    W12UtilsCategoryMembershipViewModel,
+)
+from ...utils.async_pagination_utils import async_paginated_api_call
+from . import AsyncBaseDataFetcher
+
+
+class AsyncMembershipDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing membership-related data asynchronously."""
+
+    async def fetch_memberships(
+        self,
+        membership_id: Optional[int] = None,
+        name: Optional[str] = None,
+        active: Optional[bool] = None,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[ContratosResumoApiViewModel]:
+        """Fetch membership plans with optional filtering from all branches concurrently.
+
+        Args:
+            membership_id: Filter by membership ID
+            name: Filter by membership name
+            active: Filter by active status
+            branch_ids: Restrict the fetch to these branches (defaults to all)
+
+        Returns:
+            List[ContratosResumoApiViewModel]: List of membership plans matching the filters
+        """
+        try:
+
+            async def fetch_branch(branch_id: int, client: AsyncApiClient) -> List[Any]:
+                branch_api = AsyncMembershipApi(api_client=client)
+                return await async_paginated_api_call(
+                    branch_api.get_memberships,
+                    **self.get_pacing("memberships"),
+                    membership_id=membership_id,
+                    name=name,
+                    active=active,
+                    branch_id=branch_id,
+                    branch_id_logging=str(branch_id),
+                    pagination_type="skip_take",
+                )
+
+            memberships: List[ContratosResumoApiViewModel] = []
+            for _, result in await self.gather_branches(
+                fetch_branch, branch_ids=self.resolve_branch_ids(branch_ids)
+            ):
+                for membership in result or []:
+                    # The async API returns the v2 container rather than a list
+                    if isinstance(membership, ContratosResumoContainerViewModel):
+                        memberships.extend(membership.list or [])
+                    else:
+                        memberships.append(
+                            ContratosResumoApiViewModel.model_validate(membership)
+                        )
+
+            return memberships
+
+        except Exception as e:
+            logger.error(f"Error fetching memberships: {str(e)}")
+            raise ValueError(f"Error fetching memberships: {str(e)}")
+
+    async def fetch_membership_categories(
+        self,
+    ) -> List[W12UtilsCategoryMembershipViewModel]:
+        """Fetch membership categories.
+
+        Returns:
+            List[W12UtilsCategoryMembershipViewModel]: List of membership categories
+        """
+        try:
+
+            async def fetch_branch(
+                branch_id: int, client: AsyncApiClient
+            ) -> List[W12UtilsCategoryMembershipViewModel]:
+                return await AsyncMembershipApi(api_client=client).get_categories()
+
+            categories: List[W12UtilsCategoryMembershipViewModel] = []
+            for _, branch_result in await self.gather_branches(
+                fetch_branch, raise_on_error=False, context="categories"
+            ):
+                if branch_result:
+                    categories.extend(branch_result)
+
+            # Remove duplicates (if any)
+            seen_categories = set()
+            unique_categories = []
+            for category in categories:
+                if category.id_category_membership not in seen_categories:
+                    seen_categories.add(category.id_category_membership)
+                    unique_categories.append(category)
+
+            return unique_categories
+
+        except Exception as e:
+            logger.error(f"Error fetching membership categories: {str(e)}")
+            raise ValueError(f"Error fetching membership categories: {str(e)}")
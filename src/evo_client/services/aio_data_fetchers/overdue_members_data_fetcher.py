@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...aio.api.receivables_api import AsyncReceivablesApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.gym_model import OverdueMember
+from . import AsyncBaseDataFetcher
+
+
+class AsyncOverdueMembersDataFetcher(AsyncBaseDataFetcher):
+    """
+    Fetch a list of overdue members to run reactivation campaigns asynchronously.
+    Overdue = receivables with status overdue.
+    """
+
+    async def fetch_overdue_members(
+        self,
+        due_date_end: Optional[datetime] = None,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[OverdueMember]:
+        """
+        Fetch overdue members by analyzing receivables past due_date without payment.
+        Args:
+            due_date_end: optional end date for due
+            branch_ids: optional list of branches
+        """
+
+        async def fetch_branch(
+            branch_id: int, client: AsyncApiClient
+        ) -> List[OverdueMember]:
+            receivables = await AsyncReceivablesApi(client).get_receivables(
+                due_date_end=due_date_end, account_status="overdue"
+            )
+            members_seen: Dict[int, Dict[str, Any]] = {}
+            for rv in receivables:
+                if rv.id_member_payer and rv.id_member_payer > 0:
+                    key = rv.id_member_payer
+                    members_seen.setdefault(
+                        key,
+                        {
+                            "member_id": rv.id_member_payer,
+                            "name": rv.payer_name or "",
+                            "total_overdue": 0,
+                            "overdue_since": rv.due_date,
+                            "overdue_receivables": [],
+                        },
+                    )
+                    entry = members_seen[key]
+                    entry["total_overdue"] += rv.ammount or 0
+                    if (entry["overdue_since"] is None) or (
+                        rv.due_date and rv.due_date < entry["overdue_since"]
+                    ):
+                        entry["overdue_since"] = rv.due_date
+                    entry["overdue_receivables"].append(rv)
+
+            return [
+                OverdueMember(
+                    id=data["member_id"],
+                    member_id=data["member_id"],
+                    name=data["name"],
+                    total_overdue=data["total_overdue"],
+                    overdue_since=data["overdue_since"] or datetime.now(),
+                    overdue_receivables=data["overdue_receivables"],
+                )
+                for data in members_seen.values()
+            ]
+
+        overdue_list: List[OverdueMember] = []
+        for _, branch_overdue in await self.gather_branches(
+            fetch_branch,
+            branch_ids=branch_ids,
+            raise_on_error=False,
+            context="overdue members",
+        ):
+            overdue_list.extend(branch_overdue)
+        return overdue_list
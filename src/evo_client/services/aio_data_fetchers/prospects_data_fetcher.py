@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import List, Optional
+
+from loguru import logger
+
+from ...aio.api.prospects_api import AsyncProspectsApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.prospects_resumo_api_view_model import ProspectsResumoApiViewModel
+from ...utils.async_pagination_utils import async_paginated_api_call
+from . import AsyncBaseDataFetcher
+
+
+class AsyncProspectsDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing prospect-related data asynchronously."""
+
+    async def fetch_prospects(
+        self,
+        id_prospect: Optional[int] = None,
+        name: Optional[str] = None,
+        document: Optional[str] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        register_date_start: Optional[datetime] = None,
+        register_date_end: Optional[datetime] = None,
+        conversion_date_start: Optional[datetime] = None,
+        conversion_date_end: Optional[datetime] = None,
+        gympass_id: Optional[str] = None,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[ProspectsResumoApiViewModel]:
+        """Fetch prospects with various filters from all branches concurrently.
+
+        Args:
+            id_prospect: Filter by prospect ID
+            name: Filter by prospect name
+            document: Filter by document number
+            email: Filter by email address
+            phone: Filter by phone number
+            register_date_start: Filter by registration start date
+            register_date_end: Filter by registration end date
+            conversion_date_start: Filter by conversion start date
+            conversion_date_end: Filter by conversion end date
+            gympass_id: Filter by Gympass ID
+            branch_ids: Restrict the fetch to these branches (defaults to all)
+
+        Returns:
+            List[ProspectsResumoApiViewModel]: List of prospects matching the filters
+        """
+        try:
+
+            async def fetch_branch(
+                branch_id: int, client: AsyncApiClient
+            ) -> List[ProspectsResumoApiViewModel]:
+                branch_api = AsyncProspectsApi(api_client=client)
+                return await async_paginated_api_call(
+                    api_func=branch_api.get_prospects,
+                    **self.get_pacing("prospects"),
+                    branch_id_logging=str(branch_id),
+                    prospect_id=id_prospect,
+                    name=name,
+                    document=document,
+                    email=email,
+                    phone=phone,
+                    register_date_start=register_date_start,
+                    register_date_end=register_date_end,
+                    conversion_date_start=conversion_date_start,
+                    conversion_date_end=conversion_date_end,
+                    gympass_id=gympass_id,
+                )
+
+            result: List[ProspectsResumoApiViewModel] = []
+            for _, branch_prospects in await self.gather_branches(
+                fetch_branch, branch_ids=self.resolve_branch_ids(branch_ids)
+            ):
+                result.extend(branch_prospects)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error fetching prospects: {str(e)}")
+            raise ValueError(f"Error fetching prospects: {str(e)}")
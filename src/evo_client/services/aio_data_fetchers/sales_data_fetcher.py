@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import List, Optional
+
+from loguru import logger
+
+from ...aio.api.sales_api import AsyncSalesApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.sales_view_model import SalesViewModel
+from ...utils.async_pagination_utils import async_paginated_api_call
+from . import AsyncBaseDataFetcher
+
+
+class AsyncSalesDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing sales-related data asynchronously."""
+
+    async def fetch_sales(
+        self,
+        member_id: Optional[int] = None,
+        date_sale_start: Optional[datetime] = None,
+        date_sale_end: Optional[datetime] = None,
+        removal_date_start: Optional[datetime] = None,
+        removal_date_end: Optional[datetime] = None,
+        receivables_registration_date_start: Optional[datetime] = None,
+        receivables_registration_date_end: Optional[datetime] = None,
+        show_receivables: Optional[bool] = None,
+        only_membership: Optional[bool] = None,
+        at_least_monthly: Optional[bool] = None,
+        fl_swimming: Optional[bool] = None,
+        show_only_active_memberships: Optional[bool] = None,
+        show_allow_locker: Optional[bool] = None,
+        only_total_pass: Optional[bool] = None,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[SalesViewModel]:
+        """Fetch sales with various filters from all branches concurrently.
+
+        Args:
+            member_id: Filter by member ID
+            date_sale_start: Filter by sale start date
+            date_sale_end: Filter by sale end date
+            removal_date_start: Filter by removal start date
+            removal_date_end: Filter by removal end date
+            receivables_registration_date_start: Filter by receivables registration start date
+            receivables_registration_date_end: Filter by receivables registration end date
+            show_receivables: Include receivables in response
+            only_membership: Filter for membership sales only
+            at_least_monthly: Filter for monthly or longer memberships
+            fl_swimming: Filter for swimming-related sales
+            show_only_active_memberships: Filter for active memberships only
+            show_allow_locker: Filter for sales with locker access
+            only_total_pass: Filter for total pass sales only
+            branch_ids: Restrict the fetch to these branches (defaults to all)
+
+        Returns:
+            List[SalesViewModel]: List of sales matching the filters
+        """
+        try:
+
+            async def fetch_branch(
+                branch_id: int, client: AsyncApiClient
+            ) -> List[SalesViewModel]:
+                branch_api = AsyncSalesApi(api_client=client)
+                return await async_paginated_api_call(
+                    api_func=branch_api.get_sales,
+                    **self.get_pacing("sales"),
+                    branch_id_logging=str(branch_id),
+                    member_id=member_id,
+                    date_sale_start=date_sale_start,
+                    date_sale_end=date_sale_end,
+                    removal_date_start=removal_date_start,
+                    removal_date_end=removal_date_end,
+                    receivables_registration_date_start=receivables_registration_date_start,
+                    receivables_registration_date_end=receivables_registration_date_end,
+                    show_receivables=show_receivables,
+                    only_membership=only_membership,
+                    at_least_monthly=at_least_monthly,
+                    fl_swimming=fl_swimming,
+                    show_only_active_memberships=show_only_active_memberships,
+                    show_allow_locker=show_allow_locker,
+                    only_total_pass=only_total_pass,
+                )
+
+            result: List[SalesViewModel] = []
+            for _, branch_sales in await self.gather_branches(
+                fetch_branch, branch_ids=self.resolve_branch_ids(branch_ids)
+            ):
+                result.extend(branch_sales)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error fetching sales: {str(e)}")
+            raise ValueError(f"Error fetching sales: {str(e)}")
@@ -0,0 +1,49 @@
+from typing import List, Optional
+
+from loguru import logger
+
+from ...aio.api.service_api import AsyncServiceApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.servicos_resumo_api_view_model import ServicosResumoApiViewModel
+from ...utils.async_pagination_utils import async_paginated_api_call
+from . import AsyncBaseDataFetcher
+
+
+class AsyncServiceDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing service-related data asynchronously."""
+
+    async def fetch_services(
+        self,
+        id_service: Optional[int] = None,
+        name: Optional[str] = None,
+        active: Optional[bool] = None,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[ServicosResumoApiViewModel]:
+        """Fetch services with various filters from all branches concurrently."""
+        try:
+
+            async def fetch_branch(
+                branch_id: int, client: AsyncApiClient
+            ) -> List[ServicosResumoApiViewModel]:
+                branch_api = AsyncServiceApi(api_client=client)
+                return await async_paginated_api_call(
+                    branch_api.get_services,
+                    **self.get_pacing("services"),
+                    service_id=id_service,
+                    name=name,
+                    active=active,
+                    branch_id=branch_id,
+                    branch_id_logging=str(branch_id),
+                )
+
+            services: List[ServicosResumoApiViewModel] = []
+            for _, branch_services in await self.gather_branches(
+                fetch_branch, branch_ids=self.resolve_branch_ids(branch_ids)
+            ):
+                services.extend(branch_services)
+
+            return services
+
+        except Exception as e:
+            logger.error(f"Error fetching services: {str(e)}")
+            raise ValueError(f"Error fetching services: {str(e)}")
@@ -0,0 +1,132 @@
+from typing import List, Optional
+
+from loguru import logger
+
+from ...aio.api.webhook_api import AsyncWebhookApi
+from ...aio.core.api_client import AsyncApiClient
+from ...models.w12_utils_webhook_filter_view_model import W12UtilsWebhookFilterViewModel
+from ...models.w12_utils_webhook_header_view_model import W12UtilsWebhookHeaderViewModel
+from ...models.webhook_model import Webhook, WebhookEventType
+from . import AsyncBaseDataFetcher
+
+
+class AsyncWebhookDataFetcher(AsyncBaseDataFetcher):
+    """Handles fetching and processing webhook-related data asynchronously."""
+
+    async def fetch_webhooks(self) -> List[Webhook]:
+        """Fetch all webhooks from all branches concurrently.
+
+        Returns:
+            List[Webhook]: List of webhook configurations
+        """
+
+        async def fetch_branch(branch_id: int, client: AsyncApiClient) -> List:
+            return await AsyncWebhookApi(api_client=client).get_webhooks()
+
+        result = []
+        for _, webhooks in await self.gather_branches(
+            fetch_branch, raise_on_error=False, context="webhooks"
+        ):
+            if webhooks:
+                result.extend([Webhook.model_validate(webhook) for webhook in webhooks])
+
+        return result
+
+    async def create_webhook(
+        self,
+        url_callback: str,
+        event_type: WebhookEventType,
+        branch_id: Optional[int] = None,
+        headers: Optional[List[W12UtilsWebhookHeaderViewModel]] = None,
+        filters: Optional[List[W12UtilsWebhookFilterViewModel]] = None,
+    ) -> bool:
+        """Create a new webhook configuration.
+
+        Branches are tried one at a time and creation stops at the first
+        success, so a webhook is never registered twice.
+
+        Args:
+            url_callback: The webhook callback URL
+            event_type: Type of events to subscribe to
+            branch_id: Optional branch ID for the webhook
+            headers: Optional list of webhook headers
+            filters: Optional list of webhook filters
+
+        Returns:
+            bool: True if webhook was created successfully
+        """
+        branch_ids = self.get_available_branch_ids()
+
+        # If branch_id is provided, only try that specific branch
+        if branch_id is not None:
+            if branch_id not in branch_ids:
+                return False
+            branch_ids = [branch_id]
+
+        for current_branch_id in branch_ids:
+            client = self.get_branch_api(current_branch_id)
+            if client is None:
+                continue
+            try:
+                success = await AsyncWebhookApi(api_client=client).create_webhook(
+                    event_type=event_type.value,
+                    url_callback=url_callback,
+                    branch_id=current_branch_id,
+                    headers=headers,
+                    filters=filters,
+                )
+                if success:
+                    return True
+            except Exception as e:
+                logger.warning(
+                    f"Failed to create webhook for branch {current_branch_id}: {e}"
+                )
+
+        return False
+
+    async def delete_webhook(
+        self, webhook_id: int, branch_id: Optional[int] = None
+    ) -> bool:
+        """Delete a webhook configuration.
+
+        Args:
+            webhook_id: ID of the webhook to delete
+            branch_id: Optional branch ID to delete from
+
+        Returns:
+            bool: True if webhook was deleted successfully
+        """
+        branch_ids = self.get_available_branch_ids()
+
+        # If branch_id is provided, only try that specific branch
+        if branch_id is not None:
+            if branch_id not in branch_ids:
+                return False
+            branch_ids = [branch_id]
+
+        # Convert webhook_id to int if it's an object with id_webhook property
+        webhook_id_value = (
+            int(webhook_id)
+            if isinstance(webhook_id, (int, str))
+            else getattr(webhook_id, "id_webhook", None)
+        )
+        if webhook_id_value is None:
+            logger.warning(f"Invalid webhook ID: {webhook_id}")
+            return False
+
+        for current_branch_id in branch_ids:
+            client = self.get_branch_api(current_branch_id)
+            if client is None:
+                continue
+            try:
+                success = await AsyncWebhookApi(api_client=client).delete_webhook(
+                    webhook_id=webhook_id_value
+                )
+                if success:
+                    return True
+            except Exception as e:
+                logger.warning(
+                    f"Failed to delete webhook {webhook_id} from branch {current_branch_id}: {e}"
+                )
+
+        return False
@@ -0,0 +1,19 @@
+"""Columnar export of paginated API entities to Arrow/Parquet."""
+
+from .columnar_export_service import ColumnarExportService
+from .parquet_sink import (
+    Column,
+    ParquetSink,
+    arrow_schema,
+    model_columns,
+    record_batch,
+)
+
+__all__ = [
+    "Column",
+    "ColumnarExportService",
+    "ParquetSink",
+    "arrow_schema",
+    "model_columns",
+    "record_batch",
+]
@@ -0,0 +1,324 @@
+"""Columnar Arrow/Parquet sink for paginated view model records.
+
+Pages are converted straight into Arrow record batches, column by column,
+using a schema derived from the entity's view model. Records may be
+validated models or the raw dicts of the ``"dict"`` record mode (see
+:mod:`evo_client.utils.record_utils`), which skips building models at all.
+Columns use the API's field names; nested objects and lists are stored as
+JSON text. pyarrow is an optional dependency, only needed to write.
+"""
+
+import json
+import os
+import tempfile
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from ..incremental_sync.sqlite_entity_store import ENTITY_TABLES
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+# Partition value of records without a partition date, as read by Hive-style
+# dataset readers
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# Date granularities of the date partition and the ISO prefix each keeps
+DATE_GRANULARITIES = {"day": 10, "month": 7}
+
+# Parses ISO timestamps as the view models do, including a trailing "Z"
+_DATETIME = TypeAdapter(datetime)
+
+_SCALAR_KINDS = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    str: "string",
+    datetime: "timestamp",
+    date: "date",
+}
+
+
+@dataclass(frozen=True)
+class Column:
+    """A model field and how it is stored as a column."""
+
+    name: str
+    alias: str
+    kind: str
+
+
+def require_pyarrow() -> None:
+    """Raise ImportError if pyarrow is not installed."""
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for columnar export; install it with "
+            "'pip install pyarrow'"
+        )
+
+
+def _field_kind(annotation: Any) -> str:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    return _SCALAR_KINDS.get(annotation, "json")
+
+
+@lru_cache(maxsize=64)
+def model_columns(model: Type[BaseModel]) -> Tuple[Column, ...]:
+    """Return the columns of a view model, named by the API's field names."""
+    return tuple(
+        Column(name=name, alias=field.alias or name, kind=_field_kind(field.annotation))
+        for name, field in model.model_fields.items()
+    )
+
+
+def _arrow_type(kind: str) -> Any:
+    return {
+        "bool": pa.bool_(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "timestamp": pa.timestamp("us"),
+        "date": pa.date32(),
+        "json": pa.string(),
+    }[kind]
+
+
+def arrow_schema(model: Type[BaseModel]) -> "pa.Schema":
+    """Return the Arrow schema of a view model's records."""
+    require_pyarrow()
+    return pa.schema(
+        [
+            pa.field(column.alias, _arrow_type(column.kind))
+            for column in model_columns(model)
+        ]
+    )
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _raw_value(record: Any, column: Column) -> Any:
+    if isinstance(record, dict):
+        return record.get(column.alias)
+    return getattr(record, column.name, None)
+
+
+def column_value(record: Any, column: Column) -> Any:
+    """Return a record's value of a column in its stored representation."""
+    value = _raw_value(record, column)
+    if value is None:
+        return None
+    if column.kind == "json":
+        return json.dumps(value, default=_json_default, ensure_ascii=False)
+    if isinstance(value, str):
+        if column.kind == "timestamp":
+            return _DATETIME.validate_python(value)
+        if column.kind == "date":
+            return date.fromisoformat(value[:10])
+    return value
+
+
+def partition_value(
+    record: Any, column: Optional[Column], granularity: str = "day"
+) -> str:
+    """Return the date partition of a record, e.g. ``"2024-05-01"``."""
+    value = _raw_value(record, column) if column is not None else None
+    if value is None:
+        return NULL_PARTITION
+    text = value if isinstance(value, str) else value.isoformat()
+    return text[: DATE_GRANULARITIES[granularity]]
+
+
+def record_batch(model: Type[BaseModel], records: List[Any]) -> "pa.RecordBatch":
+    """Convert records of a view model into one Arrow record batch.
+
+    Args:
+        model: View model describing the records' fields
+        records: Validated models, unvalidated models or API dicts
+
+    Returns:
+        A record batch with one column per model field
+    """
+    schema = arrow_schema(model)
+    arrays = [
+        pa.array(
+            [column_value(record, column) for record in records],
+            type=schema.field(column.alias).type,
+        )
+        for column in model_columns(model)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class ParquetSink:
+    """Writes the records of one entity and branch as partitioned Parquet.
+
+    Files are laid out Hive-style, so dataset readers recover the branch and
+    date as columns::
+
+        <directory>/<entity>/branch_id=<id>/date=<YYYY-MM-DD>/part-<run>-<n>.parquet
+
+    Records are converted to record batches as they are written and buffered
+    per date partition; a file is written for every partition once the
+    buffered batches reach ``rows_per_flush`` rows, and on close.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        entity: str,
+        branch_id: int,
+        partition_field: Optional[str] = None,
+        date_granularity: str = "day",
+        rows_per_flush: int = 250_000,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            directory: Root directory of the dataset
+            entity: Entity written ("members", "receivables", "entries" or "sales")
+            branch_id: Branch the records were fetched from
+            partition_field: Date field to partition by (defaults to the
+                entity's main date, e.g. a receivable's due date)
+            date_granularity: "day" or "month" date partitions
+            rows_per_flush: Buffered rows that trigger writing files
+        """
+        require_pyarrow()
+        if entity not in ENTITY_TABLES:
+            raise ValueError(
+                f"Unknown entity {entity!r}; expected one of "
+                f"{', '.join(sorted(ENTITY_TABLES))}"
+            )
+        if date_granularity not in DATE_GRANULARITIES:
+            raise ValueError(
+                f"Unknown date granularity {date_granularity!r}; expected one of "
+                f"{', '.join(DATE_GRANULARITIES)}"
+            )
+        table = ENTITY_TABLES[entity]
+        self.model = table.model
+        self.entity = entity
+        self.branch_id = branch_id
+        self.date_granularity = date_granularity
+        self.rows_per_flush = rows_per_flush
+        self.root = Path(directory) / entity / f"branch_id={branch_id}"
+
+        partition_field = partition_field or table.date_fields[0]
+        columns = {column.name: column for column in model_columns(self.model)}
+        if partition_field not in columns:
+            raise ValueError(f"{self.model.__name__} has no field {partition_field!r}")
+        self._partition_column = columns[partition_field]
+
+        self._run_id = uuid.uuid4().hex[:8]
+        self._files_written = 0
+        self._buffered: Dict[str, List["pa.RecordBatch"]] = defaultdict(list)
+        self._buffered_rows = 0
+        self.rows_written = 0
+
+    def write(self, records: Iterable[Any]) -> int:
+        """Convert a page of records to record batches and buffer them.
+
+        Args:
+            records: Models or API dicts of the sink's entity
+
+        Returns:
+            Number of records written
+        """
+        by_partition: Dict[str, List[Any]] = defaultdict(list)
+        for record in records:
+            by_partition[
+                partition_value(record, self._partition_column, self.date_granularity)
+            ].append(record)
+
+        written = 0
+        for partition, partition_records in by_partition.items():
+            self._buffered[partition].append(
+                record_batch(self.model, partition_records)
+            )
+            written += len(partition_records)
+        self._buffered_rows += written
+        self.rows_written += written
+
+        if self._buffered_rows >= self.rows_per_flush:
+            self.flush()
+        return written
+
+    def flush(self) -> List[Path]:
+        """Write every buffered partition to a new Parquet file.
+
+        Returns:
+            Paths of the files written
+        """
+        paths = []
+        for partition, batches in self._buffered.items():
+            paths.append(self._write_file(partition, batches))
+        self._buffered.clear()
+        self._buffered_rows = 0
+        return paths
+
+    def _write_file(self, partition: str, batches: List["pa.RecordBatch"]) -> Path:
+        directory = self.root / f"date={partition}"
+        directory.mkdir(parents=True, exist_ok=True)
+        self._files_written += 1
+        path = directory / f"part-{self._run_id}-{self._files_written:05d}.parquet"
+
+        # Write a hidden file next to the target and rename it, so dataset
+        # readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".part-", suffix=".tmp")
+        os.close(fd)
+        try:
+            pq.write_table(pa.Table.from_batches(batches), tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def close(self) -> None:
+        """Write the remaining buffered records."""
+        self.flush()
+
+    def discard(self) -> None:
+        """Drop the buffered records without writing them."""
+        self._buffered.clear()
+        self._buffered_rows = 0
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # A failed export keeps the files already flushed but not the rest
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
@@ -1,9 +1,37 @@
 """Data fetchers for retrieving data from various API endpoints."""
 
 import abc
-from typing import Dict, List, Optional
+from threading import Lock as ThreadLock
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from evo_client.sync.core.api_client import SyncApiClient
+from evo_client.utils.pagination_utils import DEFAULT_PACING_PROFILES, PacingProfile
+from evo_client.utils.rate_limit_utils import (
+    TokenBucketRateLimiter,
+    get_rate_limit_info,
+)
+
+T = TypeVar("T")
+
+
+class MemberBranchRoutes:
+    """Table of the branch owning each member, learned from lookups."""
+
+    def __init__(self):
+        self._routes: Dict[int, int] = {}
+        self._lock = ThreadLock()
+
+    def get(self, member_id: int) -> Optional[int]:
+        """Get the branch a member was last found in, if any."""
+        return self._routes.get(int(member_id))
+
+    def update(self, routes: Dict[int, int]) -> None:
+        """Record the branches members were found in."""
+        with self._lock:
+            self._routes.update(routes)
+
+    def __len__(self) -> int:
+        return len(self._routes)
 
 
 class BranchApiClientManager:
@@ -23,18 +51,26 @@ class BranchApiClientManager:
             if branch_api_clients
             else []
         )
+        # Shared by every fetcher using this manager
+        self.member_routes = MemberBranchRoutes()
 
 
 class BaseDataFetcher(abc.ABC):
     """Base class for all data fetchers."""
 
-    def __init__(self, client_manager: BranchApiClientManager):
+    def __init__(
+        self,
+        client_manager: BranchApiClientManager,
+        pacing_profiles: Optional[Dict[str, PacingProfile]] = None,
+    ):
         """Initialize the data fetcher.
 
         Args:
             client_manager: The client manager instance
+            pacing_profiles: Per-endpoint pacing overriding the defaults
         """
         self.client_manager = client_manager
+        self.pacing_profiles = {**DEFAULT_PACING_PROFILES, **(pacing_profiles or {})}
 
     def get_branch_api(self, branch_id: int) -> Optional[SyncApiClient]:
         """Get a branch-specific API instance.
@@ -56,7 +92,57 @@ class BaseDataFetcher(abc.ABC):
         """
         return self.client_manager.branch_ids
 
+    def get_pacing(self, endpoint: str) -> Dict[str, Any]:
+        """Get paginated-call keyword arguments for an endpoint's pacing profile.
+
+        Args:
+            endpoint: Endpoint name, e.g. "members" or "receivables"
+
+        Returns:
+            Keyword arguments for the paginated API call
+        """
+        return self.pacing_profiles.get(endpoint, PacingProfile()).as_kwargs()
+
+    def resolve_branch_ids(self, branch_ids: Optional[List[int]] = None) -> List[int]:
+        """Resolve an optional branch scope against the available branches.
+
+        Args:
+            branch_ids: Branch IDs to restrict the fetch to, or None for all branches
+
+        Returns:
+            Requested branch IDs that have an API client, in the requested order
+        """
+        available = self.get_available_branch_ids()
+        if branch_ids is None:
+            return list(available)
+        return [int(bid) for bid in branch_ids if int(bid) in available]
+
+    def _call_throttled(
+        self, branch_id: int, api_func: Callable[..., T], **kwargs: Any
+    ) -> T:
+        """Make a single call under the branch client's shared rate limit.
+
+        The paginated helpers throttle their own requests, but calls made
+        directly on an API class have to take a token themselves.
+        """
+        rate_limiter = getattr(self.get_branch_api(branch_id), "rate_limiter", None)
+        if not isinstance(rate_limiter, TokenBucketRateLimiter):
+            return api_func(**kwargs)
+
+        rate_limiter.acquire()
+        try:
+            result = api_func(**kwargs)
+        except Exception as e:
+            info = get_rate_limit_info(e)
+            if info is not None and info.is_rate_limited:
+                rate_limiter.on_rate_limited(info)
+            raise
+        rate_limiter.on_success()
+        return result
+
 
 __all__ = [
     "BaseDataFetcher",
+    "BranchApiClientManager",
+    "MemberBranchRoutes",
 ]
@@ -57,6 +57,7 @@ class ActivityDataFetcher(BaseDataFetcher):
             if branch_api:
                 result = paginated_api_call(
                     api_func=branch_api.get_activities,
+                    **self.get_pacing("activities"),
                     branch_id=branch_id,
                     search=search,
                     supports_pagination=False,
@@ -65,6 +66,7 @@ class ActivityDataFetcher(BaseDataFetcher):
 
                 branch_schedules = paginated_api_call(
                     api_func=branch_api.get_schedule,
+                    **self.get_pacing("activities"),
                     branch_id=branch_id,
                     show_full_week=True,
                     date=activity_date,
@@ -1,8 +1,14 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from ...models.gym_model import GymOperatingData
 from ...services.operating_data.operating_data_computer import OperatingDataComputer
+from ...services.operating_data.parallel_operating_data_computer import (
+    OperatingDataInputs,
+    ParallelOperatingDataComputer,
+    compute_period_series,
+)
+from ...utils.period_utils import Period, partition_by_period, rolling_periods
 from . import BaseDataFetcher
 from .activity_data_fetcher import ActivityDataFetcher
 from .configuration_data_fetcher import ConfigurationDataFetcher
@@ -30,7 +36,6 @@ class GymMetricsDataFetcher(BaseDataFetcher):
         self.sales_fetcher = SalesDataFetcher(client_manager)
         self.configuration_fetcher = ConfigurationDataFetcher(client_manager)
         self.activity_fetcher = ActivityDataFetcher(client_manager)
-        self.computer = OperatingDataComputer()
 
     def fetch_advanced_metrics(
         self,
@@ -44,9 +49,10 @@ class GymMetricsDataFetcher(BaseDataFetcher):
 
         Steps:
         - Determine date range if not provided: last 30 days by default.
-        - Fetch current data: active_members, prospects, non_renewed, receivables, entries, active_contracts.
-        - Fetch previous month data similarly.
-        - Use OperatingDataComputer to compute advanced metrics.
+        - The previous period is the 30 days before the current one.
+        - Fetch both periods' records as in fetch_metrics_trend.
+        - Use OperatingDataComputer to compute advanced metrics; the result
+          keeps the current period's records, e.g. for member segmentation.
 
         Returns:
             GymOperatingData with advanced metrics filled in.
@@ -62,73 +68,221 @@ class GymMetricsDataFetcher(BaseDataFetcher):
         prev_to_date = from_date
         prev_from_date = prev_to_date - timedelta(days=30)
 
-        # Fetch current data
-        active_members = self.member_fetcher.fetch_members(
-            membership_start_date_start=from_date,
-            membership_start_date_end=to_date,
-            status=1,
+        # Active contracts are not filtered by period, so both periods share them
+        active_contracts = self.membership_fetcher.fetch_memberships(
+            active=True, branch_ids=branch_ids
         )
-        non_renewed = self.member_fetcher.fetch_members(
-            membership_cancel_date_start=from_date,
-            membership_cancel_date_end=to_date,
-            status=2,
+        previous, current = self._fetch_periods_records(
+            [(prev_from_date, prev_to_date), (from_date, to_date)], branch_ids
         )
-        prospects = self.prospects_fetcher.fetch_prospects(
-            register_date_start=from_date, register_date_end=to_date
-        )
-        receivables = self.receivables_fetcher.fetch_receivables(
-            due_date_start=from_date, due_date_end=to_date
-        )
-        entries = self.entries_fetcher.fetch_entries(
-            register_date_start=from_date, register_date_end=to_date
-        )
-        # fetch memberships (active contracts)
-        active_contracts = self.membership_fetcher.fetch_memberships(active=True)
-
-        # Fetch previous data
-        prev_active_members = self.member_fetcher.fetch_members(
-            membership_start_date_start=prev_from_date,
-            membership_start_date_end=prev_to_date,
-            status=1,
-        )
-        prev_non_renewed = self.member_fetcher.fetch_members(
-            membership_cancel_date_start=prev_from_date,
-            membership_cancel_date_end=prev_to_date,
-            status=2,
-        )
-        prev_prospects = self.prospects_fetcher.fetch_prospects(
-            register_date_start=prev_from_date, register_date_end=prev_to_date
-        )
-        prev_receivables = self.receivables_fetcher.fetch_receivables(
-            due_date_start=prev_from_date, due_date_end=prev_to_date
-        )
-        prev_entries = self.entries_fetcher.fetch_entries(
-            register_date_start=prev_from_date, register_date_end=prev_to_date
-        )
-        prev_active_contracts = self.membership_fetcher.fetch_memberships(active=True)
-
-        previous_data = self.computer.compute_metrics(
-            active_members=prev_active_members,
-            prospects=prev_prospects,
-            non_renewed=prev_non_renewed,
-            receivables=prev_receivables,
-            entries=prev_entries,
-            active_contracts=prev_active_contracts,
+
+        computer = OperatingDataComputer()
+        previous_data = computer.compute_metrics(
+            **previous,
+            active_contracts=active_contracts,
             from_date=prev_from_date,
             to_date=prev_to_date,
             previous_data=None,  # no data before previous
         )
 
-        current_data = self.computer.compute_metrics(
-            active_members=active_members,
-            prospects=prospects,
-            non_renewed=non_renewed,
-            receivables=receivables,
-            entries=entries,
+        return computer.compute_metrics(
+            **current,
             active_contracts=active_contracts,
             from_date=from_date,
             to_date=to_date,
             previous_data=previous_data,
         )
 
-        return current_data
+    def fetch_rolling_metrics(
+        self,
+        count: int = 12,
+        to_date: Optional[datetime] = None,
+        days: int = 30,
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[GymOperatingData]:
+        """
+        Fetch the metrics of consecutive periods, e.g. a 12-month trend.
+
+        Prospects, receivables and entries cost one sweep each however many
+        periods there are, but members cost two sweeps per period (see
+        fetch_metrics_trend), so a 12-period trend makes 24 member sweeps.
+
+        Args:
+            count: Number of periods
+            to_date: End of the latest period (defaults to now)
+            days: Length of each period in days
+            branch_ids: Branches to include (defaults to all)
+
+        Returns:
+            GymOperatingData of each period, oldest first
+        """
+        return self.fetch_metrics_trend(
+            rolling_periods(to_date, count, days), branch_ids
+        )
+
+    def fetch_metrics_trend(
+        self,
+        periods: Sequence[Period],
+        branch_ids: Optional[List[int]] = None,
+    ) -> List[GymOperatingData]:
+        """
+        Fetch the metrics of consecutive periods, each compared to the one before.
+
+        Prospects, receivables and entries are fetched once over the union of
+        the periods and split locally; members are fetched per period (see
+        _fetch_periods_records). Active contracts are not period-bound and are
+        shared by every period. Each period is reduced to OperatingDataInputs,
+        so the results do not carry the input records.
+
+        Args:
+            periods: Consecutive (start, end) periods, oldest first
+            branch_ids: Branches to include (defaults to all)
+
+        Returns:
+            GymOperatingData of each period, oldest first
+        """
+        if branch_ids is None:
+            branch_ids = self.get_available_branch_ids()
+
+        active_contracts = self.membership_fetcher.fetch_memberships(
+            active=True, branch_ids=branch_ids
+        )
+
+        return compute_period_series(
+            [
+                OperatingDataInputs.from_records(
+                    **records,
+                    active_contracts=active_contracts,
+                    from_date=start,
+                    to_date=end,
+                )
+                for (start, end), records in zip(
+                    periods, self._fetch_periods_records(periods, branch_ids)
+                )
+            ]
+        )
+
+    def fetch_branch_metrics(
+        self,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        branch_ids: Optional[List[int]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[int, GymOperatingData]:
+        """
+        Fetch advanced metrics of each branch, computed in parallel processes.
+
+        The data is fetched as in fetch_advanced_metrics, one branch at a time,
+        and reduced to compact OperatingDataInputs. Each branch's previous and
+        current periods are then computed by ParallelOperatingDataComputer.
+        The results do not carry the input records.
+
+        Args:
+            from_date: Start date of the current period (defaults to 30 days ago)
+            to_date: End date of the current period (defaults to now)
+            branch_ids: Branches to compute (defaults to all)
+            max_workers: Worker processes (defaults to the number of CPUs)
+
+        Returns:
+            Current-period GymOperatingData keyed by branch ID
+        """
+        branch_ids = self.resolve_branch_ids(branch_ids)
+
+        if not from_date or not to_date:
+            to_date = datetime.now()
+            from_date = to_date - timedelta(days=30)
+        prev_to_date = from_date
+        prev_from_date = prev_to_date - timedelta(days=30)
+        periods = [(prev_from_date, prev_to_date), (from_date, to_date)]
+
+        series: Dict[int, List[OperatingDataInputs]] = {}
+        for branch_id in branch_ids:
+            active_contracts = self.membership_fetcher.fetch_memberships(
+                active=True, branch_ids=[branch_id]
+            )
+            series[branch_id] = [
+                OperatingDataInputs.from_records(
+                    **records,
+                    active_contracts=active_contracts,
+                    from_date=start,
+                    to_date=end,
+                )
+                for (start, end), records in zip(
+                    periods, self._fetch_periods_records(periods, [branch_id])
+                )
+            ]
+
+        results = ParallelOperatingDataComputer(max_workers).compute_series(series)
+        return {branch_id: periods[-1] for branch_id, periods in results.items()}
+
+    def _fetch_periods_records(
+        self, periods: Sequence[Period], branch_ids: List[int]
+    ) -> List[Dict[str, List[Any]]]:
+        """Fetch the period-bound records the operating metrics need.
+
+        Prospects, receivables and entries are fetched once over the union of
+        the periods, then partitioned by the same date their API filter uses.
+        Members are fetched per period: the API filters them by membership
+        date, but the members it returns may not carry their memberships, so
+        they could not be assigned to a period locally. The API's date range
+        includes its end, so every period but the last ends its member query
+        just before the next period starts, keeping periods half-open.
+
+        Returns:
+            The records of each period, keyed by compute_metrics argument
+        """
+        per_period: List[Dict[str, List[Any]]] = []
+        for index, (start, end) in enumerate(periods):
+            if index < len(periods) - 1:
+                end -= timedelta(microseconds=1)
+            per_period.append(
+                {
+                    "active_members": self.member_fetcher.fetch_members(
+                        membership_start_date_start=start,
+                        membership_start_date_end=end,
+                        status=1,
+                        branch_ids=branch_ids,
+                    ),
+                    "non_renewed": self.member_fetcher.fetch_members(
+                        membership_cancel_date_start=start,
+                        membership_cancel_date_end=end,
+                        status=2,
+                        branch_ids=branch_ids,
+                    ),
+                }
+            )
+
+        from_date, to_date = periods[0][0], periods[-1][1]
+        fetched = {
+            "prospects": (
+                self.prospects_fetcher.fetch_prospects(
+                    register_date_start=from_date,
+                    register_date_end=to_date,
+                    branch_ids=branch_ids,
+                ),
+                lambda p: [p.register_date],
+            ),
+            "receivables": (
+                self.receivables_fetcher.fetch_receivables(
+                    due_date_start=from_date,
+                    due_date_end=to_date,
+                    branch_ids=branch_ids,
+                ),
+                lambda r: [r.due_date],
+            ),
+            "entries": (
+                self.entries_fetcher.fetch_entries(
+                    register_date_start=from_date,
+                    register_date_end=to_date,
+                    branch_ids=branch_ids,
+                ),
+                lambda e: [e.register_date],
+            ),
+        }
+
+        for name, (records, dates) in fetched.items():
+            for period_records, partition in zip(
+                per_period, partition_by_period(records, periods, dates)
+            ):
+                period_records[name] = partition
+        return per_period
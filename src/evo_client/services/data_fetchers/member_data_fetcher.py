@@ -1,5 +1,6 @@
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from loguru import logger
 
@@ -11,6 +12,9 @@ from ...sync.api.members_api import SyncMembersApi
 from ...utils.pagination_utils import paginated_api_call
 from . import BaseDataFetcher
 
+# Most member IDs the members endpoint returns in one request
+MEMBER_IDS_CHUNK_SIZE = 50
+
 
 class MemberDataFetcher(BaseDataFetcher):
     """Handles fetching and processing member-related data."""
@@ -20,27 +24,52 @@ class MemberDataFetcher(BaseDataFetcher):
     ) -> Optional[ClienteDetalhesBasicosApiViewModel]:
         """Fetch a specific member by their ID.
 
+        The given branch, or else the branch the member was last found in, is
+        queried first; on a miss every other branch is probed in turn.
+
         Args:
             member_id: The ID of the member to fetch
+            branch_id: Optional branch to query first
 
         Returns:
             Optional[MembersApiViewModel]: The member data if found, None otherwise
         """
         try:
-            if branch_id and branch_id in self.get_available_branch_ids():
-                branch_api = SyncMembersApi(api_client=self.get_branch_api(branch_id))
+            routes = self.client_manager.member_routes
+            available = self.get_available_branch_ids()
+            preferred = branch_id or routes.get(int(member_id))
+            if preferred and preferred in available:
+                branch_api = SyncMembersApi(api_client=self.get_branch_api(preferred))
                 if branch_api:
-                    result = branch_api.get_member_profile(id_member=int(member_id))
-                    if result:
-                        return result
+                    try:
+                        result = self._call_throttled(
+                            preferred,
+                            branch_api.get_member_profile,
+                            id_member=int(member_id),
+                        )
+                        if result:
+                            routes.update({int(member_id): preferred})
+                            return result
+                    except Exception as e:
+                        # A stale route must not hide the member in another branch
+                        logger.warning(
+                            f"Failed to fetch member {member_id} from branch {preferred}: {e}"
+                        )
 
             # If not found, try branch clients
-            for branch_id in self.get_available_branch_ids():
+            for branch_id in available:
+                if branch_id == preferred:
+                    continue
                 branch_api = SyncMembersApi(api_client=self.get_branch_api(branch_id))
                 if branch_api:
                     try:
-                        result = branch_api.get_member_profile(id_member=int(member_id))
+                        result = self._call_throttled(
+                            branch_id,
+                            branch_api.get_member_profile,
+                            id_member=int(member_id),
+                        )
                         if result:
+                            routes.update({int(member_id): branch_id})
                             return result
                     except Exception as e:
                         logger.warning(
@@ -53,6 +82,93 @@ class MemberDataFetcher(BaseDataFetcher):
             logger.error(f"Error fetching member {member_id}: {str(e)}")
             raise ValueError(f"Error fetching member {member_id}: {str(e)}")
 
+    def fetch_members_by_ids(
+        self,
+        member_ids: List[int],
+        branch_ids: Optional[List[int]] = None,
+        chunk_size: int = MEMBER_IDS_CHUNK_SIZE,
+    ) -> Dict[int, MembersApiViewModel]:
+        """Fetch many members by ID with a few bulk requests.
+
+        IDs are sent in chunks through the ``ids_members`` filter. Members
+        with a known branch are looked up there first; the rest are probed
+        branch by branch, stopping once every member is found. The branch
+        each member is found in is remembered for later lookups.
+
+        Args:
+            member_ids: IDs of the members to fetch
+            branch_ids: Restrict the lookup to these branches (defaults to all)
+            chunk_size: IDs per request, at most the API's page size
+
+        Returns:
+            Dict mapping each member ID found to its member data
+        """
+        try:
+            routes = self.client_manager.member_routes
+            branches = self.resolve_branch_ids(branch_ids)
+            pending = list(dict.fromkeys(int(member_id) for member_id in member_ids))
+            found: Dict[int, MembersApiViewModel] = {}
+            queried: Dict[int, Set[int]] = defaultdict(set)
+
+            def query(branch_id: int, ids: List[int]) -> None:
+                queried[branch_id].update(ids)
+                members = self._fetch_members_chunked(branch_id, ids, chunk_size)
+                for member in members:
+                    if member.id_member is not None:
+                        found[member.id_member] = member
+                routes.update(
+                    {m.id_member: branch_id for m in members if m.id_member is not None}
+                )
+
+            by_branch: Dict[int, List[int]] = defaultdict(list)
+            for member_id in pending:
+                known = routes.get(member_id)
+                if known in branches:
+                    by_branch[known].append(member_id)
+            for branch_id, ids in by_branch.items():
+                query(branch_id, ids)
+
+            for branch_id in branches:
+                missing = [
+                    member_id
+                    for member_id in pending
+                    if member_id not in found and member_id not in queried[branch_id]
+                ]
+                if missing:
+                    query(branch_id, missing)
+
+            return found
+
+        except Exception as e:
+            logger.error(f"Error fetching members by ID: {str(e)}")
+            raise ValueError(f"Error fetching members by ID: {str(e)}")
+
+    def _fetch_members_chunked(
+        self, branch_id: int, member_ids: List[int], chunk_size: int
+    ) -> List[MembersApiViewModel]:
+        """Fetch members of one branch by ID, one request per chunk of IDs."""
+        branch_api = SyncMembersApi(api_client=self.get_branch_api(branch_id))
+        members: List[MembersApiViewModel] = []
+        for start in range(0, len(member_ids), chunk_size):
+            chunk = member_ids[start : start + chunk_size]
+            try:
+                members.extend(
+                    paginated_api_call(
+                        api_func=branch_api.get_members,
+                        **self.get_pacing("members"),
+                        # A chunk never exceeds one page
+                        supports_pagination=False,
+                        branch_id_logging=str(branch_id),
+                        ids_members=",".join(str(member_id) for member_id in chunk),
+                        take=len(chunk),
+                    )
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fetch members by ID from branch {branch_id}: {e}"
+                )
+        return members
+
     def fetch_members(
         self,
         name: Optional[str] = None,
@@ -73,6 +189,7 @@ class MemberDataFetcher(BaseDataFetcher):
         only_personal: bool = False,
         personal_type: Optional[int] = None,
         show_activity_data: bool = False,
+        branch_ids: Optional[List[int]] = None,
     ) -> List[MembersApiViewModel]:
         """Fetch members with various filters.
 
@@ -95,18 +212,20 @@ class MemberDataFetcher(BaseDataFetcher):
             only_personal: Filter for personal training members only
             personal_type: Filter by personal training type
             show_activity_data: Include activity data in response
+            branch_ids: Restrict the fetch to these branches (defaults to all)
 
         Returns:
             List[MembersApiViewModel]: List of members matching the filters
         """
         try:
             members = []
-            for branch_id in self.get_available_branch_ids():
+            for branch_id in self.resolve_branch_ids(branch_ids):
                 branch_api = SyncMembersApi(api_client=self.get_branch_api(branch_id))
                 if branch_api:
                     members.extend(
                         paginated_api_call(
                             api_func=branch_api.get_members,
+                            **self.get_pacing("members"),
                             branch_id_logging=str(branch_id),
                             name=name,
                             email=email,
@@ -19,6 +19,7 @@ class MembershipDataFetcher(BaseDataFetcher):
         membership_id: Optional[int] = None,
         name: Optional[str] = None,
         active: Optional[bool] = None,
+        branch_ids: Optional[List[int]] = None,
     ) -> List[ContratosResumoApiViewModel]:
         """Fetch membership plans with optional filtering.
 
@@ -26,19 +27,21 @@ class MembershipDataFetcher(BaseDataFetcher):
             membership_id: Filter by membership ID
             name: Filter by membership name
             active: Filter by active status
+            branch_ids: Restrict the fetch to these branches (defaults to all)
 
         Returns:
             List[ContratosResumoApiViewModel]: List of membership plans matching the filters
         """
         try:
             memberships: List[ContratosResumoApiViewModel] = []
-            for branch_id in self.get_available_branch_ids():
+            for branch_id in self.resolve_branch_ids(branch_ids):
                 branch_api = SyncMembershipApi(
                     api_client=self.get_branch_api(branch_id)
                 )
                 if branch_api:
                     result = paginated_api_call(
                         api_func=branch_api.get_memberships,
+                        **self.get_pacing("memberships"),
                         branch_id=branch_id,
                         membership_id=membership_id,
                         name=name,
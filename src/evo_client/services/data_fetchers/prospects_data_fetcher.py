@@ -24,6 +24,7 @@ class ProspectsDataFetcher(BaseDataFetcher):
         conversion_date_start: Optional[datetime] = None,
         conversion_date_end: Optional[datetime] = None,
         gympass_id: Optional[str] = None,
+        branch_ids: Optional[List[int]] = None,
     ) -> List[ProspectsResumoApiViewModel]:
         """Fetch prospects with various filters.
 
@@ -38,18 +39,20 @@ class ProspectsDataFetcher(BaseDataFetcher):
             conversion_date_start: Filter by conversion start date
             conversion_date_end: Filter by conversion end date
             gympass_id: Filter by Gympass ID
+            branch_ids: Restrict the fetch to these branches (defaults to all)
 
         Returns:
             List[ProspectsResumoApiViewModel]: List of prospects matching the filters
         """
         try:
             result = []
-            for branch_id in self.get_available_branch_ids():
+            for branch_id in self.resolve_branch_ids(branch_ids):
                 branch_api = SyncProspectsApi(api_client=self.get_branch_api(branch_id))
                 if branch_api:
                     result.extend(
                         paginated_api_call(
                             api_func=branch_api.get_prospects,
+                            **self.get_pacing("prospects"),
                             branch_id_logging=str(branch_id),
                             prospect_id=id_prospect,
                             name=name,
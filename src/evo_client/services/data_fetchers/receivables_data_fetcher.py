@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional
 
 from loguru import logger
 
 from ...models.receivables_api_view_model import ReceivablesApiViewModel
 from ...sync.api.receivables_api import SyncReceivablesApi
-from ...utils.pagination_utils import paginated_api_call
+from ...utils.checkpoint_utils import CheckpointStore
+from ...utils.pagination_utils import iter_items, paginated_api_call
 from . import BaseDataFetcher
 
 
@@ -42,6 +43,7 @@ class ReceivablesDataFetcher(BaseDataFetcher):
         member_id: Optional[int] = None,
         sale_id: Optional[int] = None,
         receivable_id: Optional[int] = None,
+        branch_ids: Optional[List[int]] = None,
     ) -> List[ReceivablesApiViewModel]:
         """Fetch receivables with various filters.
 
@@ -75,12 +77,14 @@ class ReceivablesDataFetcher(BaseDataFetcher):
             sale_id: Filter by sale ID
             receivable_id: Filter by receivable ID
             default_client: If True, fetch data from all branches
+            branch_ids: Restrict the fetch to these branches (defaults to all)
+
         Returns:
             List[ReceivablesApiViewModel]: List of receivables matching the filters
         """
         try:
             result = []
-            for branch_id in self.get_available_branch_ids():
+            for branch_id in self.resolve_branch_ids(branch_ids):
                 branch_api = SyncReceivablesApi(
                     api_client=self.get_branch_api(branch_id)
                 )
@@ -88,6 +92,7 @@ class ReceivablesDataFetcher(BaseDataFetcher):
                     result.extend(
                         paginated_api_call(
                             api_func=branch_api.get_receivables,
+                            **self.get_pacing("receivables"),
                             branch_id_logging=str(branch_id),
                             registration_date_start=registration_date_start,
                             registration_date_end=registration_date_end,
@@ -125,3 +130,40 @@ class ReceivablesDataFetcher(BaseDataFetcher):
         except Exception as e:
             logger.error(f"Error fetching receivables: {str(e)}")
             raise ValueError(f"Error fetching receivables: {str(e)}")
+
+    def iter_receivables(
+        self,
+        branch_ids: Optional[List[int]] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        **filters: Any,
+    ) -> Iterator[ReceivablesApiViewModel]:
+        """Stream receivables branch by branch, page by page.
+
+        Only one page is held in memory at a time, so large exports can be
+        written incrementally.
+
+        Args:
+            branch_ids: Restrict the fetch to these branches (defaults to all)
+            checkpoint_store: Store recording each branch's last completed page,
+                so an interrupted export resumes where it stopped
+            **filters: Any filter accepted by :meth:`fetch_receivables`
+
+        Yields:
+            ReceivablesApiViewModel: Receivables matching the filters
+        """
+        try:
+            for branch_id in self.resolve_branch_ids(branch_ids):
+                branch_api = SyncReceivablesApi(
+                    api_client=self.get_branch_api(branch_id)
+                )
+                yield from iter_items(
+                    api_func=branch_api.get_receivables,
+                    **self.get_pacing("receivables"),
+                    branch_id_logging=str(branch_id),
+                    checkpoint_store=checkpoint_store,
+                    **filters,
+                )
+
+        except Exception as e:
+            logger.error(f"Error fetching receivables: {str(e)}")
+            raise ValueError(f"Error fetching receivables: {str(e)}")
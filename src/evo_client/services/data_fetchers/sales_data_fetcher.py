@@ -28,6 +28,7 @@ class SalesDataFetcher(BaseDataFetcher):
         show_only_active_memberships: Optional[bool] = None,
         show_allow_locker: Optional[bool] = None,
         only_total_pass: Optional[bool] = None,
+        branch_ids: Optional[List[int]] = None,
     ) -> List[SalesViewModel]:
         """Fetch sales with various filters.
 
@@ -46,18 +47,20 @@ class SalesDataFetcher(BaseDataFetcher):
             show_only_active_memberships: Filter for active memberships only
             show_allow_locker: Filter for sales with locker access
             only_total_pass: Filter for total pass sales only
+            branch_ids: Restrict the fetch to these branches (defaults to all)
 
         Returns:
             List[SalesViewModel]: List of sales matching the filters
         """
         try:
             result = []
-            for branch_id in self.get_available_branch_ids():
+            for branch_id in self.resolve_branch_ids(branch_ids):
                 branch_api = SyncSalesApi(api_client=self.get_branch_api(branch_id))
                 if branch_api:
                     result.extend(
                         paginated_api_call(
                             api_func=branch_api.get_sales,
+                            **self.get_pacing("sales"),
                             branch_id_logging=str(branch_id),
                             member_id=member_id,
                             date_sale_start=date_sale_start,
@@ -16,16 +16,18 @@ class ServiceDataFetcher(BaseDataFetcher):
         id_service: Optional[int] = None,
         name: Optional[str] = None,
         active: Optional[bool] = None,
+        branch_ids: Optional[List[int]] = None,
     ) -> List[ServicosResumoApiViewModel]:
         """Fetch services with various filters."""
         try:
             services = []
-            for branch_id in self.get_available_branch_ids():
+            for branch_id in self.resolve_branch_ids(branch_ids):
                 branch_api = SyncServiceApi(api_client=self.get_branch_api(branch_id))
                 if branch_api:
                     services.extend(
                         paginated_api_call(
                             api_func=branch_api.get_services,
+                            **self.get_pacing("services"),
                             branch_id=branch_id,
                             service_id=id_service,
                             name=name,
@@ -4,7 +4,6 @@ from __future__ import absolute_import
 
 from datetime import datetime, timedelta
 from decimal import Decimal
-from multiprocessing.pool import Pool
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -35,7 +34,6 @@ except ImportError as e:
 class GymApi:
     """Gym API client for EVO API."""
 
-    _pool: Pool
     branch_ids: List[int]
 
     def __init__(
@@ -79,12 +77,6 @@ class GymApi:
             client_manager=client_manager,
         )
 
-    def __del__(self):
-        """Clean up resources."""
-        if hasattr(self, "_pool"):
-            self._pool.close()
-            self._pool.join()
-
     def get_overdue_members(
         self, min_days_overdue: int = 1, branch_ids: Optional[List[int]] = None
     ) -> List[OverdueMember]:
@@ -1,10 +1,7 @@
-import json
-from pathlib import Path
 from typing import List
 
 from loguru import logger
 
-from ...models.configuracao_api_view_model import ConfiguracaoApiViewModel
 from ...models.gym_model import (
     Address,
     BusinessHours,
@@ -36,29 +33,10 @@ class GymKnowledgeBaseService:
     def build_knowledge_base(self) -> GymKnowledgeBase:
         """Build a complete knowledge base for the gym chain."""
         try:
-            # Get cached configurations from file instead of fetching
-            config_dir = Path(".config")
-            cred_files = list(config_dir.glob("credentials.*.json"))
-
-            if not cred_files:
-                raise ValueError("No credential files found")
-
-            # Read cached configurations
-            gym_name = cred_files[0].stem.split(".")[1]
-            config_file = config_dir / f"branch_configs.{gym_name}.json"
-
-            if not config_file.exists():
-                logger.warning("No cached configurations found, fetching from API...")
-                branch_configs = (
-                    self.configuration_fetcher.validate_and_cache_configurations()
-                )
-            else:
-                with open(config_file) as f:
-                    cache_data = json.load(f)
-                    branch_configs = [
-                        ConfiguracaoApiViewModel(**config)
-                        for config in cache_data["configurations"]
-                    ]
+            # Served from the response cache when the clients enable it
+            branch_configs = (
+                self.configuration_fetcher.validate_and_cache_configurations()
+            )
 
             if not branch_configs:
                 raise ValueError("No branch configurations found")
@@ -0,0 +1,27 @@
+"""Incremental sync of API entities into a local store."""
+
+from .incremental_sync_service import (
+    INCREMENTAL_ENTITIES,
+    IncrementalEntity,
+    IncrementalSyncService,
+)
+from .sqlite_entity_store import ENTITY_TABLES, EntityTable, SqliteEntityStore
+from .sync_state import (
+    EntityStore,
+    InMemoryEntityStore,
+    JsonWatermarkStore,
+    WatermarkStore,
+)
+
+__all__ = [
+    "ENTITY_TABLES",
+    "EntityStore",
+    "EntityTable",
+    "INCREMENTAL_ENTITIES",
+    "InMemoryEntityStore",
+    "IncrementalEntity",
+    "IncrementalSyncService",
+    "JsonWatermarkStore",
+    "SqliteEntityStore",
+    "WatermarkStore",
+]
@@ -0,0 +1,272 @@
+"""Local SQLite store for the main API view models."""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from threading import Lock as ThreadLock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from ...models.entradas_resumo_api_view_model import EntradasResumoApiViewModel
+from ...models.members_api_view_model import MembersApiViewModel
+from ...models.receivables_api_view_model import ReceivablesApiViewModel
+from ...models.sales_view_model import SalesViewModel
+
+
+@dataclass(frozen=True)
+class EntityTable:
+    """How an entity is keyed and indexed in the local store."""
+
+    model: Type[BaseModel]
+    key: Callable[[Any], str]
+    member_field: str
+    date_fields: Tuple[str, ...]
+
+
+def entry_key(entry: Any) -> str:
+    """Key of an entry, which carries no ID of its own."""
+    # Who entered when identifies an entry
+    when = entry.date.isoformat() if entry.date else ""
+    return f"{when}:{entry.id_member}:{entry.id_prospect}"
+
+
+ENTITY_TABLES: Dict[str, EntityTable] = {
+    "members": EntityTable(
+        model=MembersApiViewModel,
+        key=lambda member: str(member.id_member),
+        member_field="id_member",
+        date_fields=("register_date", "conversion_date"),
+    ),
+    "receivables": EntityTable(
+        model=ReceivablesApiViewModel,
+        key=lambda receivable: str(receivable.id_receivable),
+        member_field="id_member_payer",
+        date_fields=("due_date", "receiving_date", "update_date"),
+    ),
+    "entries": EntityTable(
+        model=EntradasResumoApiViewModel,
+        key=entry_key,
+        member_field="id_member",
+        date_fields=("date",),
+    ),
+    "sales": EntityTable(
+        model=SalesViewModel,
+        key=lambda sale: str(sale.id_sale),
+        member_field="id_member",
+        date_fields=("sale_date",),
+    ),
+}
+
+# Rows written and committed together during an upsert
+_UPSERT_BATCH_SIZE = 500
+
+
+def _format_date(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+class SqliteEntityStore:
+    """Entity store keeping one upserted row per record in a SQLite database.
+
+    Each entity has its own table keyed by (branch, record key), with the
+    record stored as JSON next to indexed member and date columns so local
+    queries never need to decode rows they do not return. Dates are stored
+    as ISO strings, so query bounds must use the same timezone convention
+    as the stored records.
+
+    The database runs in WAL mode with a separate connection for reads, so
+    queries see the last committed batch instead of waiting for an upsert
+    that is still consuming a paginated pull.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite database file; created with its tables if missing
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._lock = ThreadLock()
+        with self._lock, self._conn:
+            for entity, table in ENTITY_TABLES.items():
+                self._create_table(entity, table)
+        # Readers only wait for each other, never for a running upsert
+        self._reader = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._read_lock = ThreadLock()
+
+    def _create_table(self, entity: str, table: EntityTable) -> None:
+        date_columns = "".join(f"{field} TEXT, " for field in table.date_fields)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {entity} ("
+            "branch_id INTEGER NOT NULL, key TEXT NOT NULL, member_id INTEGER, "
+            f"{date_columns}payload TEXT NOT NULL, synced_at REAL NOT NULL, "
+            "PRIMARY KEY (branch_id, key))"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{entity}_member ON {entity} (member_id)"
+        )
+        for field in table.date_fields:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{entity}_{field} "
+                f"ON {entity} ({field})"
+            )
+
+    @staticmethod
+    def _table(entity: str) -> EntityTable:
+        if entity not in ENTITY_TABLES:
+            raise ValueError(
+                f"Unknown entity {entity!r}; expected one of "
+                f"{', '.join(sorted(ENTITY_TABLES))}"
+            )
+        return ENTITY_TABLES[entity]
+
+    def upsert(
+        self, entity: str, branch_id: int, records: Iterable[Tuple[str, Any]]
+    ) -> int:
+        """Insert or replace records by key, returning how many were written.
+
+        Records must be view models. They are committed in batches, so a long
+        pull never holds the write lock between pages; if the iterator fails
+        part way, the batches already committed stay in the store and the
+        records of the unfinished batch are dropped. Queries see each batch
+        once it is committed.
+        """
+        table = self._table(entity)
+        columns = ["branch_id", "key", "member_id", *table.date_fields, "payload"]
+        sql = (
+            f"INSERT OR REPLACE INTO {entity} ({', '.join(columns)}, synced_at) "
+            f"VALUES ({', '.join('?' for _ in columns)}, ?)"
+        )
+
+        written = 0
+        batch: List[tuple] = []
+        now = time.time()
+        for key, record in records:
+            batch.append(
+                (
+                    branch_id,
+                    key,
+                    getattr(record, table.member_field),
+                    *(
+                        _format_date(getattr(record, field))
+                        for field in table.date_fields
+                    ),
+                    record.model_dump_json(by_alias=True),
+                    now,
+                )
+            )
+            if len(batch) >= _UPSERT_BATCH_SIZE:
+                written += self._write_batch(sql, batch)
+                batch = []
+        if batch:
+            written += self._write_batch(sql, batch)
+        return written
+
+    def _write_batch(self, sql: str, batch: List[tuple]) -> int:
+        # Each batch is its own transaction
+        with self._lock, self._conn:
+            self._conn.executemany(sql, batch)
+        return len(batch)
+
+    def upsert_models(
+        self, entity: str, branch_id: int, models: Iterable[BaseModel]
+    ) -> int:
+        """Insert or replace fetched view models, keyed by their own IDs.
+
+        Args:
+            entity: Entity the models belong to
+            branch_id: Branch the models were fetched from
+            models: View models, e.g. straight from a fetcher's iterator
+
+        Returns:
+            Number of records written
+        """
+        key = self._table(entity).key
+        return self.upsert(entity, branch_id, ((key(model), model) for model in models))
+
+    def query(
+        self,
+        entity: str,
+        branch_id: Optional[int] = None,
+        member_id: Optional[int] = None,
+        date_field: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[BaseModel]:
+        """Read stored records using the branch, member and date indexes.
+
+        Args:
+            entity: Entity to read
+            branch_id: Only records of this branch
+            member_id: Only records of this member
+            date_field: Indexed date column the date bounds apply to
+            date_from: Inclusive lower bound of ``date_field``
+            date_to: Inclusive upper bound of ``date_field``
+
+        Returns:
+            The matching view models
+        """
+        table = self._table(entity)
+        clauses: List[str] = []
+        params: List[Any] = []
+        if branch_id is not None:
+            clauses.append("branch_id = ?")
+            params.append(branch_id)
+        if member_id is not None:
+            clauses.append("member_id = ?")
+            params.append(member_id)
+        if date_from is not None or date_to is not None:
+            if date_field not in table.date_fields:
+                raise ValueError(
+                    f"date_field must be one of {', '.join(table.date_fields)}"
+                )
+            if date_from is not None:
+                clauses.append(f"{date_field} >= ?")
+                params.append(_format_date(date_from))
+            if date_to is not None:
+                clauses.append(f"{date_field} <= ?")
+                params.append(_format_date(date_to))
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._read_lock:
+            rows = self._reader.execute(
+                f"SELECT payload FROM {entity}{where}", params
+            ).fetchall()
+        return [table.model.model_validate_json(payload) for (payload,) in rows]
+
+    def get_all(self, entity: str, branch_id: Optional[int] = None) -> List[Any]:
+        """Return the stored records of an entity, optionally for one branch."""
+        return self.query(entity, branch_id=branch_id)
+
+    def count(self, entity: str, branch_id: Optional[int] = None) -> int:
+        """Return how many records of an entity are stored."""
+        self._table(entity)
+        if branch_id is None:
+            sql, params = f"SELECT COUNT(*) FROM {entity}", ()
+        else:
+            sql, params = f"SELECT COUNT(*) FROM {entity} WHERE branch_id = ?", (
+                branch_id,
+            )
+        with self._read_lock:
+            (total,) = self._reader.execute(sql, params).fetchone()
+        return total
+
+    def close(self) -> None:
+        """Close the database connections."""
+        with self._read_lock:
+            self._reader.close()
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "SqliteEntityStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
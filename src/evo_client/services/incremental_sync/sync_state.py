@@ -0,0 +1,100 @@
+"""Persistent state for incremental syncs: high-water marks and entity stores."""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from threading import Lock as ThreadLock
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple, Union
+
+
+class WatermarkStore(Protocol):
+    """Protocol for per-branch, per-entity high-water mark stores."""
+
+    def get(self, entity: str, branch_id: int) -> Optional[datetime]:
+        """Return the time up to which ``entity`` is synced for a branch."""
+        ...
+
+    def set(self, entity: str, branch_id: int, value: datetime) -> None:
+        """Record that ``entity`` is synced for a branch up to ``value``."""
+        ...
+
+
+class EntityStore(Protocol):
+    """Protocol for local stores that incremental syncs merge records into."""
+
+    def upsert(
+        self, entity: str, branch_id: int, records: Iterable[Tuple[str, Any]]
+    ) -> int:
+        """Insert or replace records by key, returning how many were written."""
+        ...
+
+
+class JsonWatermarkStore:
+    """High-water mark store persisted as a single JSON file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the store.
+
+        Args:
+            path: JSON file holding the marks; created on first write
+        """
+        self.path = Path(path)
+        self._lock = ThreadLock()
+
+    @staticmethod
+    def _key(entity: str, branch_id: int) -> str:
+        return f"{entity}:{branch_id}"
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def get(self, entity: str, branch_id: int) -> Optional[datetime]:
+        """Return the time up to which ``entity`` is synced for a branch."""
+        with self._lock:
+            value = self._load().get(self._key(entity, branch_id))
+        return None if value is None else datetime.fromisoformat(value)
+
+    def set(self, entity: str, branch_id: int, value: datetime) -> None:
+        """Record that ``entity`` is synced for a branch up to ``value``."""
+        with self._lock:
+            marks = self._load()
+            marks[self._key(entity, branch_id)] = value.isoformat()
+            # Replace atomically so a crash never loses every mark
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(marks, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+class InMemoryEntityStore:
+    """Entity store keeping the latest version of each record in memory."""
+
+    def __init__(self):
+        self.records: Dict[str, Dict[Tuple[int, str], Any]] = {}
+
+    def upsert(
+        self, entity: str, branch_id: int, records: Iterable[Tuple[str, Any]]
+    ) -> int:
+        """Insert or replace records by key, returning how many were written."""
+        table = self.records.setdefault(entity, {})
+        written = 0
+        for key, record in records:
+            table[(branch_id, key)] = record
+            written += 1
+        return written
+
+    def get_all(self, entity: str, branch_id: Optional[int] = None) -> List[Any]:
+        """Return the stored records of an entity, optionally for one branch."""
+        return [
+            record
+            for (record_branch, _), record in self.records.get(entity, {}).items()
+            if branch_id is None or record_branch == branch_id
+        ]
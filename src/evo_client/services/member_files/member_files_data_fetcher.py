@@ -1,10 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from loguru import logger
 
-from ...models.atividade_agenda_api_view_model import AtividadeAgendaApiViewModel
 from ...models.cliente_detalhes_basicos_api_view_model import (
     ClienteDetalhesBasicosApiViewModel,
 )
@@ -20,16 +20,38 @@ from ...models.gym_model import (
     ReceivableStatus,
 )
 from ...models.receivables_api_view_model import ReceivablesApiViewModel
-from ...sync.api.activities_api import SyncActivitiesApi
-from ...sync.api.entries_api import SyncEntriesApi
 from ...sync.api.members_api import SyncMembersApi
 from ...sync.api.receivables_api import SyncReceivablesApi
-from ..data_fetchers import BaseDataFetcher
+from ...utils.pagination_utils import PacingProfile, paginated_api_call
+from ..data_fetchers import BaseDataFetcher, BranchApiClientManager
+
+# Profile and receivables of one member
+MemberFileData = Tuple[
+    ClienteDetalhesBasicosApiViewModel,
+    List[ReceivablesApiViewModel],
+]
 
 
 class MemberFilesDataFetcher(BaseDataFetcher):
     """Handles fetching and processing comprehensive member files data."""
 
+    def __init__(
+        self,
+        client_manager: BranchApiClientManager,
+        pacing_profiles: Optional[Dict[str, PacingProfile]] = None,
+        max_workers: int = 8,
+    ):
+        """Initialize the member files fetcher.
+
+        Args:
+            client_manager: The client manager instance
+            pacing_profiles: Per-endpoint pacing overriding the defaults
+            max_workers: Members fetched concurrently; their requests still
+                share each credential's rate limit
+        """
+        super().__init__(client_manager, pacing_profiles)
+        self.max_workers = max_workers
+
     def get_members_files(
         self,
         member_ids: List[int],
@@ -44,104 +66,123 @@ class MemberFilesDataFetcher(BaseDataFetcher):
             branch_ids: Optional list of branch IDs to fetch from
             from_date: Optional start date for data range
             to_date: Optional end date for data range
-            async_req: Whether to execute requests asynchronously
 
         Returns:
-            Member files data either synchronously or as an async result
+            Member files of the members found, in the requested order
         """
         try:
             # Initialize members files container
             members_files = MembersFiles(
                 member_ids=member_ids, data_from=from_date, data_to=to_date
             )
-            all_results: List[
-                Tuple[
-                    ClienteDetalhesBasicosApiViewModel,
-                    List[EntradasResumoApiViewModel],
-                    List[ReceivablesApiViewModel],
-                    List[AtividadeAgendaApiViewModel],
-                ]
-            ] = []
-            if branch_ids is None:
-                branch_ids = self.get_available_branch_ids()
-
-            for branch_id in branch_ids:
-                if branch_id not in self.get_available_branch_ids():
-                    logger.warning(f"Branch {branch_id} not found")
-                    continue
-
-                api = self.get_branch_api(branch_id)
-                if not api:
-                    continue
-                members_api = SyncMembersApi(api_client=api)
-                entries_api = SyncEntriesApi(api_client=api)
-                receivables_api = SyncReceivablesApi(api_client=api)
-                activities_api = SyncActivitiesApi(api_client=api)
-
-                for member_id in member_ids:
-                    all_results.append(
-                        (
-                            members_api.get_member_profile(id_member=member_id),
-                            entries_api.get_entries(
-                                register_date_start=from_date,
-                                register_date_end=to_date,
-                                member_id=member_id,
-                            ),
-                            receivables_api.get_receivables(
-                                member_id=member_id,
-                                registration_date_start=from_date,
-                                registration_date_end=to_date,
-                            ),
-                            activities_api.get_schedule(
-                                member_id=member_id, date=from_date, show_full_week=True
-                            ),
-                        )
-                    )
-
-            return self._process_members_files(all_results, member_ids, members_files)
+            profiles = {
+                profile.member_id: profile
+                for profile in self.iter_members_files(
+                    member_ids, branch_ids, from_date, to_date
+                )
+            }
+            members_files.add_members(
+                profiles[member_id] for member_id in member_ids if member_id in profiles
+            )
+            return members_files
 
         except Exception as e:
             logger.error(f"Error fetching members files: {str(e)}")
             raise ValueError(f"Error fetching members files: {str(e)}")
 
-    def _process_members_files(
+    def iter_members_files(
         self,
-        results: List[
-            Tuple[
-                ClienteDetalhesBasicosApiViewModel,
-                List[EntradasResumoApiViewModel],
-                List[ReceivablesApiViewModel],
-                List[AtividadeAgendaApiViewModel],
-            ]
-        ],
         member_ids: List[int],
-        members_files: MembersFiles,
-    ) -> MembersFiles:
-        """Process API results into MembersFiles object.
+        branch_ids: Optional[List[int]] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> Iterator[MemberProfile]:
+        """Stream member profiles as their data arrives.
+
+        Each member is looked up once, in the branch that owns it, and its
+        receivables are then fetched from that branch. Up to ``max_workers``
+        members are fetched at a time. A member that is not found or fails is
+        logged and skipped.
 
         Args:
-            results: List of API results
-            member_ids: List of member IDs
-            members_files: MembersFiles object to populate
+            member_ids: List of member IDs to fetch data for
+            branch_ids: Optional list of branch IDs to look members up in
+            from_date: Optional start date for data range
+            to_date: Optional end date for data range
 
-        Returns:
-            Populated MembersFiles object
+        Yields:
+            MemberProfile: Profile of each member found, in completion order
         """
-        try:
-            # Results come in groups of 4 per member (profile, entries, receivables, activities)
-            for i, member_id in enumerate(member_ids):
-                member_data = results[i]
-
-                if member_data[0]:  # If member profile exists
+        branches = self.resolve_branch_ids(branch_ids)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as member_pool:
+            futures = {
+                member_pool.submit(
+                    self._fetch_member_file, member_id, branches, from_date, to_date
+                ): member_id
+                for member_id in member_ids
+            }
+            for future in as_completed(futures):
+                member_id = futures[future]
+                try:
+                    member_data = future.result()
+                    if member_data is None:
+                        logger.warning(f"Member {member_id} not found")
+                        continue
                     profile = self._create_member_profile(member_data[0])
-                    self._process_member_data(profile, member_data[2])
-                    members_files.add_member(profile)
+                    self._process_member_data(profile, member_data[1])
+                except Exception as e:
+                    logger.warning(f"Failed to fetch member file {member_id}: {e}")
+                    continue
+                yield profile
 
-            return members_files
+    def _find_member(
+        self, member_id: int, branch_ids: List[int]
+    ) -> Optional[Tuple[int, ClienteDetalhesBasicosApiViewModel]]:
+        """Find the branch owning a member, trying its known branch first."""
+        routes = self.client_manager.member_routes
+        known = routes.get(member_id)
+        candidates = [known] if known in branch_ids else []
+        candidates += [bid for bid in branch_ids if bid != known]
 
-        except Exception as e:
-            logger.error(f"Error processing members files: {str(e)}")
-            return members_files
+        for branch_id in candidates:
+            members_api = SyncMembersApi(api_client=self.get_branch_api(branch_id))
+            try:
+                profile = self._call_throttled(
+                    branch_id, members_api.get_member_profile, id_member=member_id
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fetch member {member_id} from branch {branch_id}: {e}"
+                )
+                continue
+            if profile:
+                routes.update({member_id: branch_id})
+                return branch_id, profile
+        return None
+
+    def _fetch_member_file(
+        self,
+        member_id: int,
+        branch_ids: List[int],
+        from_date: Optional[datetime],
+        to_date: Optional[datetime],
+    ) -> Optional[MemberFileData]:
+        """Fetch one member's profile, then its receivables."""
+        found = self._find_member(member_id, branch_ids)
+        if found is None:
+            return None
+        branch_id, profile = found
+
+        receivables_api = SyncReceivablesApi(api_client=self.get_branch_api(branch_id))
+        receivables = paginated_api_call(
+            api_func=receivables_api.get_receivables,
+            **self.get_pacing("receivables"),
+            branch_id_logging=str(branch_id),
+            member_id=member_id,
+            registration_date_start=from_date,
+            registration_date_end=to_date,
+        )
+        return profile, receivables
 
     def _create_member_profile(
         self, member: ClienteDetalhesBasicosApiViewModel
@@ -2,8 +2,16 @@
 
 from ...models.gym_model import GymOperatingData
 from .operating_data_computer import OperatingDataComputer
+from .parallel_operating_data_computer import (
+    OperatingDataInputs,
+    ParallelOperatingDataComputer,
+)
+from .vectorized_operating_data_computer import VectorizedOperatingDataComputer
 
 __all__ = [
     "GymOperatingData",
     "OperatingDataComputer",
+    "OperatingDataInputs",
+    "ParallelOperatingDataComputer",
+    "VectorizedOperatingDataComputer",
 ]
@@ -1,9 +1,14 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from ...models.contratos_resumo_api_view_model import ContratosResumoApiViewModel
-from ...models.gym_model import GymEntry, GymOperatingData
+from ...models.gym_model import (
+    GymEntry,
+    GymOperatingData,
+    Receivable,
+    ReceivableStatus,
+)
 from ...models.members_api_view_model import MembersApiViewModel
 from ...models.prospects_resumo_api_view_model import ProspectsResumoApiViewModel
 from ...models.receivables_api_view_model import ReceivablesApiViewModel
@@ -40,10 +45,6 @@ class OperatingDataComputer:
             GymOperatingData with computed metrics
         """
 
-        total_active = len(active_members)
-        total_churned = len(non_renewed)
-        total_prospects = len(prospects)
-
         # Compute MRR from active contracts. Assume each contract has a monthly price attribute (like price).
         # We sum all contract prices to get MRR.
         # If no price attribute is found, default to 0.
@@ -57,6 +58,108 @@ class OperatingDataComputer:
             )
             total_mrr += price
 
+        # Receivables metrics
+        total_paid = Decimal("0.00")
+        total_pending = Decimal("0.00")
+        total_overdue = Decimal("0.00")
+
+        now = datetime.now()
+        period_receivables = [self._to_receivable(r, now) for r in receivables]
+        for r in period_receivables:
+            if r.status == ReceivableStatus.PAID:
+                total_paid += r.amount
+            elif r.status == ReceivableStatus.OVERDUE:
+                total_overdue += r.amount
+            else:
+                total_pending += r.amount
+
+        return self._build_operating_data(
+            total_active=len(active_members),
+            total_churned=len(non_renewed),
+            total_prospects=len(prospects),
+            total_entries=len(entries),
+            total_mrr=total_mrr,
+            total_paid=total_paid,
+            total_pending=total_pending,
+            total_overdue=total_overdue,
+            from_date=from_date,
+            to_date=to_date,
+            previous_data=previous_data,
+            active_members=[m.model_dump() for m in active_members],
+            # Plan summaries are not member contracts; they only feed the MRR
+            prospects=[p.model_dump() for p in prospects],
+            non_renewed_members=[nm.model_dump() for nm in non_renewed],
+            receivables=period_receivables,
+            recent_entries=[e.model_dump() for e in entries],
+        )
+
+    @staticmethod
+    def _to_receivable(
+        receivable: ReceivablesApiViewModel, now: datetime
+    ) -> Receivable:
+        """Convert an API receivable, classifying it as paid, overdue or pending."""
+        amount = Decimal(str(receivable.ammount or "0.00"))
+        amount_paid = Decimal(str(receivable.ammount_paid or "0.00"))
+        if amount_paid > 0:
+            status = ReceivableStatus.PAID
+        elif receivable.due_date and receivable.due_date < now:
+            status = ReceivableStatus.OVERDUE
+        else:
+            status = ReceivableStatus.PENDING
+        return Receivable(
+            id=receivable.id_receivable or 0,
+            description=receivable.description,
+            amount=amount,
+            amount_paid=amount_paid,
+            status=status,
+            registration_date=receivable.registration_date,
+            due_date=receivable.due_date,
+            receiving_date=receivable.receiving_date,
+            competence_date=receivable.competence_date,
+            cancellation_date=receivable.cancellation_date,
+            member_id=receivable.id_member_payer,
+            member_name=receivable.payer_name,
+            branch_id=receivable.id_branch_member,
+            sale_id=receivable.id_sale,
+            current_installment=receivable.current_installment,
+            total_installments=receivable.total_installments,
+        )
+
+    def _build_operating_data(
+        self,
+        total_active: int,
+        total_churned: int,
+        total_prospects: int,
+        total_entries: int,
+        total_mrr: Decimal,
+        total_paid: Decimal,
+        total_pending: Decimal,
+        total_overdue: Decimal,
+        from_date: Optional[datetime],
+        to_date: Optional[datetime],
+        previous_data: Optional[GymOperatingData],
+        **inputs: Any,
+    ) -> GymOperatingData:
+        """Derive the rate metrics from period totals and build the result.
+
+        Args:
+            total_active: Number of active members
+            total_churned: Number of non-renewed members
+            total_prospects: Number of prospects
+            total_entries: Number of gym entries
+            total_mrr: Sum of the active contracts' monthly values
+            total_paid: Amount of paid receivables
+            total_pending: Amount of unpaid receivables not yet due
+            total_overdue: Amount of unpaid receivables past due
+            from_date: Start date of the current period
+            to_date: End date of the current period
+            previous_data: GymOperatingData for the previous period
+            **inputs: Input record lists stored on the result
+
+        Returns:
+            GymOperatingData with computed metrics
+        """
+
         # ARR = MRR * 12
         arr = total_mrr * Decimal("12")
 
@@ -77,23 +180,6 @@ class OperatingDataComputer:
             else:
                 churn_rate = Decimal("0.00")
 
-        # Receivables metrics
-        total_paid = Decimal("0.00")
-        total_pending = Decimal("0.00")
-        total_overdue = Decimal("0.00")
-
-        now = datetime.now()
-        for r in receivables:
-            amnt = Decimal(str(r.ammount or "0.00"))
-            amnt_paid = Decimal(str(r.ammount_paid or "0.00"))
-            if amnt_paid > 0:
-                total_paid += amnt
-            else:
-                if r.due_date and r.due_date < now:
-                    total_overdue += amnt
-                else:
-                    total_pending += amnt
-
         # ARPU = MRR / total_active_members if total_active > 0
         arpu = Decimal("0.00")
         if total_active > 0:
@@ -160,18 +246,12 @@ class OperatingDataComputer:
         # If we have entries and active members,
         # average visits = total entries / total_active_members
         avg_visits_per_member = Decimal("0.00")
-        if total_active > 0 and len(entries) > 0:
-            avg_visits_per_member = Decimal(str(len(entries))) / Decimal(
+        if total_active > 0 and total_entries > 0:
+            avg_visits_per_member = Decimal(str(total_entries)) / Decimal(
                 str(total_active)
             )
 
         data = GymOperatingData(
-            active_members=[m.model_dump() for m in active_members],
-            active_contracts=[c.model_dump() for c in active_contracts],
-            prospects=[p.model_dump() for p in prospects],
-            non_renewed_members=[nm.model_dump() for nm in non_renewed],
-            receivables=[r.model_dump() for r in receivables],
-            recent_entries=[e.model_dump() for e in entries],
             cross_branch_entries=[],
             data_from=from_date,
             data_to=to_date,
@@ -187,13 +267,13 @@ class OperatingDataComputer:
             ),
             membership_growth_rate=membership_growth_rate,
             multi_unit_member_percentage=multi_unit_percentage,
-            capacity_metrics=None,
             class_attendance_rate=class_attendance_rate,
             average_visits_per_member=avg_visits_per_member,
             total_prospects=total_prospects,
             total_paid=total_paid,
             total_pending=total_pending,
             total_overdue=total_overdue,
+            **inputs,
         )
 
         # Add GRR, NRR as attributes (not originally present)
@@ -51,17 +51,26 @@ class OperatingDataFetcher:
             # Use available branch IDs if none specified
             if branch_ids is None:
                 branch_ids = self.client_manager.branch_ids
+            else:
+                branch_ids = [
+                    bid for bid in branch_ids if bid in self.client_manager.branch_ids
+                ]
 
             # Fetch data for each branch
             branch_data = []
             for branch_id in branch_ids:
                 logger.info(f"Fetching operating data for branch {branch_id}")
 
+                # Scope every dataset to this branch so each branch is swept
+                # exactly once per dataset instead of once per outer branch.
+                scope = [branch_id]
+
                 # Fetch active members
                 active_members = self.member_fetcher.fetch_members(
                     membership_start_date_start=from_date,
                     membership_start_date_end=to_date,
                     status=1,  # Assuming 1 means active
+                    branch_ids=scope,
                 )
 
                 # Fetch non-renewed members
@@ -69,26 +78,31 @@ class OperatingDataFetcher:
                     membership_cancel_date_start=from_date,
                     membership_cancel_date_end=to_date,
                     status=2,  # Assuming 2 means inactive/cancelled
+                    branch_ids=scope,
                 )
 
                 # Fetch receivables
                 receivables = self.receivables_fetcher.fetch_receivables(
-                    due_date_start=from_date, due_date_end=to_date
+                    due_date_start=from_date, due_date_end=to_date, branch_ids=scope
                 )
 
                 # Fetch entries
                 entries = self.entries_fetcher.fetch_entries(
-                    register_date_start=from_date, register_date_end=to_date
+                    register_date_start=from_date,
+                    register_date_end=to_date,
+                    branch_ids=scope,
                 )
 
                 # Fetch prospects
                 prospects = self.prospects_fetcher.fetch_prospects(
-                    register_date_start=from_date, register_date_end=to_date
+                    register_date_start=from_date,
+                    register_date_end=to_date,
+                    branch_ids=scope,
                 )
 
                 # Fetch active contracts
                 active_contracts = self.membership_fetcher.fetch_memberships(
-                    active=True
+                    active=True, branch_ids=scope
                 )
 
                 # Compute metrics for this branch
@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence
+
+from loguru import logger
+
+from ...models.gym_model import GymOperatingData
+from .vectorized_operating_data_computer import (
+    AMOUNT_COLUMN,
+    AMOUNT_PAID_COLUMN,
+    DUE_DATE_COLUMN,
+    VectorizedOperatingDataComputer,
+)
+
+
+@dataclass(frozen=True)
+class OperatingDataInputs:
+    """Compact, picklable inputs of one period's operating metrics.
+
+    Only the counts and the receivable and contract columns the metrics are
+    computed from are kept, so sending a period to a worker process costs a
+    few lists instead of a graph of Pydantic models.
+    """
+
+    total_active_members: int
+    total_churned_members: int
+    total_prospects: int = 0
+    total_entries: int = 0
+    receivables: Dict[str, List[Any]] = field(
+        default_factory=lambda: {
+            AMOUNT_COLUMN: [],
+            AMOUNT_PAID_COLUMN: [],
+            DUE_DATE_COLUMN: [],
+        }
+    )
+    contract_values: List[Any] = field(default_factory=list)
+    from_date: Optional[datetime] = None
+    to_date: Optional[datetime] = None
+
+    @classmethod
+    def from_records(
+        cls,
+        active_members: Sequence[Any],
+        prospects: Sequence[Any],
+        non_renewed: Sequence[Any],
+        receivables: Sequence[Any],
+        entries: Sequence[Any],
+        active_contracts: Sequence[Any],
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> "OperatingDataInputs":
+        """Build the inputs from the records taken by
+        :meth:`OperatingDataComputer.compute_metrics`."""
+        return cls(
+            total_active_members=len(active_members),
+            total_churned_members=len(non_renewed),
+            total_prospects=len(prospects),
+            total_entries=len(entries),
+            receivables={
+                AMOUNT_COLUMN: [r.ammount for r in receivables],
+                AMOUNT_PAID_COLUMN: [r.ammount_paid for r in receivables],
+                DUE_DATE_COLUMN: [r.due_date for r in receivables],
+            },
+            contract_values=[getattr(c, "value", None) for c in active_contracts],
+            from_date=from_date,
+            to_date=to_date,
+        )
+
+
+def compute_period_series(
+    periods: Sequence[OperatingDataInputs], now: Optional[datetime] = None
+) -> List[GymOperatingData]:
+    """Compute consecutive periods, oldest first, each compared to the one before.
+
+    Args:
+        periods: Inputs of each period, oldest first
+        now: Reference time for overdue receivables (defaults to now)
+
+    Returns:
+        GymOperatingData of each period, in the same order
+    """
+    computer = VectorizedOperatingDataComputer()
+    results: List[GymOperatingData] = []
+    previous_data: Optional[GymOperatingData] = None
+    for period in periods:
+        previous_data = computer.compute_metrics_columnar(
+            period.receivables,
+            period.contract_values,
+            total_active_members=period.total_active_members,
+            total_churned_members=period.total_churned_members,
+            total_prospects=period.total_prospects,
+            total_entries=period.total_entries,
+            from_date=period.from_date,
+            to_date=period.to_date,
+            previous_data=previous_data,
+            now=now,
+        )
+        results.append(previous_data)
+    return results
+
+
+class ParallelOperatingDataComputer:
+    """Computes the period series of many branches across worker processes.
+
+    Each series (typically one branch's previous and current periods) is
+    computed in order by one worker, since a period's GRR, NRR and churn
+    depend on the period before it. Independent series run in parallel.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Worker processes (defaults to the number of CPUs);
+                1 computes every series in the calling process
+        """
+        self.max_workers = max_workers
+
+    def compute_series(
+        self,
+        series: Mapping[Hashable, Sequence[OperatingDataInputs]],
+        now: Optional[datetime] = None,
+    ) -> Dict[Hashable, List[GymOperatingData]]:
+        """Compute every series of periods.
+
+        Args:
+            series: Period inputs, oldest first, keyed e.g. by branch ID
+            now: Reference time for overdue receivables, shared by every
+                worker (defaults to now)
+
+        Returns:
+            GymOperatingData of each period, keyed like ``series``
+        """
+        now = now or datetime.now()
+        if self.max_workers == 1 or len(series) <= 1:
+            # Starting processes costs more than a single series
+            return {
+                key: compute_period_series(periods, now)
+                for key, periods in series.items()
+            }
+
+        logger.debug(f"Computing {len(series)} operating data series in processes")
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                key: pool.submit(compute_period_series, list(periods), now)
+                for key, periods in series.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
@@ -7,6 +7,7 @@ from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar, Union, ov
 from pydantic import BaseModel
 
 from ...core.configuration import Configuration
+from ...utils.rate_limit_utils import get_shared_rate_limiter, rate_limit_key
 from .request_handler import SyncRequestHandler
 
 T = TypeVar("T", bound=BaseModel)
@@ -25,6 +26,14 @@ class SyncApiClient:
         self.configuration = configuration or Configuration()
 
         self.request_handler = SyncRequestHandler(self.configuration)
+        self.rate_limiter = get_shared_rate_limiter(
+            rate_limit_key(self.configuration),
+            max_requests=self.configuration.rate_limit_max_requests,
+            time_window=self.configuration.rate_limit_time_window,
+            burst=self.configuration.rate_limit_burst,
+            state_dir=self.configuration.rate_limit_state_dir,
+            adaptive=self.configuration.rate_limit_adaptive,
+        )
 
         # Initialize headers
         self.default_headers: Dict[str, str | None] = {}
@@ -6,7 +6,12 @@ from loguru import logger
 from pydantic import BaseModel
 
 from ...core.configuration import Configuration
+from ...core.response import RESTResponse
 from ...core.rest import RESTClient
+from ...utils.cache_utils import request_key, response_cache_for
+from ...utils.logging_utils import payload_preview
+from ...utils.record_utils import resolve_record_mode
+from ...utils.single_flight_utils import get_shared_single_flight
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -17,11 +22,24 @@ class SyncRequestHandler:
     def __init__(self, configuration: Configuration):
         self.configuration = configuration
         self.rest_client = RESTClient(configuration)
+        self.response_cache = response_cache_for(configuration)
+        self.single_flight = (
+            get_shared_single_flight() if configuration.single_flight_enabled else None
+        )
 
     def cleanup(self) -> None:
         """Cleanup resources."""
         # No thread pool to clean up in sync version
 
+    def _log_payload(self, label: str, payload: Any) -> None:
+        """Log a size-capped payload when payload logging is enabled."""
+        if payload is None or not self.configuration.log_payloads:
+            return
+        max_bytes = self.configuration.log_payload_max_bytes
+        logger.opt(lazy=True).debug(
+            label + ": {}", lambda: payload_preview(payload, max_bytes)
+        )
+
     def execute(
         self, response_type: Optional[Type[T] | Type[Iterable[T]]] = None, **kwargs
     ) -> Union[T, List[T], Any]:
@@ -72,23 +90,45 @@ class SyncRequestHandler:
         raw_response = kwargs.get("raw_response", False)
         _return_http_data_only = kwargs.get("_return_http_data_only", True)
 
-        # Log the full URL and request details
-        logger.debug(f"Making {method} request to {url}")
-        logger.debug(f"Host: {self.configuration.host}")
-        logger.debug(f"Resource path: {kwargs.get('resource_path', '')}")
+        # Messages are formatted by loguru only when debug logging is on
+        logger.debug("Making {} request to {}", method, url)
 
         # Prepare request parameters
         headers = self._prepare_headers(kwargs.get("header_params"))
         query_params = self._prepare_params(kwargs.get("query_params"))
         body = kwargs.get("body")
 
-        logger.debug(f"Request headers: {headers}")
-        logger.debug(f"Request body: {body}")
+        logger.debug("Request headers: {}", headers)
+        self._log_payload("Request body", body)
 
         request_options = self._get_request_options(kwargs)
 
-        try:
-            response = self.rest_client.request(
+        # Only deserialized responses are cached; raw callers get the live one
+        cache = self.response_cache
+        cache_key, cache_ttl = None, 0.0
+        if cache and not raw_response and _return_http_data_only:
+            cache_ttl = cache.ttl_for(method, kwargs.get("resource_path", ""))
+            if cache_ttl > 0:
+                cache_key = cache.key(
+                    self.configuration,
+                    method,
+                    kwargs.get("resource_path", ""),
+                    query_params,
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Serving {} {} from the response cache", method, url)
+                    return self._process_response(
+                        RESTResponse.from_content(
+                            cached.status, cached.headers, cached.data
+                        ),
+                        response_type,
+                        raw_response,
+                        _return_http_data_only,
+                    )
+
+        def send() -> RESTResponse:
+            return self.rest_client.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -99,9 +139,43 @@ class SyncRequestHandler:
                 request_timeout=request_options["request_timeout"],
             )
 
-            logger.debug(f"Response status: {response.status}")
-            logger.debug(f"Response headers: {response.getheaders()}")
-            logger.debug(f"Raw response data: {response.data}")
+        try:
+            # Concurrent identical GETs share one request
+            if self.single_flight and method.upper() == "GET" and body is None:
+                sent: List[RESTResponse] = []
+
+                def lead() -> RESTResponse:
+                    sent.append(send())
+                    return sent[0]
+
+                response = self.single_flight.do(
+                    request_key(self.configuration, method, url, query_params), lead
+                )
+                if not sent:
+                    # Followers parse their own copy, so no parsed body is shared
+                    response = RESTResponse.from_content(
+                        response.status,
+                        response.getheaders(),
+                        response.data,
+                        reason=response.reason,
+                    )
+            else:
+                response = send()
+
+            logger.debug("Response status: {}", response.status)
+            logger.opt(lazy=True).debug(
+                "Response headers: {}", lambda: response.getheaders()
+            )
+            self._log_payload("Response body", response.data)
+
+            if cache and cache_key is not None:
+                cache.put(
+                    cache_key,
+                    cache_ttl,
+                    response.status,
+                    response.getheaders(),
+                    response.data,
+                )
 
             return self._process_response(
                 response, response_type, raw_response, _return_http_data_only
@@ -125,19 +199,12 @@ class SyncRequestHandler:
             logger.debug("Returning raw response")
             return response
 
-        # Try to decode response data
-        decoded_data = None
-        if isinstance(response.data, bytes):
-            try:
-                decoded_data = response.data.decode("utf-8", errors="replace")
-                logger.debug(f"Decoded response: {decoded_data}")
-            except Exception as e:
-                logger.warning(f"Failed to decode response: {e}")
-
         # If a specific response type is expected, try to deserialize
         if response_type:
             try:
-                return response.deserialize(response_type)
+                return response.deserialize(
+                    response_type, resolve_record_mode(self.configuration)
+                )
             except Exception as e:
                 logger.warning(f"Failed to deserialize response: {e}")
                 if 200 <= response.status < 300:
@@ -147,18 +214,8 @@ class SyncRequestHandler:
                     return response
                 raise ValueError(f"Failed to deserialize response: {str(e)}")
 
-        # Try to parse as JSON
+        # Parse as JSON; the response parses its body only once
         try:
-            # Try to use the decoded data first if available
-            if decoded_data:
-                try:
-                    import json
-
-                    return json.loads(decoded_data)
-                except json.JSONDecodeError:
-                    pass
-
-            # Fall back to response's json method
             return response.json()
         except Exception as e:
             logger.warning(f"Failed to parse response as JSON: {e}")
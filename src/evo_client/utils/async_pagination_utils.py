@@ -2,10 +2,13 @@
 
 import asyncio
 import time
+from collections import deque
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
     Dict,
     List,
     Optional,
@@ -18,7 +21,9 @@ from typing import (
 from loguru import logger
 
 from ..exceptions.api_exceptions import ApiException
+from .checkpoint_utils import CheckpointStore, checkpoint_for_call
 from .pagination_utils import PaginationConfig, PaginationResult, RetryConfig
+from .rate_limit_utils import AsyncTokenBucketRateLimiter, get_rate_limit_info
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -57,24 +62,29 @@ class AsyncRateLimiter:
         """Wait until a request can be made, respecting rate limits."""
         async with self._lock:
             now = time.time()
-            # Remove old requests outside the time window
-            self.requests = [t for t in self.requests if now - t < self.time_window]
-
+            # Remove old requests outside the time window (timestamps are sorted)
+            expired = 0
+            while (
+                expired < len(self.requests)
+                and now - self.requests[expired] >= self.time_window
+            ):
+                expired += 1
+            if expired:
+                del self.requests[:expired]
+
+            slot = now
             if len(self.requests) >= self.max_requests:
-                # Calculate sleep time until we can make another request
-                sleep_time = self.requests[0] + self.time_window - now
-                if sleep_time > 0:
-                    logger.warning(
-                        f"Rate limit reached, waiting {sleep_time:.2f}s before next request"
-                    )
-                    await asyncio.sleep(sleep_time)
-                    # Clean old requests again after sleeping
-                    now = time.time()
-                    self.requests = [
-                        t for t in self.requests if now - t < self.time_window
-                    ]
-
-            self.requests.append(now)
+                # Reserve the slot freed when the max_requests-th most recent
+                # request leaves the window; sleep after releasing the lock.
+                slot = self.requests[-self.max_requests] + self.time_window
+            self.requests.append(slot)
+
+        sleep_time = slot - now
+        if sleep_time > 0:
+            logger.warning(
+                f"Rate limit reached, waiting {sleep_time:.2f}s before next request"
+            )
+            await asyncio.sleep(sleep_time)
 
     async def reset(self) -> None:
         """Reset the rate limiter state (useful for testing)."""
@@ -130,6 +140,11 @@ class AsyncRetryHandler:
         else:
             delay = self.config.base_delay
 
+        # Prefer the structured Retry-After / X-RateLimit-* headers
+        info = get_rate_limit_info(exception)
+        if info is not None and info.is_rate_limited and info.wait_time is not None:
+            return max(delay, info.wait_time)
+
         # Handle rate limiting (429 Too Many Requests)
         error_msg = str(exception)
         if "429" in error_msg or "Too Many Requests" in error_msg:
@@ -150,6 +165,17 @@ class AsyncApiCallExecutor:
         self.rate_limiter = rate_limiter or AsyncRateLimiter()
         self.retry_handler = retry_handler or AsyncRetryHandler(RetryConfig())
 
+    def _notify_rate_limiter(self, exception: Optional[Exception] = None) -> None:
+        """Feed the request outcome back to limiters that adapt to the server."""
+        if not isinstance(self.rate_limiter, AsyncTokenBucketRateLimiter):
+            return
+        if exception is None:
+            self.rate_limiter.on_success()
+            return
+        info = get_rate_limit_info(exception)
+        if info is not None and info.is_rate_limited:
+            self.rate_limiter.on_rate_limited(info)
+
     async def execute_with_retry(
         self,
         api_func: Callable[P, Awaitable[T]],
@@ -177,11 +203,13 @@ class AsyncApiCallExecutor:
 
             try:
                 result = await api_func(*args, **kwargs)
+                self._notify_rate_limiter()
                 if attempt > 1:
                     logger.info(f"{context} succeeded on attempt {attempt}")
                 return result
 
             except (ApiException, Exception) as e:
+                self._notify_rate_limiter(e)
                 logger.warning(
                     f"{context} failed on attempt {attempt}/{self.retry_handler.config.max_retries}: {e}"
                 )
@@ -218,6 +246,86 @@ class AsyncPaginatedApiCaller:
         else:  # "page_page_size"
             return {"page": page, "page_size": config.page_size}
 
+    def _resolve_branch_logging(
+        self, func_name: str, branch_id_logging: str, kwargs: Dict[str, Any]
+    ) -> str:
+        """Resolve the branch identifier used in log messages."""
+        if branch_id_logging == "NOT INFORMED":
+            logger.warning(
+                f"Branch ID not informed for {func_name}, using default branch ID"
+            )
+            branch_id_logging = str(kwargs.get("branch_id_logging", "NOT INFORMED"))
+        return branch_id_logging
+
+    async def iter_pages(
+        self,
+        api_func: Callable[P, Awaitable[List[T]]],
+        config: Optional[PaginationConfig] = None,
+        branch_id_logging: str = "unknown",
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[List[T]]:
+        """
+        Lazily fetch the pages of a paginated API, one page per iteration.
+
+        The next page is only requested once the consumer asks for it (or, with
+        a prefetch window, at most ``prefetch_window`` pages ahead), so callers
+        can process and discard records with bounded memory.
+
+        Args:
+            api_func: Async API function to call
+            config: Pagination configuration (uses default if None)
+            branch_id_logging: Identifier for logging context
+            **kwargs: Additional keyword arguments for the API function
+
+        Yields:
+            The items of each non-empty page, in order
+
+        Raises:
+            Exception: The error of a failed page, after the pages before it
+        """
+        config = config or self.default_config
+        func_name = getattr(api_func, "__name__", "unknown_function")
+        branch_id_logging = self._resolve_branch_logging(
+            func_name, branch_id_logging, kwargs
+        )
+        async for page in self._iter_pages(
+            api_func,
+            config,
+            func_name,
+            branch_id_logging,
+            args,
+            kwargs,
+            PaginationResult(data=[]),
+        ):
+            yield page
+
+    async def iter_items(
+        self,
+        api_func: Callable[P, Awaitable[List[T]]],
+        config: Optional[PaginationConfig] = None,
+        branch_id_logging: str = "unknown",
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[T]:
+        """
+        Lazily fetch the items of a paginated API, one item per iteration.
+
+        Args:
+            api_func: Async API function to call
+            config: Pagination configuration (uses default if None)
+            branch_id_logging: Identifier for logging context
+            **kwargs: Additional keyword arguments for the API function
+
+        Yields:
+            Every item of every page, in order
+        """
+        async for page in self.iter_pages(
+            api_func, config, branch_id_logging, *args, **kwargs
+        ):
+            for item in page:
+                yield item
+
     async def fetch_all_pages(
         self,
         api_func: Callable[P, Awaitable[List[T]]],
@@ -239,93 +347,213 @@ class AsyncPaginatedApiCaller:
             PaginationResult with data and metadata
         """
         config = config or self.default_config
-        results: List[T] = []
-        page = 0
-        total_requests = 0
-        total_retries = 0
+        if config.checkpoint:
+            # A resumed call would return only the remaining pages
+            raise ValueError(
+                "Pagination checkpoints require streaming the pages with iter_pages"
+            )
+        result = PaginationResult(data=[])
 
         # Extract branch_id for logging, default to "unknown"
         func_name = getattr(api_func, "__name__", "unknown_function")
-        if branch_id_logging == "NOT INFORMED":
-            logger.warning(
-                f"Branch ID not informed for {func_name}, using default branch ID"
-            )
-            branch_id_logging = str(kwargs.get("branch_id_logging", "NOT INFORMED"))
+        branch_id_logging = self._resolve_branch_logging(
+            func_name, branch_id_logging, kwargs
+        )
 
         logger.debug(
             f"Starting async paginated fetch for {func_name} (branch: {branch_id_logging})"
         )
 
         try:
-            while True:
-                # Build call arguments
-                if config.supports_pagination:
-                    pagination_params = self._build_pagination_params(page, config)
-                    kwargs.update(pagination_params)
+            async for page in self._iter_pages(
+                api_func, config, func_name, branch_id_logging, args, kwargs, result
+            ):
+                result.data.extend(page)
+        except Exception as e:
+            # Failed API calls already marked the result; anything else is unexpected
+            if result.success:
+                logger.error(f"Unexpected error in async paginated fetch: {e}")
+            result.success = False
+            result.error_message = str(e)
+            return result
 
-                context = f"{func_name} page {page} (branch: {branch_id_logging})"
+        logger.debug(
+            f"Completed async paginated fetch for {func_name}: {len(result.data)} items, "
+            f"{result.total_requests} requests, {result.total_retries} retries"
+        )
 
-                try:
-                    # Execute API call with retry logic
-                    page_result = await self.executor.execute_with_retry(
-                        api_func, context, *args, **kwargs
-                    )
-                    total_requests += 1
-
-                    # Add delay after successful request
-                    if config.post_request_delay > 0:
-                        await asyncio.sleep(config.post_request_delay)
-
-                except Exception as e:
-                    total_retries += self.executor.retry_handler.config.max_retries
-                    return PaginationResult(
-                        data=results,
-                        success=False,
-                        error_message=str(e),
-                        total_requests=total_requests,
-                        total_retries=total_retries,
-                    )
-
-                # Process results
-                if not page_result:
-                    break
-
-                if isinstance(page_result, list):
-                    results.extend(page_result)
-                    # Check if we got fewer results than requested (last page)
-                    if (
-                        len(page_result) < config.page_size
-                        or not config.supports_pagination
-                    ):
-                        break
-                else:
-                    # Single result (non-list response)
-                    results.append(page_result)
-                    break
-
-                page += 1
+        return result
 
-        except Exception as e:
-            logger.error(f"Unexpected error in async paginated fetch: {e}")
-            return PaginationResult(
-                data=results,
-                success=False,
-                error_message=str(e),
-                total_requests=total_requests,
-                total_retries=total_retries,
+    async def _call_page(
+        self,
+        api_func: Callable[..., Awaitable[List[T]]],
+        config: PaginationConfig,
+        context: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Execute one page request with retries."""
+        page_result = await self.executor.execute_with_retry(
+            api_func, context, *args, **kwargs
+        )
+
+        # Add delay after successful request
+        if config.post_request_delay > 0:
+            await asyncio.sleep(config.post_request_delay)
+        return page_result
+
+    def _record_failure(self, stats: PaginationResult) -> None:
+        """Mark ``stats`` as failed by an API call that exhausted its retries."""
+        stats.total_retries += self.executor.retry_handler.config.max_retries
+        stats.success = False
+
+    async def _iter_pages(
+        self,
+        api_func: Callable[..., Awaitable[List[T]]],
+        config: PaginationConfig,
+        func_name: str,
+        branch_id_logging: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        stats: PaginationResult,
+    ) -> AsyncIterator[List[T]]:
+        """Yield pages in order, counting requests and retries into ``stats``.
+
+        With a checkpoint, fetching starts at the recorded page and the
+        checkpoint advances once the consumer asks for the page after the
+        one it was given, so a page is only skipped after it was processed.
+        """
+        checkpoint = config.checkpoint if config.supports_pagination else None
+        start_page = checkpoint.load() if checkpoint else 0
+        if start_page:
+            logger.info(
+                f"Resuming {func_name} at page {start_page} "
+                f"(branch: {branch_id_logging})"
             )
 
-        logger.debug(
-            f"Completed async paginated fetch for {func_name}: {len(results)} items, "
-            f"{total_requests} requests, {total_retries} retries"
+        iter_numbered = (
+            self._iter_pages_prefetched
+            if config.prefetches
+            else self._iter_pages_sequential
         )
+        async for page_number, items in iter_numbered(
+            api_func,
+            config,
+            func_name,
+            branch_id_logging,
+            args,
+            kwargs,
+            stats,
+            start_page,
+        ):
+            yield items
+            if checkpoint:
+                checkpoint.advance(page_number + 1)
+
+        if checkpoint:
+            checkpoint.complete()
+
+    async def _iter_pages_sequential(
+        self,
+        api_func: Callable[..., Awaitable[List[T]]],
+        config: PaginationConfig,
+        func_name: str,
+        branch_id_logging: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        stats: PaginationResult,
+        start_page: int,
+    ) -> AsyncIterator[Tuple[int, List[T]]]:
+        """Yield numbered pages one request at a time."""
+        page_number = start_page
+        while True:
+            # Build call arguments
+            if config.supports_pagination:
+                kwargs.update(self._build_pagination_params(page_number, config))
+
+            context = f"{func_name} page {page_number} (branch: {branch_id_logging})"
+            try:
+                page_result = await self._call_page(
+                    api_func, config, context, args, kwargs
+                )
+            except Exception:
+                self._record_failure(stats)
+                raise
+            stats.total_requests += 1
 
-        return PaginationResult(
-            data=results,
-            success=True,
-            total_requests=total_requests,
-            total_retries=total_retries,
-        )
+            # Process results
+            if not page_result:
+                return
+
+            if not isinstance(page_result, list):
+                # Single result (non-list response)
+                yield page_number, [page_result]
+                return
+
+            yield page_number, page_result
+            # Fewer results than requested means this was the last page
+            if len(page_result) < config.page_size or not config.supports_pagination:
+                return
+
+            page_number += 1
+
+    async def _iter_pages_prefetched(
+        self,
+        api_func: Callable[..., Awaitable[List[T]]],
+        config: PaginationConfig,
+        func_name: str,
+        branch_id_logging: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        stats: PaginationResult,
+        start_page: int,
+    ) -> AsyncIterator[Tuple[int, List[T]]]:
+        """Yield numbered skip/take pages keeping up to ``prefetch_window`` in flight.
+
+        The first page is requested alone and the window doubles after each
+        full page, so a query that fits in one page costs one request. Pages
+        are consumed in order; once a short or empty page is seen no further
+        pages are requested and speculative ones are cancelled. Every request
+        still goes through the executor, so the rate limiter governs how fast
+        the window is refilled.
+        """
+        next_page = start_page
+        window = 1
+        pending: Deque[Tuple[int, asyncio.Task]] = deque()
+
+        async def fetch_page(page: int) -> Any:
+            page_kwargs = {**kwargs, **self._build_pagination_params(page, config)}
+            context = f"{func_name} page {page} (branch: {branch_id_logging})"
+            return await self._call_page(api_func, config, context, args, page_kwargs)
+
+        try:
+            while True:
+                while len(pending) < window:
+                    task = asyncio.ensure_future(fetch_page(next_page))
+                    pending.append((next_page, task))
+                    next_page += 1
+
+                page, task = pending.popleft()
+                try:
+                    page_result = await task
+                except Exception:
+                    self._record_failure(stats)
+                    raise
+                stats.total_requests += 1
+
+                if not page_result:
+                    return
+                if not isinstance(page_result, list):
+                    yield page, [page_result]
+                    return
+                yield page, page_result
+                if len(page_result) < config.page_size:
+                    return
+                window = min(window * 2, config.prefetch_window)
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -338,7 +566,10 @@ class AsyncPaginatedApiCaller:
 
 # Factory function for async pagination
 def create_async_paginated_caller(
-    max_requests_per_minute: int = 40, max_retries: int = 5, base_delay: float = 1.5
+    max_requests_per_minute: int = 40,
+    max_retries: int = 5,
+    base_delay: float = 1.5,
+    rate_limiter: Optional[AsyncRateLimiterProtocol] = None,
 ) -> AsyncPaginatedApiCaller:
     """
     Create a configured AsyncPaginatedApiCaller instance.
@@ -347,13 +578,15 @@ def create_async_paginated_caller(
         max_requests_per_minute: Rate limit for API calls
         max_retries: Maximum retry attempts
         base_delay: Base delay for exponential backoff
+        rate_limiter: Shared rate limiter to use instead of a private one
 
     Returns:
         Configured AsyncPaginatedApiCaller instance
     """
-    rate_limiter = AsyncRateLimiter(
-        max_requests=max_requests_per_minute, time_window=60
-    )
+    if rate_limiter is None:
+        rate_limiter = AsyncRateLimiter(
+            max_requests=max_requests_per_minute, time_window=60
+        )
     retry_handler = AsyncRetryHandler(
         RetryConfig(max_retries=max_retries, base_delay=base_delay)
     )
@@ -440,6 +673,25 @@ class ConcurrentPaginationManager:
         return branch_results
 
 
+def get_async_client_rate_limiter(
+    api_func: Callable,
+) -> Optional[AsyncTokenBucketRateLimiter]:
+    """Return the shared rate limiter of the async client behind a bound API method.
+
+    Args:
+        api_func: Bound method of an async API class
+
+    Returns:
+        The client's shared limiter, or None if the function is not bound to an
+        API instance whose client carries one
+    """
+    api_client = getattr(getattr(api_func, "__self__", None), "api_client", None)
+    rate_limiter = getattr(api_client, "rate_limiter", None)
+    if isinstance(rate_limiter, AsyncTokenBucketRateLimiter):
+        return rate_limiter
+    return None
+
+
 # Backward compatibility function
 async def async_paginated_api_call(
     api_func: Callable[P, Awaitable[List[T]]],
@@ -449,7 +701,8 @@ async def async_paginated_api_call(
     supports_pagination: bool = True,
     pagination_type: str = "skip_take",
     branch_id_logging: str = "NOT INFORMED",
-    post_request_delay: float = 1.0,
+    post_request_delay: float = 0.0,
+    prefetch_window: int = 1,
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> List[T]:
@@ -464,7 +717,9 @@ async def async_paginated_api_call(
         supports_pagination: Whether the API supports pagination
         pagination_type: Type of pagination ('skip_take' or 'page_page_size')
         branch_id: Identifier for the branch/unit being processed
-        post_request_delay: Delay in seconds after each successful API call
+        post_request_delay: Optional fixed delay in seconds after each successful
+            API call (off by default; the rate limiter paces requests)
+        prefetch_window: Number of skip/take pages kept in flight at once
         *args: Additional arguments for the API function
         **kwargs: Additional arguments to pass to the API function
 
@@ -478,10 +733,14 @@ async def async_paginated_api_call(
         supports_pagination=supports_pagination,
         pagination_type=pagination_type,
         post_request_delay=post_request_delay,
+        prefetch_window=prefetch_window,
     )
 
+    # Draw from the credential-wide budget shared by every client using it
     caller = create_async_paginated_caller(
-        max_retries=max_retries, base_delay=base_delay
+        max_retries=max_retries,
+        base_delay=base_delay,
+        rate_limiter=get_async_client_rate_limiter(api_func),
     )
     result = await caller.fetch_all_pages(
         api_func, config, branch_id_logging, *args, **kwargs
@@ -493,3 +752,73 @@ async def async_paginated_api_call(
         )
 
     return result.data
+
+
+async def async_iter_pages(
+    api_func: Callable[P, Awaitable[List[T]]],
+    page_size: int = 50,
+    max_retries: int = 5,
+    base_delay: float = 1.5,
+    supports_pagination: bool = True,
+    pagination_type: str = "skip_take",
+    branch_id_logging: str = "NOT INFORMED",
+    post_request_delay: float = 0.0,
+    prefetch_window: int = 1,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[List[T]]:
+    """
+    Stream the pages of an async paginated API instead of accumulating them.
+
+    Takes the same arguments as :func:`async_paginated_api_call`. Unlike it, a
+    failed page is not swallowed: the error is raised once the pages before it
+    have been yielded.
+
+    With a ``checkpoint_store`` recording the last completed page, an
+    interrupted stream resumes after the pages already yielded.
+
+    Yields:
+        The items of each non-empty page, in order
+    """
+    config = PaginationConfig(
+        page_size=page_size,
+        max_retries=max_retries,
+        base_delay=base_delay,
+        supports_pagination=supports_pagination,
+        pagination_type=pagination_type,
+        post_request_delay=post_request_delay,
+        prefetch_window=prefetch_window,
+        checkpoint=checkpoint_for_call(
+            checkpoint_store, api_func, branch_id_logging, kwargs, page_size
+        ),
+    )
+
+    # Draw from the credential-wide budget shared by every client using it
+    caller = create_async_paginated_caller(
+        max_retries=max_retries,
+        base_delay=base_delay,
+        rate_limiter=get_async_client_rate_limiter(api_func),
+    )
+    async for page in caller.iter_pages(
+        api_func, config, branch_id_logging, *args, **kwargs
+    ):
+        yield page
+
+
+async def async_iter_items(
+    api_func: Callable[P, Awaitable[List[T]]],
+    *args: Any,
+    **kwargs: Any,
+) -> AsyncIterator[T]:
+    """
+    Stream the items of an async paginated API one at a time.
+
+    Takes the same arguments as :func:`async_iter_pages`.
+
+    Yields:
+        Every item of every page, in order
+    """
+    async for page in async_iter_pages(api_func, *args, **kwargs):
+        for item in page:
+            yield item
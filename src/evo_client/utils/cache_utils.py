@@ -0,0 +1,445 @@
+"""Response caching for API endpoints.
+
+Reference data such as branch configurations, card flags, membership
+categories, states and services rarely changes, yet it is requested on every
+knowledge-base build and CLI call. Successful JSON responses of those
+endpoints are cached by the request handlers for a per-endpoint TTL.
+
+Backends are registered per cache directory (or in memory) and shared by all
+sync and async clients in the process, like the rate limiters; the on-disk
+backend also shares entries across processes, e.g. between CLI invocations.
+
+Responses of reference-data and catalog paths carrying an ``ETag`` or
+``Last-Modified`` validator can also be kept for revalidation: repeat GETs
+send ``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified`` answer
+is served from the stored body. Servers that do not send validators simply get
+plain requests.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock as ThreadLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
+
+from loguru import logger
+
+# Seconds each GET endpoint is cached for; paths must match exactly
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "/api/v1/configuration": 3600,
+    "/api/v1/configuration/card-flags": 86400,
+    "/api/v1/membership/category": 3600,
+    "/api/v1/states": 86400,
+    "/api/v1/service": 3600,
+}
+
+# GET paths revalidated by default: reference data and catalogs re-read often.
+# Bulk paginated endpoints (members, entries, receivables...) are left out so
+# their pages never crowd the shared backend; paths must match exactly
+DEFAULT_REVALIDATION_PATHS: Tuple[str, ...] = (
+    *DEFAULT_CACHE_TTLS,
+    "/api/v1/activities",
+    "/api/v1/bank-accounts",
+    "/api/v1/membership",
+    "/api/v2/membership",
+)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Status, headers and body of a cached HTTP response."""
+
+    status: int
+    headers: Dict[str, str]
+    data: bytes
+
+
+class CacheBackend(Protocol):
+    """Protocol for response cache storage."""
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the unexpired response stored under ``key``."""
+        ...
+
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        """Store a response under ``key`` for ``ttl`` seconds."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Drop the response stored under ``key``."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        ...
+
+
+class TTLCache:
+    """In-memory LRU cache whose entries expire after their TTL."""
+
+    def __init__(
+        self, max_entries: int = 256, clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            clock: Source of the current time in seconds
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._lock = ThreadLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the unexpired response stored under ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        """Store a response under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Drop the response stored under ``key``."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """Cache storing each response as a JSON file in a directory.
+
+    Entries survive the process, so separate CLI invocations share them. When
+    more than ``max_entries`` files exist the oldest written are evicted.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the entries; created on first write
+            max_entries: Entries kept before the oldest written is evicted
+            clock: Source of the current wall-clock time in seconds
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = ThreadLock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the unexpired response stored under ``key``."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            if entry["expires_at"] <= self._clock():
+                path.unlink(missing_ok=True)
+                return None
+            return CachedResponse(
+                status=entry["status"],
+                headers=entry["headers"],
+                data=base64.b64decode(entry["data"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        """Store a response under ``key`` for ``ttl`` seconds."""
+        entry = {
+            "expires_at": self._clock() + ttl,
+            "status": value.status,
+            "headers": value.headers,
+            "data": base64.b64encode(value.data).decode("ascii"),
+        }
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Replace atomically so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = list(self.directory.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda path: path.stat().st_mtime)
+        for path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        """Drop the response stored under ``key``."""
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+def request_key(
+    configuration: Any,
+    method: str,
+    url: str,
+    query_params: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """Return the cache key of a request.
+
+    Responses depend on the credential (each gym sees its own branches), so
+    a hash of the username and password is part of the key: a changed
+    password never reuses responses cached under the old one.
+    """
+    query = "&".join(
+        f"{name}={value}" for name, value in sorted((query_params or {}).items())
+    )
+    credential = "\0".join(
+        getattr(configuration, name, None) or "" for name in ("username", "password")
+    )
+    credential_hash = hashlib.sha256(credential.encode()).hexdigest()[:16]
+    return f"{credential_hash} {method.upper()} {url}?{query}"
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Look a header up case-insensitively."""
+    name = name.lower()
+    return next((v for k, v in headers.items() if k.lower() == name), None)
+
+
+def _is_json_success(status: int, headers: Mapping[str, str]) -> bool:
+    content_type = _header(headers, "Content-Type") or ""
+    return 200 <= status < 300 and "application/json" in content_type.lower()
+
+
+class ResponseCache:
+    """Decides which requests are cached and for how long."""
+
+    def __init__(
+        self, backend: CacheBackend, ttls: Optional[Mapping[str, float]] = None
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            backend: Storage for the cached responses
+            ttls: Seconds each GET path is cached for (defaults to
+                DEFAULT_CACHE_TTLS); paths without a positive TTL are not cached
+        """
+        self.backend = backend
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+
+    def ttl_for(self, method: str, resource_path: str) -> float:
+        """Return how long a request is cached for, 0 if it is not cacheable."""
+        if method.upper() != "GET":
+            return 0
+        return max(self.ttls.get(resource_path, 0), 0)
+
+    @staticmethod
+    def key(
+        configuration: Any,
+        method: str,
+        resource_path: str,
+        query_params: Optional[Mapping[str, Any]] = None,
+    ) -> str:
+        """Return the cache key of a request, see :func:`request_key`."""
+        return request_key(
+            configuration,
+            method,
+            getattr(configuration, "host", "") + resource_path,
+            query_params,
+        )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for ``key``, if any."""
+        return self.backend.get(key)
+
+    def put(
+        self,
+        key: str,
+        ttl: float,
+        status: int,
+        headers: Mapping[str, str],
+        data: bytes,
+    ) -> None:
+        """Cache a response if it is a successful JSON response."""
+        if _is_json_success(status, headers):
+            self.backend.set(key, CachedResponse(status, dict(headers), data), ttl)
+
+
+class RevalidationCache:
+    """Keeps validated GET responses so repeat requests can be conditional."""
+
+    # Keeps entries apart from the response cache sharing the backend
+    KEY_PREFIX = "revalidate:"
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_age: float = 86400,
+        paths: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the revalidation cache.
+
+        Args:
+            backend: Storage for the validated responses
+            max_age: Seconds a stored body is kept for revalidation
+            paths: GET paths revalidated (defaults to DEFAULT_REVALIDATION_PATHS)
+        """
+        self.backend = backend
+        self.max_age = max_age
+        self.paths = frozenset(DEFAULT_REVALIDATION_PATHS if paths is None else paths)
+
+    def applies_to(self, method: str, resource_path: str) -> bool:
+        """Return whether a request is revalidated."""
+        return method.upper() == "GET" and resource_path in self.paths
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the stored response for ``key``, if any."""
+        return self.backend.get(self.KEY_PREFIX + key)
+
+    @staticmethod
+    def conditional_headers(cached: CachedResponse) -> Dict[str, str]:
+        """Return the headers asking the server to revalidate ``cached``."""
+        headers = {}
+        etag = _header(cached.headers, "ETag")
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = _header(cached.headers, "Last-Modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def put(
+        self, key: str, status: int, headers: Mapping[str, str], data: bytes
+    ) -> None:
+        """Store a successful JSON response if it carries a validator."""
+        if not _is_json_success(status, headers):
+            return
+        if _header(headers, "ETag") or _header(headers, "Last-Modified"):
+            self.backend.set(
+                self.KEY_PREFIX + key,
+                CachedResponse(status, dict(headers), data),
+                self.max_age,
+            )
+
+
+_shared_backends: Dict[str, CacheBackend] = {}
+_registry_lock = ThreadLock()
+
+
+def get_shared_cache_backend(
+    cache_dir: Optional[str] = None, max_entries: int = 256
+) -> CacheBackend:
+    """Get the process-wide cache backend for a directory, or in memory.
+
+    The first call for a directory creates the backend; later calls return the
+    same instance regardless of ``max_entries``.
+    """
+    registry_key = cache_dir or ":memory:"
+    with _registry_lock:
+        backend = _shared_backends.get(registry_key)
+        if backend is None:
+            if cache_dir is None:
+                backend = TTLCache(max_entries=max_entries)
+            else:
+                backend = DiskCache(cache_dir, max_entries=max_entries)
+            _shared_backends[registry_key] = backend
+        return backend
+
+
+def response_cache_for(configuration: Any) -> Optional[ResponseCache]:
+    """Build the response cache a configuration asks for, if enabled.
+
+    ``response_cache_ttls`` overrides DEFAULT_CACHE_TTLS per path; a TTL of 0
+    disables caching of that path.
+    """
+    if not getattr(configuration, "response_cache_enabled", False):
+        return None
+    backend = get_shared_cache_backend(
+        configuration.response_cache_dir, configuration.response_cache_max_entries
+    )
+    return ResponseCache(
+        backend, {**DEFAULT_CACHE_TTLS, **configuration.response_cache_ttls}
+    )
+
+
+def revalidation_cache_for(configuration: Any) -> Optional[RevalidationCache]:
+    """Build the revalidation cache a configuration asks for, if enabled.
+
+    It shares the backend of the response cache, so both live in the same
+    directory (or memory) and obey the same entry limit. Only the paths in
+    ``conditional_requests_paths`` (DEFAULT_REVALIDATION_PATHS if unset) are
+    revalidated, so bulk pulls do not evict the cached reference data.
+    """
+    if not getattr(configuration, "conditional_requests_enabled", False):
+        return None
+    backend = get_shared_cache_backend(
+        configuration.response_cache_dir, configuration.response_cache_max_entries
+    )
+    return RevalidationCache(
+        backend,
+        configuration.conditional_requests_max_age,
+        configuration.conditional_requests_paths,
+    )
+
+
+def clear_shared_response_caches() -> None:
+    """Drop every registered backend (useful for testing)."""
+    with _registry_lock:
+        _shared_backends.clear()
@@ -0,0 +1,207 @@
+"""Resumable pagination checkpoints for long-running paginated pulls.
+
+A checkpoint records the next page to request for one paginated query,
+identified by endpoint, branch and filters. Interrupted exports resume from
+that page instead of starting again from the first one.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock as ThreadLock
+from typing import Any, Callable, Dict, Mapping, Optional, Protocol, Union
+
+# Arguments that move between pages and must not be part of the query identity
+_PAGINATION_ARGS = frozenset({"skip", "take", "page", "page_size"})
+
+
+class CheckpointStore(Protocol):
+    """Protocol for checkpoint store implementations."""
+
+    def get(self, key: str) -> Optional[int]:
+        """Return the next page to fetch for ``key``, if one was recorded."""
+        ...
+
+    def save(self, key: str, next_page: int) -> None:
+        """Record that every page before ``next_page`` has been processed."""
+        ...
+
+    def clear(self, key: str) -> None:
+        """Forget the checkpoint for ``key``."""
+        ...
+
+
+def checkpoint_key(
+    endpoint: str,
+    branch_id: Union[int, str],
+    filters: Mapping[str, Any],
+    page_size: int,
+) -> str:
+    """Build a stable checkpoint key for a paginated query.
+
+    Args:
+        endpoint: Name of the paginated API function, e.g. "get_receivables"
+        branch_id: Branch the query runs against
+        filters: Query arguments; pagination arguments and None values are ignored
+        page_size: Page size, since a page number only means something for one size
+
+    Returns:
+        Key of the form ``"<endpoint>:<branch_id>:<page_size>:<filters digest>"``
+    """
+    identity = {
+        name: value
+        for name, value in filters.items()
+        if name not in _PAGINATION_ARGS and value is not None
+    }
+    encoded = json.dumps(identity, sort_keys=True, default=str)
+    digest = hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+    return f"{endpoint}:{branch_id}:{page_size}:{digest}"
+
+
+def checkpoint_for_call(
+    store: Optional["CheckpointStore"],
+    api_func: Callable,
+    branch_id: Union[int, str],
+    filters: Mapping[str, Any],
+    page_size: int,
+) -> Optional["PaginationCheckpoint"]:
+    """Bind a paginated API call to its checkpoint in ``store``.
+
+    Args:
+        store: Checkpoint store, or None to disable checkpointing
+        api_func: The paginated API function being called
+        branch_id: Branch the query runs against
+        filters: Keyword arguments passed to the API function
+        page_size: Page size of the query
+
+    Returns:
+        The call's checkpoint, or None when no store is given
+    """
+    if store is None:
+        return None
+    endpoint = getattr(api_func, "__name__", "unknown_function")
+    return PaginationCheckpoint(
+        store, checkpoint_key(endpoint, branch_id, filters, page_size)
+    )
+
+
+class JsonCheckpointStore:
+    """Checkpoint store persisted as a single JSON file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the store.
+
+        Args:
+            path: JSON file holding the checkpoints; created on first save
+        """
+        self.path = Path(path)
+        self._lock = ThreadLock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _dump(self, checkpoints: Dict[str, Dict[str, Any]]) -> None:
+        # Write to a temporary file first so a crash never leaves a torn file
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(checkpoints, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[int]:
+        """Return the next page to fetch for ``key``, if one was recorded."""
+        with self._lock:
+            checkpoint = self._load().get(key)
+        return None if checkpoint is None else int(checkpoint["next_page"])
+
+    def save(self, key: str, next_page: int) -> None:
+        """Record that every page before ``next_page`` has been processed."""
+        with self._lock:
+            checkpoints = self._load()
+            checkpoints[key] = {"next_page": next_page, "updated_at": time.time()}
+            self._dump(checkpoints)
+
+    def clear(self, key: str) -> None:
+        """Forget the checkpoint for ``key``."""
+        with self._lock:
+            checkpoints = self._load()
+            if checkpoints.pop(key, None) is not None:
+                self._dump(checkpoints)
+
+
+class SqliteCheckpointStore:
+    """Checkpoint store backed by a local SQLite database."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite database file; created with its table if missing
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS pagination_checkpoints ("
+            "key TEXT PRIMARY KEY, next_page INTEGER NOT NULL, "
+            "updated_at REAL NOT NULL)"
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        # A connection per operation keeps the store usable from any thread
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                return conn.execute(sql, params).fetchone()
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[int]:
+        """Return the next page to fetch for ``key``, if one was recorded."""
+        row = self._execute(
+            "SELECT next_page FROM pagination_checkpoints WHERE key = ?", (key,)
+        )
+        return None if row is None else int(row[0])
+
+    def save(self, key: str, next_page: int) -> None:
+        """Record that every page before ``next_page`` has been processed."""
+        self._execute(
+            "INSERT INTO pagination_checkpoints (key, next_page, updated_at) "
+            "VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+            "next_page = excluded.next_page, updated_at = excluded.updated_at",
+            (key, next_page, time.time()),
+        )
+
+    def clear(self, key: str) -> None:
+        """Forget the checkpoint for ``key``."""
+        self._execute("DELETE FROM pagination_checkpoints WHERE key = ?", (key,))
+
+
+@dataclass(frozen=True)
+class PaginationCheckpoint:
+    """Checkpoint of one paginated query in a store."""
+
+    store: CheckpointStore
+    key: str
+
+    def load(self) -> int:
+        """Return the page to resume from (0 when there is no checkpoint)."""
+        return self.store.get(self.key) or 0
+
+    def advance(self, next_page: int) -> None:
+        """Record that every page before ``next_page`` has been processed."""
+        self.store.save(self.key, next_page)
+
+    def complete(self) -> None:
+        """Clear the checkpoint once the query has been read to the end."""
+        self.store.clear(self.key)
@@ -0,0 +1,50 @@
+"""JSON decoding with an optional fast backend.
+
+Response bodies are parsed with orjson or msgspec when one of them is
+installed, falling back to the standard library. Every backend accepts the
+raw response bytes, so bodies are never decoded to ``str`` first, and every
+decode error is raised as :class:`json.JSONDecodeError`.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+else:
+    JSON_BACKEND = "json"
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse a JSON document from bytes or text.
+
+    Args:
+        data: The JSON document, typically a raw response body
+
+    Returns:
+        The parsed document
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if JSON_BACKEND == "orjson":
+        # orjson.JSONDecodeError is a json.JSONDecodeError
+        return orjson.loads(data)
+    if JSON_BACKEND == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+    return json.loads(data)
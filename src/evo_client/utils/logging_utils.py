@@ -0,0 +1,25 @@
+"""Helpers for logging request and response payloads."""
+
+from typing import Any
+
+
+def payload_preview(payload: Any, max_bytes: int) -> str:
+    """Render at most ``max_bytes`` of a payload for a log message.
+
+    Args:
+        payload: Request or response body (bytes, text or any object)
+        max_bytes: Longest prefix rendered; longer payloads are truncated
+
+    Returns:
+        The rendered prefix, noting the full size when truncated
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        size = len(payload)
+        text = bytes(payload[:max_bytes]).decode("utf-8", errors="replace")
+    else:
+        text = str(payload)
+        size = len(text)
+        text = text[:max_bytes]
+    if size > max_bytes:
+        return f"{text}... ({size} bytes total)"
+    return text
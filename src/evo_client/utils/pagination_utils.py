@@ -1,13 +1,30 @@
 """Pagination utilities for API calls with improved typing and testability."""
 
+import contextvars
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from threading import Lock as ThreadLock
-from typing import Any, Callable, Dict, List, Optional, ParamSpec, Protocol, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    ParamSpec,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 
 from loguru import logger
 
 from ..exceptions.api_exceptions import ApiException
+from .checkpoint_utils import CheckpointStore, PaginationCheckpoint, checkpoint_for_call
+from .rate_limit_utils import TokenBucketRateLimiter, get_rate_limit_info
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -28,9 +45,14 @@ class PaginationConfig:
     page_size: int = 50
     max_retries: int = 5
     base_delay: float = 1.5
-    post_request_delay: float = 1.0
+    # Opt-in fixed pause after each page; pacing is normally left to the limiter
+    post_request_delay: float = 0.0
     pagination_type: str = "skip_take"
     supports_pagination: bool = True
+    # Pages kept in flight for skip/take endpoints; 1 fetches page by page
+    prefetch_window: int = 1
+    # Where to resume from and record progress; None always starts at page 0
+    checkpoint: Optional[PaginationCheckpoint] = None
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -40,6 +62,59 @@ class PaginationConfig:
             raise ValueError("page_size must be positive")
         if self.max_retries < 0:
             raise ValueError("max_retries must be non-negative")
+        if self.prefetch_window <= 0:
+            raise ValueError("prefetch_window must be positive")
+
+    @property
+    def prefetches(self) -> bool:
+        """Whether pages should be requested ahead of the one being consumed."""
+        return (
+            self.prefetch_window > 1
+            and self.supports_pagination
+            and self.pagination_type == "skip_take"
+        )
+
+
+@dataclass(frozen=True)
+class PacingProfile:
+    """Per-endpoint pacing settings for paginated data fetches.
+
+    Request pacing is owned by the rate limiter; a profile only tunes how an
+    endpoint is paged and retried, plus an opt-in fixed pause between pages.
+    """
+
+    page_size: int = 50
+    max_retries: int = 5
+    base_delay: float = 1.5
+    post_request_delay: float = 0.0
+    prefetch_window: int = 1
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for :func:`paginated_api_call`."""
+        return {
+            "page_size": self.page_size,
+            "max_retries": self.max_retries,
+            "base_delay": self.base_delay,
+            "post_request_delay": self.post_request_delay,
+            "prefetch_window": self.prefetch_window,
+        }
+
+
+# Pacing used by the data fetchers, keyed by endpoint name. Page sizes are the
+# largest ``take`` each endpoint accepts; small reference-data endpoints retry
+# less, since a failed pull there is cheap to repeat. The bulk endpoints keep
+# pages in flight ahead of the one being consumed once a full page shows there
+# is more to fetch.
+DEFAULT_PACING_PROFILES: Dict[str, PacingProfile] = {
+    "activities": PacingProfile(page_size=50, max_retries=3),
+    "entries": PacingProfile(page_size=1000, prefetch_window=2),
+    "members": PacingProfile(page_size=50, prefetch_window=4),
+    "memberships": PacingProfile(page_size=50, max_retries=3),
+    "prospects": PacingProfile(page_size=50),
+    "receivables": PacingProfile(page_size=50, prefetch_window=4),
+    "sales": PacingProfile(page_size=100),
+    "services": PacingProfile(page_size=50, max_retries=3),
+}
 
 
 @dataclass
@@ -99,24 +174,29 @@ class RateLimiter:
         """Wait until a request can be made, respecting rate limits."""
         with self._lock:
             now = time.time()
-            # Remove old requests outside the time window
-            self.requests = [t for t in self.requests if now - t < self.time_window]
-
+            # Remove old requests outside the time window (timestamps are sorted)
+            expired = 0
+            while (
+                expired < len(self.requests)
+                and now - self.requests[expired] >= self.time_window
+            ):
+                expired += 1
+            if expired:
+                del self.requests[:expired]
+
+            slot = now
             if len(self.requests) >= self.max_requests:
-                # Calculate sleep time until we can make another request
-                sleep_time = self.requests[0] + self.time_window - now
-                if sleep_time > 0:
-                    logger.warning(
-                        f"Rate limit reached, waiting {sleep_time:.2f}s before next request"
-                    )
-                    time.sleep(sleep_time)
-                    # Clean old requests again after sleeping
-                    now = time.time()
-                    self.requests = [
-                        t for t in self.requests if now - t < self.time_window
-                    ]
+                # Reserve the slot freed when the max_requests-th most recent
+                # request leaves the window; sleep after releasing the lock.
+                slot = self.requests[-self.max_requests] + self.time_window
+            self.requests.append(slot)
 
-            self.requests.append(now)
+        sleep_time = slot - now
+        if sleep_time > 0:
+            logger.warning(
+                f"Rate limit reached, waiting {sleep_time:.2f}s before next request"
+            )
+            time.sleep(sleep_time)
 
     def reset(self) -> None:
         """Reset the rate limiter state (useful for testing)."""
@@ -172,6 +252,11 @@ class RetryHandler:
         else:
             delay = self.config.base_delay
 
+        # Prefer the structured Retry-After / X-RateLimit-* headers
+        info = get_rate_limit_info(exception)
+        if info is not None and info.is_rate_limited and info.wait_time is not None:
+            return max(delay, info.wait_time)
+
         # Handle rate limiting (429 Too Many Requests)
         error_msg = str(exception)
         if "429" in error_msg or "Too Many Requests" in error_msg:
@@ -192,6 +277,17 @@ class ApiCallExecutor:
         self.rate_limiter = rate_limiter or RateLimiter()
         self.retry_handler = retry_handler or RetryHandler(RetryConfig())
 
+    def _notify_rate_limiter(self, exception: Optional[Exception] = None) -> None:
+        """Feed the request outcome back to limiters that adapt to the server."""
+        if not isinstance(self.rate_limiter, TokenBucketRateLimiter):
+            return
+        if exception is None:
+            self.rate_limiter.on_success()
+            return
+        info = get_rate_limit_info(exception)
+        if info is not None and info.is_rate_limited:
+            self.rate_limiter.on_rate_limited(info)
+
     def execute_with_retry(
         self,
         api_func: Callable[P, T],
@@ -219,11 +315,13 @@ class ApiCallExecutor:
 
             try:
                 result = api_func(*args, **kwargs)
+                self._notify_rate_limiter()
                 if attempt > 1:
                     logger.info(f"{context} succeeded on attempt {attempt}")
                 return result
 
             except (ApiException, Exception) as e:
+                self._notify_rate_limiter(e)
                 logger.warning(
                     f"{context} failed on attempt {attempt}/{self.retry_handler.config.max_retries}: {e}"
                 )
@@ -260,6 +358,84 @@ class PaginatedApiCaller:
         else:  # "page_page_size"
             return {"page": page, "page_size": config.page_size}
 
+    def _resolve_branch_logging(
+        self, func_name: str, branch_id_logging: str, kwargs: Dict[str, Any]
+    ) -> str:
+        """Resolve the branch identifier used in log messages."""
+        if branch_id_logging == "NOT INFORMED":
+            logger.warning(
+                f"Branch ID not informed for {func_name}, using default branch ID"
+            )
+            branch_id_logging = str(kwargs.get("branch_id_logging", "NOT INFORMED"))
+        return branch_id_logging
+
+    def iter_pages(
+        self,
+        api_func: Callable[P, List[T]],
+        config: Optional[PaginationConfig] = None,
+        branch_id_logging: str = "unknown",
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Iterator[List[T]]:
+        """
+        Lazily fetch the pages of a paginated API, one page per iteration.
+
+        The next page is only requested once the consumer asks for it (or, with
+        a prefetch window, at most ``prefetch_window`` pages ahead), so callers
+        can process and discard records with bounded memory.
+
+        Args:
+            api_func: API function to call
+            config: Pagination configuration (uses default if None)
+            branch_id_logging: Identifier for logging context
+            **kwargs: Additional arguments for the API function
+
+        Yields:
+            The items of each non-empty page, in order
+
+        Raises:
+            Exception: The error of a failed page, after the pages before it
+        """
+        config = config or self.default_config
+        func_name = getattr(api_func, "__name__", "unknown_function")
+        branch_id_logging = self._resolve_branch_logging(
+            func_name, branch_id_logging, kwargs
+        )
+        yield from self._iter_pages(
+            api_func,
+            config,
+            func_name,
+            branch_id_logging,
+            args,
+            kwargs,
+            PaginationResult(data=[]),
+        )
+
+    def iter_items(
+        self,
+        api_func: Callable[P, List[T]],
+        config: Optional[PaginationConfig] = None,
+        branch_id_logging: str = "unknown",
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Iterator[T]:
+        """
+        Lazily fetch the items of a paginated API, one item per iteration.
+
+        Args:
+            api_func: API function to call
+            config: Pagination configuration (uses default if None)
+            branch_id_logging: Identifier for logging context
+            **kwargs: Additional arguments for the API function
+
+        Yields:
+            Every item of every page, in order
+        """
+        for page in self.iter_pages(
+            api_func, config, branch_id_logging, *args, **kwargs
+        ):
+            yield from page
+
     def fetch_all_pages(
         self,
         api_func: Callable[P, List[T]],
@@ -281,96 +457,224 @@ class PaginatedApiCaller:
             PaginationResult with data and metadata
         """
         config = config or self.default_config
-        results: List[T] = []
-        page = 0
-        total_requests = 0
-        total_retries = 0
+        if config.checkpoint:
+            # A resumed call would return only the remaining pages
+            raise ValueError(
+                "Pagination checkpoints require streaming the pages with iter_pages"
+            )
+        result = PaginationResult(data=[])
 
         func_name = getattr(api_func, "__name__", "unknown_function")
-        if branch_id_logging == "NOT INFORMED":
-            logger.warning(
-                f"Branch ID not informed for {func_name}, using default branch ID"
-            )
-            branch_id_logging = str(kwargs.get("branch_id_logging", "NOT INFORMED"))
+        branch_id_logging = self._resolve_branch_logging(
+            func_name, branch_id_logging, kwargs
+        )
         logger.debug(
             f"Starting paginated fetch for {func_name} (branch: {branch_id_logging})"
         )
 
         try:
-            while True:
-                # Build call arguments
-                if config.supports_pagination:
-                    pagination_params = self._build_pagination_params(page, config)
-                    kwargs.update(pagination_params)
+            for page in self._iter_pages(
+                api_func, config, func_name, branch_id_logging, args, kwargs, result
+            ):
+                result.data.extend(page)
+        except Exception as e:
+            # Failed API calls already marked the result; anything else is unexpected
+            if result.success:
+                logger.error(f"Unexpected error in paginated fetch: {e}")
+            result.success = False
+            result.error_message = str(e)
+            return result
 
-                context = f"{func_name} page {page} (branch: {branch_id_logging})"
+        logger.debug(
+            f"Completed paginated fetch for {func_name}: {len(result.data)} items, "
+            f"{result.total_requests} requests, {result.total_retries} retries"
+        )
 
-                try:
-                    # Execute API call with retry logic
-                    page_result = self.executor.execute_with_retry(
-                        api_func, context, *args, **kwargs
-                    )
-                    total_requests += 1
-
-                    # Add delay after successful request
-                    if config.post_request_delay > 0:
-                        time.sleep(config.post_request_delay)
-
-                except Exception as e:
-                    total_retries += self.executor.retry_handler.config.max_retries
-                    return PaginationResult(
-                        data=results,
-                        success=False,
-                        error_message=str(e),
-                        total_requests=total_requests,
-                        total_retries=total_retries,
-                    )
+        return result
 
-                # Process results
-                if not page_result:
-                    break
-
-                if isinstance(page_result, list):
-                    results.extend(page_result)
-                    # Check if we got fewer results than requested (last page)
-                    if (
-                        len(page_result) < config.page_size
-                        or not config.supports_pagination
-                    ):
-                        break
-                else:
-                    # Single result (non-list response)
-                    results.append(page_result)
-                    break
-
-                page += 1
+    def _call_page(
+        self,
+        api_func: Callable[..., List[T]],
+        config: PaginationConfig,
+        context: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Execute one page request with retries."""
+        page_result = self.executor.execute_with_retry(
+            api_func, context, *args, **kwargs
+        )
 
-        except Exception as e:
-            logger.error(f"Unexpected error in paginated fetch: {e}")
-            return PaginationResult(
-                data=results,
-                success=False,
-                error_message=str(e),
-                total_requests=total_requests,
-                total_retries=total_retries,
+        # Add delay after successful request
+        if config.post_request_delay > 0:
+            time.sleep(config.post_request_delay)
+        return page_result
+
+    def _record_failure(self, stats: PaginationResult) -> None:
+        """Mark ``stats`` as failed by an API call that exhausted its retries."""
+        stats.total_retries += self.executor.retry_handler.config.max_retries
+        stats.success = False
+
+    def _iter_pages(
+        self,
+        api_func: Callable[..., List[T]],
+        config: PaginationConfig,
+        func_name: str,
+        branch_id_logging: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        stats: PaginationResult,
+    ) -> Iterator[List[T]]:
+        """Yield pages in order, counting requests and retries into ``stats``.
+
+        With a checkpoint, fetching starts at the recorded page and the
+        checkpoint advances once the consumer asks for the page after the
+        one it was given, so a page is only skipped after it was processed.
+        """
+        checkpoint = config.checkpoint if config.supports_pagination else None
+        start_page = checkpoint.load() if checkpoint else 0
+        if start_page:
+            logger.info(
+                f"Resuming {func_name} at page {start_page} "
+                f"(branch: {branch_id_logging})"
             )
 
-        logger.debug(
-            f"Completed paginated fetch for {func_name}: {len(results)} items, "
-            f"{total_requests} requests, {total_retries} retries"
+        iter_numbered = (
+            self._iter_pages_prefetched
+            if config.prefetches
+            else self._iter_pages_sequential
         )
+        for page, items in iter_numbered(
+            api_func,
+            config,
+            func_name,
+            branch_id_logging,
+            args,
+            kwargs,
+            stats,
+            start_page,
+        ):
+            yield items
+            if checkpoint:
+                checkpoint.advance(page + 1)
+
+        if checkpoint:
+            checkpoint.complete()
+
+    def _iter_pages_sequential(
+        self,
+        api_func: Callable[..., List[T]],
+        config: PaginationConfig,
+        func_name: str,
+        branch_id_logging: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        stats: PaginationResult,
+        start_page: int,
+    ) -> Iterator[Tuple[int, List[T]]]:
+        """Yield numbered pages one request at a time."""
+        page = start_page
+        while True:
+            # Build call arguments
+            if config.supports_pagination:
+                kwargs.update(self._build_pagination_params(page, config))
+
+            context = f"{func_name} page {page} (branch: {branch_id_logging})"
+            try:
+                page_result = self._call_page(api_func, config, context, args, kwargs)
+            except Exception:
+                self._record_failure(stats)
+                raise
+            stats.total_requests += 1
 
-        return PaginationResult(
-            data=results,
-            success=True,
-            total_requests=total_requests,
-            total_retries=total_retries,
-        )
+            # Process results
+            if not page_result:
+                return
+
+            if not isinstance(page_result, list):
+                # Single result (non-list response)
+                yield page, [page_result]
+                return
+
+            yield page, page_result
+            # Fewer results than requested means this was the last page
+            if len(page_result) < config.page_size or not config.supports_pagination:
+                return
+
+            page += 1
+
+    def _iter_pages_prefetched(
+        self,
+        api_func: Callable[..., List[T]],
+        config: PaginationConfig,
+        func_name: str,
+        branch_id_logging: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        stats: PaginationResult,
+        start_page: int,
+    ) -> Iterator[Tuple[int, List[T]]]:
+        """Yield numbered skip/take pages keeping up to ``prefetch_window`` in flight.
+
+        The first page is requested alone and the window doubles after each
+        full page, so a query that fits in one page costs one request. Pages
+        are consumed in order; once a short or empty page is seen no further
+        pages are requested and speculative ones still queued are cancelled.
+        Every request still goes through the executor, so the rate limiter
+        governs how fast the window is refilled.
+        """
+        next_page = start_page
+        window = 1
+        pending: Deque[Tuple[int, Future]] = deque()
+
+        def fetch_page(page: int) -> Any:
+            page_kwargs = {**kwargs, **self._build_pagination_params(page, config)}
+            context = f"{func_name} page {page} (branch: {branch_id_logging})"
+            return self._call_page(api_func, config, context, args, page_kwargs)
+
+        pool = ThreadPoolExecutor(max_workers=config.prefetch_window)
+        try:
+            while True:
+                while len(pending) < window:
+                    # Run in a copy of the caller's context so per-call
+                    # settings such as record_mode reach the workers
+                    future = pool.submit(
+                        contextvars.copy_context().run, fetch_page, next_page
+                    )
+                    pending.append((next_page, future))
+                    next_page += 1
+
+                page, future = pending.popleft()
+                try:
+                    page_result = future.result()
+                except Exception:
+                    self._record_failure(stats)
+                    raise
+                stats.total_requests += 1
+
+                if not page_result:
+                    return
+                if not isinstance(page_result, list):
+                    yield page, [page_result]
+                    return
+                yield page, page_result
+                if len(page_result) < config.page_size:
+                    return
+                window = min(window * 2, config.prefetch_window)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            # Requests already waiting on the limiter finish in the background
+            # instead of holding up the consumer
+            pool.shutdown(wait=False)
 
 
 # Factory function for backward compatibility
 def create_paginated_caller(
-    max_requests_per_minute: int = 40, max_retries: int = 5, base_delay: float = 1.5
+    max_requests_per_minute: int = 40,
+    max_retries: int = 5,
+    base_delay: float = 1.5,
+    rate_limiter: Optional[RateLimiterProtocol] = None,
 ) -> PaginatedApiCaller:
     """
     Create a configured PaginatedApiCaller instance.
@@ -379,11 +683,13 @@ def create_paginated_caller(
         max_requests_per_minute: Rate limit for API calls
         max_retries: Maximum retry attempts
         base_delay: Base delay for exponential backoff
+        rate_limiter: Shared rate limiter to use instead of a private one
 
     Returns:
         Configured PaginatedApiCaller instance
     """
-    rate_limiter = RateLimiter(max_requests=max_requests_per_minute, time_window=60)
+    if rate_limiter is None:
+        rate_limiter = RateLimiter(max_requests=max_requests_per_minute, time_window=60)
     retry_handler = RetryHandler(
         RetryConfig(max_retries=max_retries, base_delay=base_delay)
     )
@@ -392,6 +698,23 @@ def create_paginated_caller(
     return PaginatedApiCaller(executor=executor)
 
 
+def get_client_rate_limiter(api_func: Callable) -> Optional[TokenBucketRateLimiter]:
+    """Return the shared rate limiter of the client behind a bound API method.
+
+    Args:
+        api_func: Bound method of an API class (e.g. ``SyncMembersApi.get_members``)
+
+    Returns:
+        The client's shared limiter, or None if the function is not bound to an
+        API instance whose client carries one
+    """
+    api_client = getattr(getattr(api_func, "__self__", None), "api_client", None)
+    rate_limiter = getattr(api_client, "rate_limiter", None)
+    if isinstance(rate_limiter, TokenBucketRateLimiter):
+        return rate_limiter
+    return None
+
+
 # Backward compatibility function
 def paginated_api_call(
     api_func: Callable[P, List[T]],
@@ -401,7 +724,8 @@ def paginated_api_call(
     supports_pagination: bool = True,
     pagination_type: str = "skip_take",
     branch_id_logging: str = "NOT INFORMED",
-    post_request_delay: float = 1.0,
+    post_request_delay: float = 0.0,
+    prefetch_window: int = 1,
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> List[T]:
@@ -416,7 +740,9 @@ def paginated_api_call(
         supports_pagination: Whether the API supports pagination
         pagination_type: Type of pagination ('skip_take' or 'page_page_size')
         branch_id_logging: Identifier for the branch/unit being processed
-        post_request_delay: Delay in seconds after each successful API call
+        post_request_delay: Optional fixed delay in seconds after each successful
+            API call (off by default; the rate limiter paces requests)
+        prefetch_window: Number of skip/take pages kept in flight at once
         *args: Additional positional arguments to pass to the API function
         **kwargs: Additional keyword arguments to pass to the API function
 
@@ -430,9 +756,15 @@ def paginated_api_call(
         supports_pagination=supports_pagination,
         pagination_type=pagination_type,
         post_request_delay=post_request_delay,
+        prefetch_window=prefetch_window,
     )
 
-    caller = create_paginated_caller(max_retries=max_retries, base_delay=base_delay)
+    # Draw from the credential-wide budget shared by every client using it
+    caller = create_paginated_caller(
+        max_retries=max_retries,
+        base_delay=base_delay,
+        rate_limiter=get_client_rate_limiter(api_func),
+    )
     result = caller.fetch_all_pages(
         api_func,
         config,
@@ -447,3 +779,69 @@ def paginated_api_call(
         )
 
     return result.data
+
+
+def iter_pages(
+    api_func: Callable[P, List[T]],
+    page_size: int = 50,
+    max_retries: int = 5,
+    base_delay: float = 1.5,
+    supports_pagination: bool = True,
+    pagination_type: str = "skip_take",
+    branch_id_logging: str = "NOT INFORMED",
+    post_request_delay: float = 0.0,
+    prefetch_window: int = 1,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Iterator[List[T]]:
+    """
+    Stream the pages of a paginated API instead of accumulating them.
+
+    Takes the same arguments as :func:`paginated_api_call`. Unlike it, a failed
+    page is not swallowed: the error is raised once the pages before it have
+    been yielded.
+
+    With a ``checkpoint_store`` recording the last completed page, an
+    interrupted stream resumes after the pages already yielded.
+
+    Yields:
+        The items of each non-empty page, in order
+    """
+    config = PaginationConfig(
+        page_size=page_size,
+        max_retries=max_retries,
+        base_delay=base_delay,
+        supports_pagination=supports_pagination,
+        pagination_type=pagination_type,
+        post_request_delay=post_request_delay,
+        prefetch_window=prefetch_window,
+        checkpoint=checkpoint_for_call(
+            checkpoint_store, api_func, branch_id_logging, kwargs, page_size
+        ),
+    )
+
+    # Draw from the credential-wide budget shared by every client using it
+    caller = create_paginated_caller(
+        max_retries=max_retries,
+        base_delay=base_delay,
+        rate_limiter=get_client_rate_limiter(api_func),
+    )
+    yield from caller.iter_pages(api_func, config, branch_id_logging, *args, **kwargs)
+
+
+def iter_items(
+    api_func: Callable[P, List[T]],
+    *args: Any,
+    **kwargs: Any,
+) -> Iterator[T]:
+    """
+    Stream the items of a paginated API one at a time.
+
+    Takes the same arguments as :func:`iter_pages`.
+
+    Yields:
+        Every item of every page, in order
+    """
+    for page in iter_pages(api_func, *args, **kwargs):
+        yield from page
@@ -0,0 +1,82 @@
+"""Reporting periods and local partitioning of records fetched over them.
+
+Metrics compared across periods (current vs previous month, a 12-month trend)
+need the same entities for every period. Rather than one API sweep per
+period, records are fetched once over the union of the periods and assigned
+to each period locally by their dates.
+
+Periods are half-open ``[start, end)`` so consecutive periods sharing a
+boundary never count a record twice; the last period also includes its end.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+Period = Tuple[datetime, datetime]
+
+
+def rolling_periods(
+    to_date: Optional[datetime] = None, count: int = 2, days: int = 30
+) -> List[Period]:
+    """Build consecutive periods of ``days`` days ending at ``to_date``.
+
+    Args:
+        to_date: End of the latest period (defaults to now)
+        count: Number of periods
+        days: Length of each period in days
+
+    Returns:
+        The periods as (start, end) pairs, oldest first
+    """
+    if count < 1:
+        raise ValueError("At least one period is required")
+    end = to_date or datetime.now()
+    periods = []
+    for _ in range(count):
+        start = end - timedelta(days=days)
+        periods.append((start, end))
+        end = start
+    return periods[::-1]
+
+
+def _naive(value: datetime) -> datetime:
+    """Compare aware datetimes as naive UTC, like naive period bounds."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def partition_by_period(
+    records: Iterable[Any],
+    periods: Sequence[Period],
+    dates: Callable[[Any], Iterable[Optional[datetime]]],
+) -> List[List[Any]]:
+    """Assign records to the periods their dates fall in.
+
+    Args:
+        records: Records fetched over the union of the periods
+        periods: Consecutive periods, oldest first
+        dates: Dates of a record; a record with several dates (e.g. one per
+            membership) is assigned once to each period one of them falls in
+
+    Returns:
+        The records of each period, in the order of ``periods``
+    """
+    starts = [start for start, _ in periods]
+    last_end = periods[-1][1]
+    partitions: List[List[Any]] = [[] for _ in periods]
+    for record in records:
+        placed = set()
+        for value in dates(record):
+            if value is None:
+                continue
+            value = _naive(value)
+            index = bisect_right(starts, value) - 1
+            if index < 0 or index in placed:
+                continue
+            end = periods[index][1]
+            if value < end or (index == len(periods) - 1 and value <= last_end):
+                placed.add(index)
+                partitions[index].append(record)
+    return partitions
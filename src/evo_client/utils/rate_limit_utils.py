@@ -0,0 +1,460 @@
+"""Shared token-bucket rate limiting for API clients.
+
+The EVO API enforces its request budget per credential, so every client using
+the same credential must draw from the same bucket. Limiters are registered by
+credential key and shared by all sync and async clients in the process; an
+optional state file extends the budget across processes on one host.
+
+Server feedback (429 responses, ``Retry-After`` and ``X-RateLimit-*`` headers)
+is parsed into :class:`RateLimitInfo`; :class:`AdaptiveRateLimiter` uses it to
+raise throughput additively until the server pushes back and then back off
+multiplicatively (AIMD).
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock as ThreadLock
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+def _parse_retry_after(value: str, now: float) -> Optional[float]:
+    """Parse a Retry-After value given as delta-seconds or an HTTP-date."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - now)
+
+
+# Reset values above this are absolute UNIX timestamps rather than seconds
+_EPOCH_RESET_THRESHOLD = 1_000_000_000
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value.strip())
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class RateLimitInfo:
+    """Structured rate-limit metadata taken from an HTTP response."""
+
+    status: Optional[int] = None
+    retry_after: Optional[float] = None
+    limit: Optional[float] = None
+    remaining: Optional[float] = None
+    reset_after: Optional[float] = None
+
+    @property
+    def is_rate_limited(self) -> bool:
+        """Whether the server asked the client to slow down."""
+        return self.status == 429 or (
+            self.status == 503 and self.retry_after is not None
+        )
+
+    @property
+    def wait_time(self) -> Optional[float]:
+        """Seconds to wait before the next request, if the server said so."""
+        if self.retry_after is not None:
+            return self.retry_after
+        if self.remaining is not None and self.remaining <= 0:
+            return self.reset_after
+        return None
+
+    @classmethod
+    def from_headers(
+        cls,
+        status: Optional[int],
+        headers: Optional[Mapping[str, Any]],
+        now: Optional[float] = None,
+    ) -> "RateLimitInfo":
+        """Build rate-limit info from a status code and response headers.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers (matched case-insensitively)
+            now: Current UNIX time, used to resolve HTTP-dates
+
+        Returns:
+            Parsed RateLimitInfo
+        """
+        now = time.time() if now is None else now
+        lowered = {str(k).lower(): str(v) for k, v in (headers or {}).items()}
+
+        retry_after = None
+        if "retry-after" in lowered:
+            retry_after = _parse_retry_after(lowered["retry-after"], now)
+
+        reset_after = _parse_float(
+            lowered.get("x-ratelimit-reset", lowered.get("ratelimit-reset"))
+        )
+        # Some servers send the reset as an absolute UNIX timestamp
+        if reset_after is not None and reset_after > _EPOCH_RESET_THRESHOLD:
+            reset_after = max(0.0, reset_after - now)
+
+        return cls(
+            status=status,
+            retry_after=retry_after,
+            limit=_parse_float(
+                lowered.get("x-ratelimit-limit", lowered.get("ratelimit-limit"))
+            ),
+            remaining=_parse_float(
+                lowered.get("x-ratelimit-remaining", lowered.get("ratelimit-remaining"))
+            ),
+            reset_after=reset_after,
+        )
+
+
+def get_rate_limit_info(exception: BaseException) -> Optional[RateLimitInfo]:
+    """Extract structured rate-limit info from an API error, if it carries any.
+
+    Works with :class:`~evo_client.exceptions.api_exceptions.ApiException` and
+    ``aiohttp.ClientResponseError``, both of which expose ``status`` and
+    ``headers``.
+    """
+    status = getattr(exception, "status", None)
+    headers = getattr(exception, "headers", None)
+    if not isinstance(status, int) or (
+        headers is not None and not hasattr(headers, "items")
+    ):
+        return None
+    return RateLimitInfo.from_headers(status, headers)
+
+
+class TokenBucketRateLimiter:
+    """Thread-safe GCRA (generic cell rate algorithm) rate limiter.
+
+    State is a single "theoretical arrival time", so acquiring is O(1). The
+    slot is reserved while holding the lock and the caller sleeps after the
+    lock is released, letting other threads reserve their own slots.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 40,
+        time_window: float = 60,
+        burst: int = 1,
+        state_path: Optional[str] = None,
+    ):
+        """
+        Initialize token-bucket rate limiter.
+
+        Args:
+            max_requests: Maximum requests allowed in time window
+            time_window: Time window in seconds
+            burst: Requests that may be issued back to back before pacing starts.
+                The default of 1 never exceeds max_requests in any time window.
+            state_path: Optional file holding the bucket state so several
+                processes share the same budget (requires fcntl)
+        """
+        if max_requests <= 0:
+            raise ValueError("max_requests must be positive")
+        if time_window <= 0:
+            raise ValueError("time_window must be positive")
+        if burst <= 0:
+            raise ValueError("burst must be positive")
+        if state_path is not None and fcntl is None:
+            raise RuntimeError("File-backed rate limiting requires fcntl")
+
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.burst = burst
+        self.state_path = state_path
+        self._tat = 0.0
+        self._lock = ThreadLock()
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return self.time_window / self.max_requests
+
+    def _advance(self, tat: float, now: float) -> Tuple[float, float]:
+        """Reserve the next slot, returning (delay, new theoretical arrival time)."""
+        start = max(tat, now)
+        tolerance = (self.burst - 1) * self.emission_interval
+        delay = max(0.0, start - tolerance - now)
+        return delay, start + self.emission_interval
+
+    def _reserve_shared(self, now: float) -> float:
+        """Reserve a slot from the file-backed state under an exclusive lock."""
+        state_path = str(self.state_path)
+        fd = os.open(state_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)  # type: ignore[union-attr]
+            raw = os.pread(fd, 64, 0)
+            try:
+                tat = float(raw.decode() or 0.0)
+            except ValueError:
+                tat = 0.0
+            delay, tat = self._advance(tat, now)
+            encoded = repr(tat).encode()
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, encoded, 0)
+            return delay
+        finally:
+            os.close(fd)
+
+    def reserve(self) -> float:
+        """Reserve the next request slot.
+
+        Returns:
+            Seconds the caller must wait before issuing the request
+        """
+        with self._lock:
+            now = time.time()
+            if self.state_path is not None:
+                return self._reserve_shared(now)
+            delay, self._tat = self._advance(self._tat, now)
+            return delay
+
+    def acquire(self) -> None:
+        """Wait until a request can be made, respecting rate limits."""
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug(f"Rate limit pacing, waiting {delay:.2f}s before next request")
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for ``seconds`` (e.g. after a Retry-After)."""
+        with self._lock:
+            resume_at = time.time() + seconds
+            if self.state_path is not None:
+                self._reserve_shared_until(resume_at)
+            else:
+                self._tat = max(self._tat, resume_at)
+
+    def _reserve_shared_until(self, resume_at: float) -> None:
+        """Push the file-backed theoretical arrival time to ``resume_at``."""
+        fd = os.open(str(self.state_path), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)  # type: ignore[union-attr]
+            tat = _parse_float(os.pread(fd, 64, 0).decode()) or 0.0
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, repr(max(tat, resume_at)).encode(), 0)
+        finally:
+            os.close(fd)
+
+    def on_success(self) -> None:
+        """Feedback hook called after a successful request (no-op)."""
+
+    def on_rate_limited(self, info: Optional[RateLimitInfo] = None) -> None:
+        """Feedback hook called when the server rejects a request for rate.
+
+        The fixed-rate bucket only honours the server's requested wait.
+        """
+        if info is not None and info.wait_time:
+            self.pause(info.wait_time)
+
+    def reset(self) -> None:
+        """Reset the rate limiter state (useful for testing)."""
+        with self._lock:
+            self._tat = 0.0
+            if self.state_path is not None and os.path.exists(self.state_path):
+                os.remove(self.state_path)
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """Token bucket whose rate adapts to server feedback (AIMD).
+
+    Every ``increase_every`` consecutive successes the sustained rate grows by
+    ``increase_step`` requests per window, up to ``ceiling``. A rate-limited
+    response multiplies the rate by ``decrease_factor`` (down to ``floor``)
+    and pauses the bucket for the server-provided wait, if any.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 40,
+        time_window: float = 60,
+        burst: int = 1,
+        state_path: Optional[str] = None,
+        floor: int = 5,
+        ceiling: Optional[int] = None,
+        increase_step: float = 1.0,
+        increase_every: int = 10,
+        decrease_factor: float = 0.5,
+    ):
+        """
+        Initialize adaptive rate limiter.
+
+        Args:
+            max_requests: Initial requests allowed in time window
+            time_window: Time window in seconds
+            burst: Requests that may be issued back to back before pacing starts
+            state_path: Optional file holding the bucket state for several processes
+            floor: Lowest rate (requests per window) backoff may reach
+            ceiling: Highest rate growth may reach (defaults to 3x max_requests)
+            increase_step: Requests per window added on additive increase
+            increase_every: Consecutive successes required per increase
+            decrease_factor: Multiplier applied to the rate on a rate-limited response
+        """
+        super().__init__(max_requests, time_window, burst, state_path)
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if increase_every <= 0:
+            raise ValueError("increase_every must be positive")
+
+        self.floor = min(floor, max_requests)
+        self.ceiling = ceiling if ceiling is not None else max_requests * 3
+        self.increase_step = increase_step
+        self.increase_every = increase_every
+        self.decrease_factor = decrease_factor
+        self.initial_max_requests = max_requests
+        self._successes = 0
+
+    def on_success(self) -> None:
+        """Additively raise the rate after enough consecutive successes."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.increase_every:
+                self._successes = 0
+                self.max_requests = min(
+                    self.ceiling, self.max_requests + self.increase_step
+                )
+
+    def on_rate_limited(self, info: Optional[RateLimitInfo] = None) -> None:
+        """Multiplicatively cut the rate and honour the server's wait."""
+        with self._lock:
+            self._successes = 0
+            new_rate = self.max_requests * self.decrease_factor
+            # Never exceed the budget the server advertises
+            if info is not None and info.limit:
+                new_rate = min(new_rate, info.limit)
+            self.max_requests = max(self.floor, new_rate)
+        logger.warning(
+            f"Rate limited by server, reducing to {self.max_requests:.1f} "
+            f"requests per {self.time_window:g}s"
+        )
+        super().on_rate_limited(info)
+
+    def reset(self) -> None:
+        """Reset the rate limiter state (useful for testing)."""
+        super().reset()
+        with self._lock:
+            self.max_requests = self.initial_max_requests
+            self._successes = 0
+
+
+class AsyncTokenBucketRateLimiter:
+    """Async view over a :class:`TokenBucketRateLimiter`.
+
+    Slots are reserved from the wrapped limiter, so async and sync clients
+    sharing a credential also share one budget.
+    """
+
+    def __init__(self, limiter: Optional[TokenBucketRateLimiter] = None):
+        self.limiter = limiter or TokenBucketRateLimiter()
+
+    @property
+    def max_requests(self) -> int:
+        return self.limiter.max_requests
+
+    @property
+    def time_window(self) -> float:
+        return self.limiter.time_window
+
+    async def acquire(self) -> None:
+        """Wait until a request can be made, respecting rate limits."""
+        delay = self.limiter.reserve()
+        if delay > 0:
+            logger.debug(f"Rate limit pacing, waiting {delay:.2f}s before next request")
+            await asyncio.sleep(delay)
+
+    def on_success(self) -> None:
+        """Forward success feedback to the wrapped limiter."""
+        self.limiter.on_success()
+
+    def on_rate_limited(self, info: Optional[RateLimitInfo] = None) -> None:
+        """Forward rate-limit feedback to the wrapped limiter."""
+        self.limiter.on_rate_limited(info)
+
+    async def reset(self) -> None:
+        """Reset the rate limiter state (useful for testing)."""
+        self.limiter.reset()
+
+
+_shared_limiters: Dict[str, TokenBucketRateLimiter] = {}
+_registry_lock = ThreadLock()
+
+
+def rate_limit_key(configuration) -> str:
+    """Return the key identifying the rate-limit budget of a configuration.
+
+    The API budget belongs to the credential, so the username is used when
+    set; anonymous configurations share a budget per host.
+    """
+    username = getattr(configuration, "username", "") or ""
+    if username:
+        return f"user:{username}"
+    return f"host:{getattr(configuration, 'host', '')}"
+
+
+def get_shared_rate_limiter(
+    key: str,
+    max_requests: int = 40,
+    time_window: float = 60,
+    burst: int = 1,
+    state_dir: Optional[str] = None,
+    adaptive: bool = False,
+) -> TokenBucketRateLimiter:
+    """Get the process-wide rate limiter for a credential key.
+
+    The first call for a key creates the limiter; later calls return the same
+    instance regardless of the limits passed.
+
+    Args:
+        key: Credential key, see :func:`rate_limit_key`
+        max_requests: Maximum requests allowed in time window
+        time_window: Time window in seconds
+        burst: Requests that may be issued back to back
+        state_dir: Optional directory for a state file shared across processes
+        adaptive: Create an :class:`AdaptiveRateLimiter` driven by server feedback
+
+    Returns:
+        The shared TokenBucketRateLimiter
+    """
+    with _registry_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            state_path = None
+            if state_dir is not None:
+                digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+                state_path = os.path.join(state_dir, f"evo-rate-limit-{digest}.state")
+            limiter_cls = AdaptiveRateLimiter if adaptive else TokenBucketRateLimiter
+            limiter = limiter_cls(
+                max_requests=max_requests,
+                time_window=time_window,
+                burst=burst,
+                state_path=state_path,
+            )
+            _shared_limiters[key] = limiter
+        return limiter
+
+
+def clear_shared_rate_limiters() -> None:
+    """Drop every registered limiter (useful for testing)."""
+    with _registry_lock:
+        _shared_limiters.clear()
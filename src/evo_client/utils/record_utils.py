@@ -0,0 +1,71 @@
+"""Record modes controlling how much work goes into building response objects.
+
+By default responses are validated into the generated view models. Bulk pulls
+that only need the data can trade that for speed:
+
+- ``"model"``: fully validated view models (the default)
+- ``"construct"``: view models built with ``model_construct``; top-level
+  fields use their Python names but values are left as the API sent them
+  (nested objects stay dicts, dates stay ISO strings)
+- ``"dict"``: the parsed JSON itself, keyed by the API's field names
+
+The mode is set per client with ``Configuration.record_mode`` or per call with
+the :func:`record_mode` context manager, which takes precedence.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, get_args, get_origin
+
+from pydantic import BaseModel
+
+RECORD_MODES = ("model", "construct", "dict")
+
+_record_mode: ContextVar[Optional[str]] = ContextVar("record_mode", default=None)
+
+
+def validate_record_mode(mode: str) -> str:
+    """Return ``mode`` if it is a known record mode."""
+    if mode not in RECORD_MODES:
+        raise ValueError(
+            f"Unknown record mode {mode!r}; expected one of {', '.join(RECORD_MODES)}"
+        )
+    return mode
+
+
+@contextmanager
+def record_mode(mode: str) -> Iterator[None]:
+    """Build the responses of every request in the block in ``mode``.
+
+    Example:
+        >>> with record_mode("dict"):
+        ...     receivables = list(fetcher.iter_receivables())
+    """
+    token = _record_mode.set(validate_record_mode(mode))
+    try:
+        yield
+    finally:
+        _record_mode.reset(token)
+
+
+def resolve_record_mode(configuration: Any) -> str:
+    """Return the record mode in effect for a client configuration."""
+    return _record_mode.get() or getattr(configuration, "record_mode", "model")
+
+
+def construct_records(response_type: Any, data: Any) -> Any:
+    """Build unvalidated instances of a model or list response type.
+
+    Types that are neither a model nor a list of models are returned as the
+    parsed data.
+    """
+    if get_origin(response_type) is list:
+        (item_type,) = get_args(response_type)
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+            construct = item_type.model_construct
+            items: List[Any] = [construct(**item) for item in data]
+            return items
+        return data
+    if isinstance(response_type, type) and issubclass(response_type, BaseModel):
+        return response_type.model_construct(**data)
+    return data
@@ -0,0 +1,113 @@
+"""Coalescing of identical in-flight requests.
+
+When several callers issue the same GET at the same time (e.g. two services
+both loading active memberships), only the first request reaches the network;
+the others wait for it and share its response. Requests are identified by
+:func:`~evo_client.utils.cache_utils.request_key`, so different credentials
+never share a response. Groups are process-wide, so clients of different
+services coalesce with each other.
+"""
+
+import asyncio
+from threading import Event
+from threading import Lock as ThreadLock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """An in-flight call and, once finished, its outcome."""
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads."""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = ThreadLock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn``, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identity of the call
+            fn: The call to run when none is in flight
+
+        Returns:
+            The result of the call, shared by every caller that waited on it
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Runs at most one call per key and event loop at a time."""
+
+    def __init__(self):
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn``, or the in-flight call with the same key.
+
+        The call runs as its own task, so a cancelled caller does not cancel
+        it for the others.
+
+        Args:
+            key: Identity of the call
+            fn: The call to run when none is in flight
+
+        Returns:
+            The result of the call, shared by every caller that awaited it
+        """
+        flight_key = (asyncio.get_running_loop(), key)
+        task = self._calls.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[flight_key] = task
+
+            def _forget(finished: asyncio.Future) -> None:
+                if self._calls.get(flight_key) is finished:
+                    del self._calls[flight_key]
+
+            task.add_done_callback(_forget)
+        return await asyncio.shield(task)
+
+
+_shared_single_flight = SingleFlight()
+_shared_async_single_flight = AsyncSingleFlight()
+
+
+def get_shared_single_flight() -> SingleFlight:
+    """Get the process-wide group coalescing sync requests."""
+    return _shared_single_flight
+
+
+def get_shared_async_single_flight() -> AsyncSingleFlight:
+    """Get the process-wide group coalescing async requests."""
+    return _shared_async_single_flight
@@ -1,11 +1,11 @@
 from typing import List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 import requests
 from pydantic import BaseModel
 
-from evo_client.core.response import RESTResponse
+from evo_client.core.response import RESTResponse, response_validator
 from evo_client.exceptions.api_exceptions import ApiException
 
 
@@ -78,7 +78,29 @@ def test_rest_response_json_with_non_json_content_type(mock_urllib3_response):
     # No error should be raised if the underlying json() method succeeds
     data = response.json()
     assert data == {"key": "value"}
-    mock_urllib3_response.json.assert_called_once()
+    # The body is parsed from the raw content, not through requests
+    mock_urllib3_response.json.assert_not_called()
+
+
+def test_rest_response_json_parses_body_once(mock_urllib3_response):
+    """Test json method of RESTResponse caches the parsed body."""
+    response = RESTResponse(mock_urllib3_response)
+    with patch(
+        "evo_client.core.response.json_utils.loads", return_value={"key": "value"}
+    ) as loads:
+        assert response.json() is response.json()
+        assert response.deserialize(SomeBaseModel) == SomeBaseModel(key="value")
+    loads.assert_called_once_with(b'{"key": "value"}')
+
+
+def test_rest_response_json_invalid_non_json_content(mock_urllib3_response):
+    """Test json method of RESTResponse rejects non-JSON bodies."""
+    mock_urllib3_response.content = b"<html></html>"
+    mock_urllib3_response.headers = {"Content-Type": "text/html"}
+    response = RESTResponse(mock_urllib3_response)
+
+    with pytest.raises(ValueError, match="not in JSON format"):
+        response.json()
 
 
 def test_rest_response_deserialize(mock_urllib3_response):
@@ -166,3 +188,31 @@ def test_error_handling():
         "HTTP response headers: {'Content-Type': 'application/json'}\n"
         'HTTP response body: b\'{"id": 1, "name": "test"}\''
     )
+
+
+def test_deserialize_list_validates_json_bytes_directly(mock_urllib3_response_list):
+    """Test list responses are validated from the body without parsing it first."""
+    response = RESTResponse(mock_urllib3_response_list)
+    with patch("evo_client.core.response.json_utils.loads") as loads:
+        result = response.deserialize(List[SomeBaseModel])
+
+    loads.assert_not_called()
+    assert result == [SomeBaseModel(key="value"), SomeBaseModel(key="value")]
+
+
+def test_response_validator_is_cached_per_type():
+    """Test adapters are built once per response type."""
+    assert response_validator(List[SomeBaseModel]) is response_validator(
+        List[SomeBaseModel]
+    )
+    assert response_validator(SomeBaseModel) is not None
+    assert response_validator(dict) is None
+
+
+def test_deserialize_invalid_item_raises(mock_urllib3_response_list):
+    """Test invalid items fail validation of the whole list."""
+    mock_urllib3_response_list.content = b'[{"key": "value"}, {"other": 1}]'
+    response = RESTResponse(mock_urllib3_response_list)
+
+    with pytest.raises(ValueError):
+        response.deserialize(List[SomeBaseModel])
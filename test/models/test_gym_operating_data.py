@@ -0,0 +1,69 @@
+"""Tests for the member segmentation of GymOperatingData."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from evo_client.models.gym_model import (
+    GymEntry,
+    GymOperatingData,
+    Receivable,
+    SegmentThresholds,
+)
+
+
+def entries(member_id, count):
+    return [
+        GymEntry(
+            id=member_id * 100 + i,
+            member_id=member_id,
+            register_date=datetime(2024, 1, 1),
+            notes=None,
+        )
+        for i in range(count)
+    ]
+
+
+def receivable(member_id, amount):
+    return Receivable(id=member_id, member_id=member_id, amount=Decimal(amount))
+
+
+@pytest.fixture
+def operating_data():
+    return GymOperatingData(
+        active_members=[{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {}],
+        recent_entries=entries(1, 5) + entries(2, 6) + entries(3, 1),
+        receivables=[
+            receivable(1, "800"),
+            receivable(1, "400"),
+            receivable(2, "300"),
+            receivable(3, "50"),
+        ],
+    )
+
+
+def test_segments_by_visits_and_revenue(operating_data):
+    operating_data._segment_members()
+    segments = operating_data.member_segments
+
+    assert segments["premium"].member_ids == [1]
+    assert segments["premium"].average_revenue == Decimal("1200")
+    assert segments["regular"].member_ids == [2]
+    assert segments["at_risk"].member_ids == [3]
+    assert segments["inactive"].member_ids == [4]
+    assert segments["inactive"].average_revenue == Decimal("0.00")
+
+
+def test_configurable_thresholds(operating_data):
+    operating_data.segment_thresholds = SegmentThresholds(
+        min_regular_visits=1, premium_min_revenue=Decimal("200")
+    )
+
+    operating_data._segment_members()
+    segments = operating_data.member_segments
+
+    assert segments["premium"].member_ids == [1, 2]
+    assert segments["premium"].average_revenue == Decimal("750")
+    assert segments["regular"].member_ids == [3]
+    assert segments["at_risk"].member_count == 0
@@ -0,0 +1,120 @@
+"""Tests for the aggregated metrics of MembersFiles."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from evo_client.models.gym_model import (
+    MemberProfile,
+    MembersFiles,
+    MembershipContract,
+    MembershipStatus,
+)
+
+NOW = datetime(2024, 7, 1)
+
+
+def contract(start_date, end_date=None):
+    # The plan is irrelevant to the aggregates
+    return MembershipContract.model_construct(start_date=start_date, end_date=end_date)
+
+
+def profile(member_id, paid="0", active=False, contracts=()):
+    return MemberProfile(
+        member_id=member_id,
+        name=f"Member {member_id}",
+        status=MembershipStatus.ACTIVE if active else MembershipStatus.PENDING,
+        total_paid=Decimal(paid),
+        contracts_history=list(contracts),
+    )
+
+
+@pytest.fixture
+def profiles():
+    return [
+        profile(1, "100.50", active=True, contracts=[contract(datetime(2024, 1, 1))]),
+        profile(
+            2, "49.50", contracts=[contract(datetime(2023, 1, 1), datetime(2023, 7, 1))]
+        ),
+        profile(3),
+    ]
+
+
+def test_add_members_computes_every_metric(profiles):
+    files = MembersFiles(member_ids=[1, 2, 3])
+
+    for member in profiles:
+        files.add_member(member)
+    files.finalize(now=NOW)
+
+    assert files.total_members == 3
+    assert files.active_members == 1
+    assert files.total_revenue == Decimal("150.00")
+    # 182 days open plus 181 days closed, in 30.44-day months, over 3 members
+    expected = (
+        Decimal(str(182 / Decimal("30.44"))) + Decimal(str(181 / Decimal("30.44")))
+    ) / 3
+    assert files.average_lifetime == expected
+
+
+def test_bulk_add_members_finalizes(profiles):
+    files = MembersFiles(member_ids=[1, 2, 3])
+
+    files.add_members(profiles)
+
+    assert files.total_members == 3
+    assert files.average_lifetime > 0
+
+
+def test_replacing_a_member_updates_aggregates(profiles):
+    files = MembersFiles(member_ids=[1, 2, 3])
+    files.add_members(profiles)
+
+    files.add_member(profile(1, "10"))
+    files.finalize(now=NOW)
+
+    assert files.total_members == 3
+    assert files.active_members == 0
+    assert files.total_revenue == Decimal("59.50")
+    assert files.average_lifetime == Decimal(str(181 / Decimal("30.44"))) / 3
+
+
+def test_empty_files():
+    files = MembersFiles(member_ids=[])
+
+    files.add_members([])
+
+    assert files.total_members == 0
+    assert files.average_lifetime == Decimal("0.00")
+
+
+def test_replacing_a_mutated_member_removes_its_original_share(profiles):
+    files = MembersFiles(member_ids=[1, 2, 3])
+    files.add_members(profiles)
+
+    # The fetcher may keep updating the same profile object before re-adding it
+    member = profiles[0]
+    member.total_paid = Decimal("60.50")
+    member.contracts_history.append(contract(datetime(2024, 3, 1)))
+    files.add_member(member)
+
+    assert files.total_members == 3
+    assert files.total_revenue == Decimal("110.00")
+
+
+def test_members_passed_at_construction_are_aggregated(profiles):
+    files = MembersFiles(
+        member_ids=[1, 2, 3], members={member.member_id: member for member in profiles}
+    )
+
+    assert files.total_members == 3
+    assert files.active_members == 1
+    assert files.total_revenue == Decimal("150.00")
+    assert files.average_lifetime > 0
+
+    files.add_member(profile(1, "10"))
+    files.finalize(now=NOW)
+
+    assert files.total_revenue == Decimal("59.50")
+    assert files.average_lifetime == Decimal(str(181 / Decimal("30.44"))) / 3
@@ -0,0 +1,200 @@
+"""Tests for the async data fetchers."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from evo_client.models.cliente_detalhes_basicos_api_view_model import (
+    ClienteDetalhesBasicosApiViewModel,
+)
+from evo_client.models.contratos_resumo_api_view_model import (
+    ContratosResumoApiViewModel,
+    ContratosResumoContainerViewModel,
+)
+from evo_client.models.members_api_view_model import MembersApiViewModel
+from evo_client.services.aio_data_fetchers import (
+    AsyncBaseDataFetcher,
+    AsyncBranchApiClientManager,
+)
+from evo_client.services.aio_data_fetchers.member_data_fetcher import (
+    AsyncMemberDataFetcher,
+)
+from evo_client.services.aio_data_fetchers.membership_data_fetcher import (
+    AsyncMembershipDataFetcher,
+)
+from evo_client.utils.rate_limit_utils import AsyncTokenBucketRateLimiter
+
+MODULE = "evo_client.services.aio_data_fetchers.member_data_fetcher"
+
+
+class TestAsyncBranchApiClientManager:
+    """Test suite for AsyncBranchApiClientManager."""
+
+    def test_branch_ids_are_integers(self):
+        manager = AsyncBranchApiClientManager({"1": Mock(), "2": Mock()})
+        assert manager.branch_ids == [1, 2]
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            AsyncBranchApiClientManager({}, max_concurrent_branches=0)
+
+    async def test_close_closes_clients(self):
+        client = Mock()
+        client.__aexit__ = AsyncMock()
+        async with AsyncBranchApiClientManager({"1": client}):
+            pass
+        client.__aexit__.assert_awaited_once()
+
+
+class TestAsyncMemberDataFetcher:
+    """Test suite for AsyncMemberDataFetcher class."""
+
+    @pytest.fixture
+    def client_manager(self):
+        return AsyncBranchApiClientManager(
+            {"1": Mock(), "2": Mock(), "3": Mock()}, max_concurrent_branches=2
+        )
+
+    @pytest.fixture
+    def member_fetcher(self, client_manager):
+        return AsyncMemberDataFetcher(client_manager)
+
+    def test_inheritance(self, member_fetcher):
+        assert isinstance(member_fetcher, AsyncBaseDataFetcher)
+
+    async def test_gather_branches_respects_concurrency_limit(self, member_fetcher):
+        in_flight = 0
+        peak = 0
+
+        async def fetch(branch_id, client):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return branch_id
+
+        results = await member_fetcher.gather_branches(fetch)
+
+        assert [branch_id for branch_id, _ in results] == [1, 2, 3]
+        assert peak == 2
+
+    async def test_gather_branches_skips_failures_when_requested(
+        self, member_fetcher
+    ):
+        async def fetch(branch_id, client):
+            if branch_id == 2:
+                raise RuntimeError("boom")
+            return branch_id
+
+        with patch("evo_client.services.aio_data_fetchers.logger") as mock_logger:
+            results = await member_fetcher.gather_branches(
+                fetch, raise_on_error=False
+            )
+
+        assert results == [(1, 1), (3, 3)]
+        mock_logger.warning.assert_called_once()
+
+    async def test_fetch_member_by_id_specific_branch(self, member_fetcher):
+        expected = ClienteDetalhesBasicosApiViewModel(idMember=12345, firstName="A")
+        mock_api = Mock()
+        mock_api.get_member_profile = AsyncMock(return_value=expected)
+
+        with patch(f"{MODULE}.AsyncMembersApi", return_value=mock_api):
+            result = await member_fetcher.fetch_member_by_id("12345", branch_id=1)
+
+        assert result == expected
+        mock_api.get_member_profile.assert_awaited_once_with(id_member=12345)
+
+    async def test_fetch_member_by_id_probes_branches(self, member_fetcher):
+        expected = ClienteDetalhesBasicosApiViewModel(idMember=12345, firstName="A")
+        missing = Mock()
+        missing.get_member_profile = AsyncMock(return_value=None)
+        failing = Mock()
+        failing.get_member_profile = AsyncMock(side_effect=Exception("Branch error"))
+        found = Mock()
+        found.get_member_profile = AsyncMock(return_value=expected)
+
+        with patch(
+            f"{MODULE}.AsyncMembersApi", side_effect=[missing, failing, found]
+        ), patch(f"{MODULE}.logger") as mock_logger:
+            result = await member_fetcher.fetch_member_by_id("12345")
+
+        assert result == expected
+        mock_logger.warning.assert_called_once()
+
+    async def test_fetch_member_by_id_probes_take_limiter_tokens(
+        self, member_fetcher, client_manager
+    ):
+        for client in client_manager.branch_api_clients.values():
+            client.rate_limiter = Mock(spec=AsyncTokenBucketRateLimiter)
+        mock_api = Mock()
+        mock_api.get_member_profile = AsyncMock(return_value=None)
+
+        with patch(f"{MODULE}.AsyncMembersApi", return_value=mock_api):
+            await member_fetcher.fetch_member_by_id("99999")
+
+        for client in client_manager.branch_api_clients.values():
+            client.rate_limiter.acquire.assert_awaited_once()
+            client.rate_limiter.on_success.assert_called_once()
+
+    async def test_fetch_member_by_id_not_found(self, member_fetcher):
+        mock_api = Mock()
+        mock_api.get_member_profile = AsyncMock(return_value=None)
+
+        with patch(f"{MODULE}.AsyncMembersApi", return_value=mock_api):
+            result = await member_fetcher.fetch_member_by_id("99999")
+
+        assert result is None
+
+    async def test_fetch_members_combines_branches(self, member_fetcher):
+        members = [
+            MembersApiViewModel(idMember=i, firstName="Member") for i in (1, 2, 3)
+        ]
+
+        with patch(
+            f"{MODULE}.async_paginated_api_call",
+            AsyncMock(side_effect=[[m] for m in members]),
+        ) as mock_paginated, patch(f"{MODULE}.AsyncMembersApi"):
+            result = await member_fetcher.fetch_members(name="Test", status=1)
+
+        assert result == members
+        assert mock_paginated.await_count == 3
+        assert {
+            call.kwargs["branch_id_logging"] for call in mock_paginated.await_args_list
+        } == {"1", "2", "3"}
+
+    async def test_fetch_members_exception_handling(self, member_fetcher):
+        with patch(
+            f"{MODULE}.async_paginated_api_call",
+            AsyncMock(side_effect=Exception("Pagination error")),
+        ), patch(f"{MODULE}.AsyncMembersApi"):
+            with pytest.raises(ValueError, match="Error fetching members"):
+                await member_fetcher.fetch_members()
+
+
+class TestAsyncMembershipDataFetcher:
+    """Test suite for AsyncMembershipDataFetcher class."""
+
+    async def test_fetch_memberships_flattens_containers(self):
+        fetcher = AsyncMembershipDataFetcher(
+            AsyncBranchApiClientManager({"1": Mock()})
+        )
+        plans = [
+            ContratosResumoApiViewModel(idMembership=1),
+            ContratosResumoApiViewModel(idMembership=2),
+        ]
+        container = ContratosResumoContainerViewModel(list=plans, qtdRegistros=2)
+
+        with patch(
+            "evo_client.services.aio_data_fetchers.membership_data_fetcher."
+            "async_paginated_api_call",
+            AsyncMock(return_value=[container]),
+        ), patch(
+            "evo_client.services.aio_data_fetchers.membership_data_fetcher."
+            "AsyncMembershipApi"
+        ):
+            result = await fetcher.fetch_memberships(active=True)
+
+        assert result == plans
@@ -0,0 +1,141 @@
+"""Tests for the columnar Parquet export."""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from evo_client.models.receivables_api_view_model import ReceivablesApiViewModel
+from evo_client.services.columnar_export import ColumnarExportService, model_columns
+from evo_client.services.columnar_export.parquet_sink import (
+    NULL_PARTITION,
+    column_value,
+    partition_value,
+)
+from evo_client.services.data_fetchers import BranchApiClientManager
+
+
+def receivable_dict(id_receivable, due_date, ammount=10.0):
+    return {
+        "idReceivable": id_receivable,
+        "dueDate": due_date,
+        "ammount": ammount,
+        "status": {"id": 1, "name": "Open"},
+    }
+
+
+def column(name):
+    return next(c for c in model_columns(ReceivablesApiViewModel) if c.name == name)
+
+
+class TestColumns:
+    """Test the schema and value conversion, which need no pyarrow."""
+
+    def test_columns_use_api_names_and_scalar_kinds(self):
+        assert column("id_receivable").alias == "idReceivable"
+        assert column("id_receivable").kind == "int64"
+        assert column("due_date").kind == "timestamp"
+        assert column("status").kind == "json"
+
+    def test_values_from_dicts_and_models_match(self):
+        raw = receivable_dict(1, "2024-01-05T00:00:00")
+        model = ReceivablesApiViewModel.model_validate(raw)
+
+        for name in ("id_receivable", "due_date", "ammount", "status"):
+            assert column_value(raw, column(name)) == column_value(model, column(name))
+        assert column_value(raw, column("due_date")) == datetime(2024, 1, 5)
+        assert json.loads(column_value(raw, column("status")))["name"] == "Open"
+
+    def test_utc_timestamps_parse_like_models(self):
+        raw = receivable_dict(1, "2024-01-05T10:00:00.5Z")
+        model = ReceivablesApiViewModel.model_validate(raw)
+
+        value = column_value(raw, column("due_date"))
+
+        assert value == column_value(model, column("due_date"))
+        assert value.utcoffset() == timedelta(0)
+
+    def test_partition_value(self):
+        due_date = column("due_date")
+
+        assert partition_value({"dueDate": "2024-01-05T10:00:00"}, due_date) == (
+            "2024-01-05"
+        )
+        assert (
+            partition_value(
+                {"dueDate": datetime(2024, 1, 5)}, due_date, granularity="month"
+            )
+            == "2024-01"
+        )
+        assert partition_value({}, due_date) == NULL_PARTITION
+
+
+class TestParquetSink:
+    """Test writing partitioned Parquet files."""
+
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_writes_hive_partitions(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        from evo_client.services.columnar_export import ParquetSink
+
+        with ParquetSink(tmp_path, "receivables", 7) as sink:
+            sink.write(
+                [
+                    receivable_dict(1, "2024-01-05T00:00:00"),
+                    receivable_dict(2, "2024-01-05T08:00:00"),
+                ]
+            )
+            sink.write([receivable_dict(3, "2024-02-01T00:00:00")])
+
+        root = tmp_path / "receivables" / "branch_id=7"
+        january = pq.read_table(root / "date=2024-01-05")
+        assert sorted(january.column("idReceivable").to_pylist()) == [1, 2]
+        assert len(list((root / "date=2024-02-01").glob("*.parquet"))) == 1
+        assert sink.rows_written == 3
+
+    def test_failed_export_discards_buffer(self, tmp_path):
+        from evo_client.services.columnar_export import ParquetSink
+
+        with pytest.raises(RuntimeError):
+            with ParquetSink(tmp_path, "receivables", 7) as sink:
+                sink.write([receivable_dict(1, "2024-01-05T00:00:00")])
+                raise RuntimeError("page failed")
+
+        assert not list(tmp_path.rglob("*.parquet"))
+
+
+class TestColumnarExportService:
+    """Test exporting every branch."""
+
+    @pytest.fixture
+    def exporter(self):
+        client_manager = BranchApiClientManager(branch_api_clients={"1": Mock()})
+        return ColumnarExportService(client_manager)
+
+    def test_unknown_entity(self, exporter, tmp_path):
+        with pytest.raises(ValueError, match="Unknown entity"):
+            exporter.export("prospects", tmp_path)
+
+    def test_exports_dict_pages(self, exporter, tmp_path):
+        pytest.importorskip("pyarrow")
+        from evo_client.utils.record_utils import resolve_record_mode
+
+        modes = []
+
+        def pages(*args, **kwargs):
+            modes.append(resolve_record_mode(Mock(record_mode="model")))
+            yield [receivable_dict(1, "2024-01-05T00:00:00")]
+
+        with patch(
+            "evo_client.services.columnar_export.columnar_export_service.iter_pages",
+            side_effect=pages,
+        ):
+            exported = exporter.export("receivables", tmp_path)
+
+        assert exported == {1: 1}
+        assert modes == ["dict"]
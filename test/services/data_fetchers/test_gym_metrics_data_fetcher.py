@@ -0,0 +1,145 @@
+"""Tests for GymMetricsDataFetcher."""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from evo_client.models.gym_model import GymEntry
+from evo_client.models.members_api_view_model import MembersApiViewModel
+from evo_client.models.receivables_api_view_model import ReceivablesApiViewModel
+from evo_client.services.data_fetchers import BranchApiClientManager
+from evo_client.services.data_fetchers.gym_metrics_data_fetcher import (
+    GymMetricsDataFetcher,
+)
+
+# Membership dates the API filters each status on, by member ID
+MEMBERSHIP_DATES = {
+    1: (
+        "membership_start_date",
+        {1: datetime(2024, 1, 5), 2: datetime(2024, 2, 5), 3: datetime(2024, 2, 6)},
+    ),
+    2: ("membership_cancel_date", {1: datetime(2024, 2, 10)}),
+}
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = GymMetricsDataFetcher(
+        BranchApiClientManager(branch_api_clients={"1": Mock()})
+    )
+
+    def fetch_members(status, **filters):
+        # Like the API, filter on memberships the returned members do not carry
+        field, dates = MEMBERSHIP_DATES[status]
+        start, end = filters[f"{field}_start"], filters[f"{field}_end"]
+        return [
+            MembersApiViewModel(idMember=member_id)
+            for member_id, date in dates.items()
+            if start <= date <= end
+        ]
+
+    fetcher.member_fetcher = Mock(fetch_members=Mock(side_effect=fetch_members))
+    fetcher.prospects_fetcher = Mock(fetch_prospects=Mock(return_value=[]))
+    fetcher.entries_fetcher = Mock(fetch_entries=Mock(return_value=[]))
+    fetcher.receivables_fetcher = Mock(
+        fetch_receivables=Mock(
+            return_value=[
+                ReceivablesApiViewModel(
+                    ammount=30.0,
+                    ammountPaid=30.0,
+                    dueDate=datetime(2024, 1, 20),
+                    idMemberPayer=1,
+                ),
+                ReceivablesApiViewModel(
+                    ammount=20.0,
+                    ammountPaid=20.0,
+                    dueDate=datetime(2024, 2, 20),
+                    idMemberPayer=2,
+                ),
+            ]
+        )
+    )
+    fetcher.membership_fetcher = Mock(fetch_memberships=Mock(return_value=[]))
+    return fetcher
+
+
+def test_periods_share_one_fetch_per_entity(fetcher):
+    trend = fetcher.fetch_rolling_metrics(
+        count=12, to_date=datetime(2024, 3, 1), days=30
+    )
+
+    assert len(trend) == 12
+    assert fetcher.receivables_fetcher.fetch_receivables.call_count == 1
+    # Members cannot be partitioned locally, so each period fetches its own
+    assert fetcher.member_fetcher.fetch_members.call_count == 24
+    assert fetcher.membership_fetcher.fetch_memberships.call_count == 1
+    union = fetcher.receivables_fetcher.fetch_receivables.call_args.kwargs
+    assert union["due_date_end"] - union["due_date_start"] == (
+        datetime(2024, 3, 1) - trend[0].data_from
+    )
+
+
+def test_records_are_partitioned_by_period(fetcher):
+    previous, current = fetcher.fetch_metrics_trend(
+        [
+            (datetime(2024, 1, 1), datetime(2024, 2, 1)),
+            (datetime(2024, 2, 1), datetime(2024, 3, 1)),
+        ]
+    )
+
+    assert previous.total_active_members == 1
+    assert previous.total_paid == Decimal("30.0")
+    assert current.total_active_members == 2
+    assert current.total_churned_members == 1
+    assert current.total_paid == Decimal("20.0")
+    assert current.mrr == Decimal("0.00")
+    # The current period is compared to the previous one
+    assert current.membership_growth_rate == Decimal("100")
+
+
+def test_advanced_metrics_is_current_period(fetcher):
+    data = fetcher.fetch_advanced_metrics(
+        from_date=datetime(2024, 2, 1), to_date=datetime(2024, 3, 1)
+    )
+
+    assert data.data_from == datetime(2024, 2, 1)
+    assert data.total_active_members == 2
+    assert fetcher.entries_fetcher.fetch_entries.call_args.kwargs[
+        "register_date_start"
+    ] == datetime(2024, 1, 2)
+
+
+def test_members_on_a_boundary_count_in_one_period(fetcher, monkeypatch):
+    field, dates = MEMBERSHIP_DATES[1]
+    monkeypatch.setitem(
+        MEMBERSHIP_DATES, 1, (field, {**dates, 4: datetime(2024, 2, 1)})
+    )
+
+    previous, current = fetcher.fetch_metrics_trend(
+        [
+            (datetime(2024, 1, 1), datetime(2024, 2, 1)),
+            (datetime(2024, 2, 1), datetime(2024, 3, 1)),
+        ]
+    )
+
+    assert previous.total_active_members == 1
+    assert current.total_active_members == 3
+
+
+def test_advanced_metrics_keeps_current_records(fetcher):
+    fetcher.entries_fetcher.fetch_entries.return_value = [
+        GymEntry(idEntry=1, idMember=2, registerDate=datetime(2024, 2, 7), notes=None)
+    ]
+
+    data = fetcher.fetch_advanced_metrics(
+        from_date=datetime(2024, 2, 1), to_date=datetime(2024, 3, 1)
+    )
+
+    assert [member["id_member"] for member in data.active_members] == [2, 3]
+    assert [r.member_id for r in data.receivables] == [2]
+    assert [entry.member_id for entry in data.recent_entries] == [2]
+    data._segment_members()
+    assert data.member_segments["at_risk"].member_ids == [2]
+    assert data.member_segments["inactive"].member_ids == [3]
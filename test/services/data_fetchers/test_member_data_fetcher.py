@@ -9,8 +9,14 @@ from evo_client.models.cliente_detalhes_basicos_api_view_model import (
     ClienteDetalhesBasicosApiViewModel,
 )
 from evo_client.models.members_api_view_model import MembersApiViewModel
-from evo_client.services.data_fetchers import BaseDataFetcher, BranchApiClientManager
+from evo_client.services.data_fetchers import (
+    BaseDataFetcher,
+    BranchApiClientManager,
+    MemberBranchRoutes,
+)
 from evo_client.services.data_fetchers.member_data_fetcher import MemberDataFetcher
+from evo_client.utils.pagination_utils import PacingProfile
+from evo_client.utils.rate_limit_utils import TokenBucketRateLimiter
 
 
 class TestMemberDataFetcher:
@@ -22,6 +28,7 @@ class TestMemberDataFetcher:
         mock_manager = Mock(spec=BranchApiClientManager)
         mock_manager.branch_api_clients = {"1": Mock(), "2": Mock(), "3": Mock()}
         mock_manager.branch_ids = [1, 2, 3]
+        mock_manager.member_routes = MemberBranchRoutes()
         return mock_manager
 
     @pytest.fixture
@@ -249,6 +256,7 @@ class TestMemberDataFetcher:
         # Verify all parameters were passed to paginated_api_call
         mock_paginated.assert_called_with(
             api_func=mock_members_api.get_members,
+            **member_fetcher.get_pacing("members"),
             branch_id_logging="1",
             name="Test Name",
             email="test@example.com",
@@ -342,3 +350,147 @@ class TestMemberDataFetcher:
 
         assert result == []
         assert mock_paginated.call_count == 2  # Called for both branches
+
+    def test_fetch_members_branch_scope(self, member_fetcher, mock_client_manager):
+        """Test fetch_members only queries the requested branches."""
+        with patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.paginated_api_call"
+        ) as mock_paginated, patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.SyncMembersApi"
+        ):
+            mock_paginated.return_value = []
+            member_fetcher.get_branch_api = Mock(return_value=Mock())
+            member_fetcher.get_available_branch_ids = Mock(return_value=[1, 2, 3])
+
+            member_fetcher.fetch_members(branch_ids=[2, 99])
+
+        # Unknown branch 99 is ignored, branches 1 and 3 are never queried
+        mock_paginated.assert_called_once()
+        assert mock_paginated.call_args.kwargs["branch_id_logging"] == "2"
+
+    def test_fetch_members_uses_endpoint_pacing(self, mock_client_manager):
+        """Test that a custom pacing profile is applied to the members endpoint."""
+        fetcher = MemberDataFetcher(
+            mock_client_manager,
+            pacing_profiles={"members": PacingProfile(page_size=25, max_retries=2)},
+        )
+        with patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.paginated_api_call"
+        ) as mock_paginated, patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.SyncMembersApi"
+        ):
+            mock_paginated.return_value = []
+            fetcher.get_branch_api = Mock(return_value=Mock())
+            fetcher.get_available_branch_ids = Mock(return_value=[1])
+
+            fetcher.fetch_members()
+
+        kwargs = mock_paginated.call_args.kwargs
+        assert kwargs["page_size"] == 25
+        assert kwargs["max_retries"] == 2
+        assert kwargs["post_request_delay"] == 0.0
+
+
+class TestFetchMembersByIds:
+    """Test bulk member lookup by ID."""
+
+    # Members owned by each branch
+    OWNERS = {1: 1, 2: 2, 3: 2, 4: 3}
+
+    @pytest.fixture
+    def client_manager(self):
+        return BranchApiClientManager(
+            branch_api_clients={"1": Mock(), "2": Mock(), "3": Mock()}
+        )
+
+    @pytest.fixture
+    def fetcher(self, client_manager):
+        return MemberDataFetcher(client_manager)
+
+    @pytest.fixture
+    def calls(self):
+        """Patch the members endpoint so each member is only found in its branch."""
+        calls = []
+
+        def get_members(**kwargs):
+            branch_id = int(kwargs["branch_id_logging"])
+            ids = [int(i) for i in kwargs["ids_members"].split(",")]
+            calls.append((branch_id, ids))
+            return [
+                MembersApiViewModel(idMember=member_id)
+                for member_id in ids
+                if self.OWNERS.get(member_id) == branch_id
+            ]
+
+        with patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.paginated_api_call",
+            side_effect=get_members,
+        ):
+            yield calls
+
+    def test_probes_branches_for_misses_only(self, fetcher, client_manager, calls):
+        members = fetcher.fetch_members_by_ids([3, 1, 2, 99])
+
+        assert sorted(members) == [1, 2, 3]
+        assert calls == [(1, [3, 1, 2, 99]), (2, [3, 2, 99]), (3, [99])]
+        assert client_manager.member_routes.get(3) == 2
+
+    def test_known_routes_skip_probing(self, fetcher, client_manager, calls):
+        client_manager.member_routes.update({3: 2, 4: 3})
+
+        members = fetcher.fetch_members_by_ids([4, 3])
+
+        assert sorted(members) == [3, 4]
+        assert sorted(calls) == [(2, [3]), (3, [4])]
+
+    def test_ids_are_chunked(self, fetcher, calls):
+        fetcher.fetch_members_by_ids([1, 2, 3], branch_ids=[2], chunk_size=2)
+
+        assert calls == [(2, [1, 2]), (2, [3])]
+
+    def test_fetch_member_by_id_uses_known_route(self, fetcher, client_manager):
+        client_manager.member_routes.update({4: 3})
+        with patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.SyncMembersApi"
+        ) as members_api:
+            members_api.return_value.get_member_profile.return_value = Mock()
+
+            fetcher.fetch_member_by_id("4")
+
+        members_api.assert_called_once_with(
+            api_client=client_manager.branch_api_clients["3"]
+        )
+
+    def test_fetch_member_by_id_falls_through_failing_route(
+        self, fetcher, client_manager
+    ):
+        client_manager.member_routes.update({4: 1})
+        moved = Mock()
+        stale = Mock(get_member_profile=Mock(side_effect=Exception("Not found")))
+        missing = Mock(get_member_profile=Mock(return_value=None))
+        found = Mock(get_member_profile=Mock(return_value=moved))
+        with patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.SyncMembersApi",
+            side_effect=[stale, missing, found],
+        ):
+            result = fetcher.fetch_member_by_id("4")
+
+        assert result is moved
+        assert client_manager.member_routes.get(4) == 3
+
+    def test_fetch_member_by_id_probes_take_limiter_tokens(
+        self, fetcher, client_manager
+    ):
+        for client in client_manager.branch_api_clients.values():
+            client.rate_limiter = Mock(spec=TokenBucketRateLimiter)
+        client_manager.member_routes.update({4: 1})
+        with patch(
+            "evo_client.services.data_fetchers.member_data_fetcher.SyncMembersApi"
+        ) as members_api:
+            members_api.return_value.get_member_profile.return_value = None
+
+            fetcher.fetch_member_by_id("4")
+
+        # The remembered branch and every other branch each take one token
+        for client in client_manager.branch_api_clients.values():
+            client.rate_limiter.acquire.assert_called_once()
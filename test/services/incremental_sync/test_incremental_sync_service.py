@@ -0,0 +1,141 @@
+"""Tests for the incremental sync service."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from evo_client.models.receivables_api_view_model import ReceivablesApiViewModel
+from evo_client.services.data_fetchers import BranchApiClientManager
+from evo_client.services.incremental_sync import (
+    InMemoryEntityStore,
+    IncrementalSyncService,
+    JsonWatermarkStore,
+)
+from evo_client.utils.record_utils import record_mode, resolve_record_mode
+
+MODULE = "evo_client.services.incremental_sync.incremental_sync_service"
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+def receivable(id_receivable, description="r"):
+    return ReceivablesApiViewModel.model_validate(
+        {"idReceivable": id_receivable, "description": description}
+    )
+
+
+@pytest.fixture
+def service(tmp_path):
+    return IncrementalSyncService(
+        BranchApiClientManager({"1": Mock(), "2": Mock()}),
+        entity_store=InMemoryEntityStore(),
+        watermark_store=JsonWatermarkStore(tmp_path / "watermarks.json"),
+    )
+
+
+class TestIncrementalSyncService:
+    """Test suite for IncrementalSyncService."""
+
+    def test_first_run_is_full_pull_and_sets_mark(self, service):
+        with patch(f"{MODULE}.iter_items", return_value=iter([receivable(1)])) as it:
+            result = service.sync("receivables", branch_ids=[1], now=NOW)
+
+        assert result == {1: 1}
+        assert it.call_args.kwargs["update_date_start"] is None
+        assert it.call_args.kwargs["update_date_end"] == NOW
+        assert service.watermark_store.get("receivables", 1) == NOW
+
+    def test_next_run_fetches_changes_since_mark_and_merges(self, service):
+        service.watermark_store.set("receivables", 1, NOW)
+        service.entity_store.upsert(
+            "receivables", 1, [("1", receivable(1, "old")), ("2", receivable(2))]
+        )
+        later = NOW + timedelta(hours=1)
+
+        with patch(
+            f"{MODULE}.iter_items", return_value=iter([receivable(1, "new")])
+        ) as it:
+            result = service.sync("receivables", branch_ids=[1], now=later)
+
+        assert result == {1: 1}
+        assert it.call_args.kwargs["update_date_start"] == NOW - service.overlap
+        stored = service.entity_store.get_all("receivables", branch_id=1)
+        assert sorted((r.id_receivable, r.description) for r in stored) == [
+            (1, "new"),
+            (2, "r"),
+        ]
+        assert service.watermark_store.get("receivables", 1) == later
+
+    def test_failed_branch_keeps_its_mark(self, service):
+        service.watermark_store.set("receivables", 1, NOW)
+
+        def failing(**kwargs):
+            yield receivable(1)
+            raise RuntimeError("boom")
+
+        with patch(f"{MODULE}.iter_items", side_effect=failing):
+            result = service.sync(
+                "receivables", branch_ids=[1], now=NOW + timedelta(hours=1)
+            )
+
+        assert result == {}
+        assert service.watermark_store.get("receivables", 1) == NOW
+
+    def test_long_gap_advances_mark_per_slice(self, service):
+        service.watermark_store.set("receivables", 1, NOW)
+        service.overlap = timedelta(0)
+        windows = []
+
+        def pull(**kwargs):
+            windows.append((kwargs["update_date_start"], kwargs["update_date_end"]))
+            if len(windows) == 3:
+                raise RuntimeError("boom")
+            yield receivable(len(windows))
+
+        with patch(f"{MODULE}.iter_items", side_effect=pull):
+            result = service.sync(
+                "receivables", branch_ids=[1], now=NOW + timedelta(days=2, hours=6)
+            )
+
+        assert result == {}
+        assert windows == [
+            (NOW, NOW + timedelta(days=1)),
+            (NOW + timedelta(days=1), NOW + timedelta(days=2)),
+            (NOW + timedelta(days=2), NOW + timedelta(days=2, hours=6)),
+        ]
+        # The merged slices are kept and the next run resumes after them
+        assert len(service.entity_store.get_all("receivables")) == 2
+        assert service.watermark_store.get("receivables", 1) == NOW + timedelta(days=2)
+
+    def test_records_are_fetched_as_models(self, service):
+        modes = []
+
+        def pull(**kwargs):
+            modes.append(resolve_record_mode(Mock(record_mode="dict")))
+            yield receivable(1)
+
+        with record_mode("dict"), patch(f"{MODULE}.iter_items", side_effect=pull):
+            service.sync("receivables", branch_ids=[1], now=NOW)
+
+        assert modes == ["model"]
+
+    def test_members_use_register_date_window(self, service):
+        member = Mock(id_member=7)
+        with patch(f"{MODULE}.iter_items", return_value=iter([member])) as it:
+            service.sync("members", branch_ids=[2], now=NOW)
+
+        assert it.call_args.kwargs["register_date_end"] == NOW
+        assert service.entity_store.get_all("members") == [member]
+
+    def test_unknown_entity(self, service):
+        with pytest.raises(ValueError, match="Unknown entity"):
+            service.sync("activities")
+
+    def test_sync_all_shares_window_end(self, service):
+        with patch(f"{MODULE}.iter_items", side_effect=lambda **kwargs: iter([])):
+            result = service.sync_all(entities=["receivables", "entries"])
+
+        assert set(result) == {"receivables", "entries"}
+        assert service.watermark_store.get(
+            "receivables", 1
+        ) == service.watermark_store.get("entries", 2)
@@ -0,0 +1,157 @@
+"""Tests for the SQLite entity store."""
+
+import threading
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from evo_client.models.entradas_resumo_api_view_model import EntradasResumoApiViewModel
+from evo_client.models.receivables_api_view_model import ReceivablesApiViewModel
+from evo_client.models.sales_view_model import SalesViewModel
+from evo_client.services.data_fetchers import BranchApiClientManager
+from evo_client.services.incremental_sync import (
+    IncrementalSyncService,
+    JsonWatermarkStore,
+    SqliteEntityStore,
+)
+
+
+def receivable(id_receivable, member_id, due_date, description="r"):
+    return ReceivablesApiViewModel.model_validate(
+        {
+            "idReceivable": id_receivable,
+            "idMemberPayer": member_id,
+            "dueDate": due_date.isoformat(),
+            "description": description,
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SqliteEntityStore(tmp_path / "entities.db") as store:
+        yield store
+
+
+class TestSqliteEntityStore:
+    """Test suite for SqliteEntityStore."""
+
+    def test_upsert_replaces_by_key_per_branch(self, store):
+        store.upsert_models("receivables", 1, [receivable(1, 10, datetime(2024, 1, 5))])
+        store.upsert_models(
+            "receivables", 1, [receivable(1, 10, datetime(2024, 1, 5), "new")]
+        )
+        store.upsert_models("receivables", 2, [receivable(1, 10, datetime(2024, 1, 5))])
+
+        assert store.count("receivables") == 2
+        assert store.count("receivables", branch_id=1) == 1
+        (stored,) = store.get_all("receivables", branch_id=1)
+        assert isinstance(stored, ReceivablesApiViewModel)
+        assert stored.description == "new"
+
+    def test_query_by_member_and_date(self, store):
+        store.upsert_models(
+            "receivables",
+            1,
+            [
+                receivable(1, 10, datetime(2024, 1, 5)),
+                receivable(2, 10, datetime(2024, 2, 5)),
+                receivable(3, 11, datetime(2024, 1, 20)),
+            ],
+        )
+
+        january = store.query(
+            "receivables",
+            date_field="due_date",
+            date_from=datetime(2024, 1, 1),
+            date_to=datetime(2024, 1, 31),
+        )
+        assert sorted(r.id_receivable for r in january) == [1, 3]
+        assert [r.id_receivable for r in store.query("receivables", member_id=11)] == [
+            3
+        ]
+
+    def test_query_rejects_unindexed_date(self, store):
+        with pytest.raises(ValueError, match="date_field must be one of"):
+            store.query("sales", date_field="removal_date", date_from=datetime.now())
+
+    def test_unknown_entity(self, store):
+        with pytest.raises(ValueError, match="Unknown entity"):
+            store.count("activities")
+
+    def test_failed_upsert_is_rolled_back(self, store):
+        def records():
+            yield "1", receivable(1, 10, datetime(2024, 1, 5))
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            store.upsert("receivables", 1, records())
+
+        assert store.count("receivables") == 0
+
+    def test_failed_upsert_keeps_committed_batches(self, store):
+        def records():
+            for i in range(3):
+                yield str(i), receivable(i, 10, datetime(2024, 1, 5))
+            raise RuntimeError("boom")
+
+        with patch(
+            "evo_client.services.incremental_sync.sqlite_entity_store."
+            "_UPSERT_BATCH_SIZE",
+            2,
+        ), pytest.raises(RuntimeError):
+            store.upsert("receivables", 1, records())
+
+        assert store.count("receivables") == 2
+
+    def test_reads_do_not_wait_for_a_running_upsert(self, store):
+        store.upsert_models("receivables", 1, [receivable(1, 10, datetime(2024, 1, 5))])
+        pulling, release = threading.Event(), threading.Event()
+
+        def records():
+            yield "2", receivable(2, 10, datetime(2024, 1, 6))
+            # The next page is still being fetched
+            pulling.set()
+            release.wait(5)
+            yield "3", receivable(3, 10, datetime(2024, 1, 7))
+
+        writer = threading.Thread(
+            target=store.upsert, args=("receivables", 1, records())
+        )
+        writer.start()
+        try:
+            assert pulling.wait(5)
+            assert store.count("receivables") == 1
+            assert len(store.query("receivables", member_id=10)) == 1
+        finally:
+            release.set()
+            writer.join(5)
+
+        assert store.count("receivables") == 3
+
+    def test_entries_and_sales_round_trip(self, store):
+        entry = EntradasResumoApiViewModel.model_validate(
+            {"date": "2024-01-05T10:00:00", "idMember": 10}
+        )
+        sale = SalesViewModel.model_validate({"idSale": 5, "idMember": 10})
+
+        store.upsert_models("entries", 1, [entry, entry])
+        store.upsert_models("sales", 1, [sale])
+
+        assert store.query("entries", member_id=10) == [entry]
+        assert store.query("sales", member_id=10) == [sale]
+
+    def test_incremental_sync_into_store(self, store, tmp_path):
+        service = IncrementalSyncService(
+            BranchApiClientManager({"1": Mock()}),
+            entity_store=store,
+            watermark_store=JsonWatermarkStore(tmp_path / "marks.json"),
+        )
+        with patch(
+            "evo_client.services.incremental_sync.incremental_sync_service.iter_items",
+            return_value=iter([receivable(1, 10, datetime(2024, 1, 5))]),
+        ):
+            assert service.sync("receivables") == {1: 1}
+
+        assert store.count("receivables", branch_id=1) == 1
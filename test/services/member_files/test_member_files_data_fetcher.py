@@ -0,0 +1,119 @@
+"""Tests for MemberFilesDataFetcher."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from evo_client.models.cliente_detalhes_basicos_api_view_model import (
+    ClienteDetalhesBasicosApiViewModel,
+)
+from evo_client.services.data_fetchers import BranchApiClientManager
+from evo_client.services.member_files.member_files_data_fetcher import (
+    MemberFilesDataFetcher,
+)
+from evo_client.utils.rate_limit_utils import TokenBucketRateLimiter
+
+MODULE = "evo_client.services.member_files.member_files_data_fetcher"
+
+# Members owned by each branch
+OWNERS = {101: "1", 102: "2", 103: "2"}
+
+
+@pytest.fixture
+def clients():
+    return {"1": Mock(name="branch1"), "2": Mock(name="branch2")}
+
+
+@pytest.fixture
+def fetcher(clients):
+    return MemberFilesDataFetcher(BranchApiClientManager(branch_api_clients=clients))
+
+
+@pytest.fixture
+def apis(clients):
+    """Patch the branch APIs so each member is only found in its owner branch."""
+    branch_of = {id(client): branch for branch, client in clients.items()}
+    profile_calls = []
+
+    def members_api(api_client):
+        branch = branch_of[id(api_client)]
+
+        def get_member_profile(id_member):
+            profile_calls.append((branch, id_member))
+            if OWNERS.get(id_member) != branch:
+                raise ValueError("Member not found")
+            return ClienteDetalhesBasicosApiViewModel(
+                idMember=id_member, firstName="Member", lastName=str(id_member)
+            )
+
+        return Mock(get_member_profile=get_member_profile, branch=branch)
+
+    with patch(f"{MODULE}.SyncMembersApi", side_effect=members_api), patch(
+        f"{MODULE}.SyncReceivablesApi"
+    ), patch(f"{MODULE}.paginated_api_call", return_value=[]) as paginated:
+        yield Mock(profile_calls=profile_calls, paginated=paginated)
+
+
+def test_members_files_in_requested_order(fetcher, apis):
+    files = fetcher.get_members_files([103, 101, 999])
+
+    assert list(files.members) == [103, 101]
+    assert files.members[101].name == "Member 101"
+    assert files.total_members == 2
+
+
+def test_member_data_only_fetched_from_owner_branch(fetcher, apis):
+    list(fetcher.iter_members_files([102]))
+
+    branches = {
+        call.kwargs["branch_id_logging"] for call in apis.paginated.call_args_list
+    }
+    assert branches == {"2"}
+    # Only the receivables feed the profile
+    assert apis.paginated.call_count == 1
+
+
+def test_owner_branch_is_remembered(fetcher, apis):
+    list(fetcher.iter_members_files([102]))
+    apis.profile_calls.clear()
+
+    list(fetcher.iter_members_files([102]))
+
+    assert apis.profile_calls == [("2", 102)]
+
+
+def test_members_are_fetched_concurrently(fetcher, apis):
+    # Both members' receivables only pass if they overlap
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(*args, **kwargs):
+        barrier.wait()
+        return []
+
+    apis.paginated.side_effect = wait
+
+    profiles = list(fetcher.iter_members_files([101, 102]))
+
+    assert sorted(profile.member_id for profile in profiles) == [101, 102]
+
+
+def test_profile_lookups_share_the_client_rate_limit(fetcher, apis, clients):
+    for client in clients.values():
+        client.rate_limiter = Mock(spec=TokenBucketRateLimiter)
+
+    list(fetcher.iter_members_files([102]))
+
+    # Branch 1 is probed first and misses, then branch 2 finds the member
+    assert clients["1"].rate_limiter.acquire.call_count == 1
+    assert clients["2"].rate_limiter.acquire.call_count == 1
+    clients["2"].rate_limiter.on_success.assert_called_once()
+
+
+def test_failed_member_is_skipped(fetcher, apis):
+    apis.paginated.side_effect = [RuntimeError("boom"), []]
+    fetcher.max_workers = 1
+
+    profiles = list(fetcher.iter_members_files([101, 102]))
+
+    assert [profile.member_id for profile in profiles] == [102]
@@ -0,0 +1,73 @@
+"""Tests for OperatingDataFetcher."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from evo_client.models.gym_model import GymOperatingData
+from evo_client.services.data_fetchers import BranchApiClientManager
+from evo_client.services.operating_data.operating_data_fetcher import (
+    OperatingDataFetcher,
+)
+
+
+class TestOperatingDataFetcher:
+    """Test suite for OperatingDataFetcher class."""
+
+    @pytest.fixture
+    def od_fetcher(self):
+        manager = BranchApiClientManager({"1": Mock(), "2": Mock(), "3": Mock()})
+        fetcher = OperatingDataFetcher(manager)
+        for name in (
+            "member_fetcher",
+            "membership_fetcher",
+            "prospects_fetcher",
+            "receivables_fetcher",
+            "entries_fetcher",
+        ):
+            setattr(fetcher, name, Mock())
+        fetcher.member_fetcher.fetch_members.return_value = []
+        fetcher.membership_fetcher.fetch_memberships.return_value = []
+        fetcher.prospects_fetcher.fetch_prospects.return_value = []
+        fetcher.receivables_fetcher.fetch_receivables.return_value = []
+        fetcher.entries_fetcher.fetch_entries.return_value = []
+        fetcher.computer = Mock()
+        fetcher.computer.compute_metrics.side_effect = lambda **_: GymOperatingData(
+            data_from=datetime(2024, 1, 1), data_to=datetime(2024, 1, 31)
+        )
+        return fetcher
+
+    def test_each_dataset_fetched_once_per_branch(self, od_fetcher):
+        """Every dataset is fetched once per branch, scoped to that branch."""
+        result = od_fetcher.fetch_operating_data(
+            from_date=datetime(2024, 1, 1), to_date=datetime(2024, 1, 31)
+        )
+
+        assert [d.branch_id for d in result] == ["1", "2", "3"]
+
+        scoped_calls = [
+            od_fetcher.membership_fetcher.fetch_memberships,
+            od_fetcher.prospects_fetcher.fetch_prospects,
+            od_fetcher.receivables_fetcher.fetch_receivables,
+            od_fetcher.entries_fetcher.fetch_entries,
+        ]
+        for fetch in scoped_calls:
+            assert [c.kwargs["branch_ids"] for c in fetch.call_args_list] == [
+                [1],
+                [2],
+                [3],
+            ]
+        # Active and non-renewed members per branch
+        assert [
+            c.kwargs["branch_ids"]
+            for c in od_fetcher.member_fetcher.fetch_members.call_args_list
+        ] == [[1], [1], [2], [2], [3], [3]]
+
+    def test_unknown_branches_are_skipped(self, od_fetcher):
+        """Branch IDs without a client are not fetched."""
+        result = od_fetcher.fetch_operating_data(branch_ids=[2, 42])
+
+        assert isinstance(result, GymOperatingData)
+        assert result.branch_id == "2"
+        od_fetcher.entries_fetcher.fetch_entries.assert_called_once()
@@ -0,0 +1,123 @@
+"""Tests for computing operating data series in worker processes."""
+
+import pickle
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from evo_client.models.contratos_resumo_api_view_model import (
+    ContratosResumoApiViewModel,
+)
+from evo_client.models.member_membership_api_view_model import (
+    MemberMembershipApiViewModel,
+)
+from evo_client.models.members_api_view_model import MembersApiViewModel
+from evo_client.models.receivables_api_view_model import ReceivablesApiViewModel
+from evo_client.services.data_fetchers import BranchApiClientManager
+from evo_client.services.data_fetchers.gym_metrics_data_fetcher import (
+    GymMetricsDataFetcher,
+)
+from evo_client.services.operating_data import (
+    OperatingDataInputs,
+    ParallelOperatingDataComputer,
+)
+
+NOW = datetime(2024, 6, 1)
+
+
+def receivable(ammount, paid, due_date):
+    return ReceivablesApiViewModel(ammount=ammount, ammountPaid=paid, dueDate=due_date)
+
+
+def period(active, churned, mrr):
+    return OperatingDataInputs(
+        total_active_members=active,
+        total_churned_members=churned,
+        contract_values=[mrr],
+    )
+
+
+def test_inputs_from_records_are_compact():
+    inputs = OperatingDataInputs.from_records(
+        active_members=[Mock(), Mock()],
+        prospects=[Mock()],
+        non_renewed=[],
+        receivables=[
+            receivable(10.0, 10.0, datetime(2024, 1, 1)),
+            receivable(5.0, None, datetime(2024, 1, 1)),
+        ],
+        entries=[Mock()] * 3,
+        active_contracts=[ContratosResumoApiViewModel(value=99.9)],
+    )
+
+    assert inputs.total_active_members == 2
+    assert inputs.total_entries == 3
+    assert inputs.receivables["ammountPaid"] == [10.0, None]
+    assert inputs.contract_values == [99.9]
+    # Only plain values are sent to workers
+    assert pickle.loads(pickle.dumps(inputs)) == inputs
+
+
+def test_series_compares_each_period_to_the_previous():
+    results = ParallelOperatingDataComputer(max_workers=1).compute_series(
+        {1: [period(10, 0, 1000), period(12, 2, 1000)]}, now=NOW
+    )
+
+    previous, current = results[1]
+    assert previous.grr == Decimal("100.00")
+    assert current.churn_rate == Decimal("20")
+    assert current.membership_growth_rate == Decimal("20")
+    assert current.grr == Decimal("80")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_process_pool_matches_in_process(max_workers):
+    series = {
+        1: [period(10, 0, 1000), period(12, 2, 1000)],
+        2: [period(4, 1, 300), period(5, 0, 350)],
+    }
+
+    results = ParallelOperatingDataComputer(max_workers).compute_series(series, now=NOW)
+
+    assert list(results) == [1, 2]
+    assert results[1][1].grr == Decimal("80")
+    assert results[2][1].mrr == Decimal("350.00")
+
+
+def test_fetch_branch_metrics_computes_each_branch():
+    client_manager = BranchApiClientManager(
+        branch_api_clients={"1": Mock(), "2": Mock()}
+    )
+    fetcher = GymMetricsDataFetcher(client_manager)
+    member = MembersApiViewModel(
+        idMember=1,
+        memberships=[MemberMembershipApiViewModel(startDate=datetime(2024, 1, 10))],
+    )
+    fetcher.member_fetcher = Mock(fetch_members=Mock(return_value=[member]))
+    fetcher.prospects_fetcher = Mock(fetch_prospects=Mock(return_value=[]))
+    fetcher.entries_fetcher = Mock(fetch_entries=Mock(return_value=[]))
+    fetcher.receivables_fetcher = Mock(
+        fetch_receivables=Mock(
+            return_value=[receivable(50.0, 50.0, datetime(2024, 1, 1))]
+        )
+    )
+    fetcher.membership_fetcher = Mock(
+        fetch_memberships=Mock(return_value=[ContratosResumoApiViewModel(value=100)])
+    )
+
+    metrics = fetcher.fetch_branch_metrics(
+        from_date=datetime(2024, 1, 1), to_date=datetime(2024, 1, 31), max_workers=1
+    )
+
+    assert sorted(metrics) == [1, 2]
+    assert metrics[1].mrr == Decimal("100.00")
+    assert metrics[1].total_paid == Decimal("50.00")
+    assert metrics[1].data_from == datetime(2024, 1, 1)
+    assert metrics[1].total_active_members == 1
+    branches = {
+        tuple(call.kwargs["branch_ids"])
+        for call in fetcher.receivables_fetcher.fetch_receivables.call_args_list
+    }
+    assert branches == {(1,), (2,)}
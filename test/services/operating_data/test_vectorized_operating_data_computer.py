@@ -0,0 +1,105 @@
+"""Tests for the vectorized operating data computer."""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from evo_client.models.contratos_resumo_api_view_model import (
+    ContratosResumoApiViewModel,
+)
+from evo_client.models.receivables_api_view_model import ReceivablesApiViewModel
+from evo_client.services.operating_data import (
+    OperatingDataComputer,
+    VectorizedOperatingDataComputer,
+)
+from evo_client.services.operating_data.vectorized_operating_data_computer import (
+    from_cents,
+    to_cents,
+)
+
+RECEIVABLES = [
+    {"ammount": 120.5, "ammountPaid": 120.5, "dueDate": "2024-01-05T00:00:00"},
+    {"ammount": 99.9, "ammountPaid": None, "dueDate": "2024-01-10T00:00:00"},
+    {"ammount": 80.0, "ammountPaid": 0, "dueDate": "2099-01-10T00:00:00"},
+    {"ammount": None, "ammountPaid": None, "dueDate": None},
+]
+CONTRACT_VALUES = [99.9, 120.5, None]
+
+
+def test_cents_round_trip():
+    cents = to_cents([0.1, 0.2, "19.99", None])
+
+    assert cents.tolist() == [10, 20, 1999, 0]
+    assert from_cents(cents.sum()) == Decimal("20.29")
+
+
+def test_totals_match_row_by_row_computer():
+    totals = ("total_mrr", "total_paid", "total_pending", "total_overdue")
+    with patch.object(OperatingDataComputer, "_build_operating_data") as build:
+        OperatingDataComputer().compute_metrics(
+            active_members=[],
+            prospects=[],
+            non_renewed=[],
+            receivables=[
+                ReceivablesApiViewModel.model_validate(r) for r in RECEIVABLES
+            ],
+            entries=[],
+            active_contracts=[
+                ContratosResumoApiViewModel(value=value) for value in CONTRACT_VALUES
+            ],
+        )
+        row_totals = {name: build.call_args.kwargs[name] for name in totals}
+
+        VectorizedOperatingDataComputer().compute_metrics_columnar(
+            pd.DataFrame(RECEIVABLES),
+            CONTRACT_VALUES,
+            total_active_members=0,
+            total_churned_members=0,
+        )
+        columnar_call = build.call_args.kwargs
+
+    assert {name: columnar_call[name] for name in totals} == row_totals
+    assert columnar_call["total_overdue"] == Decimal("99.90")
+    # The columnar engine does not copy its inputs into the result
+    assert "receivables" not in columnar_call
+
+
+def test_rate_metrics():
+    data = VectorizedOperatingDataComputer().compute_metrics_columnar(
+        pd.DataFrame(RECEIVABLES),
+        [100, 100],
+        total_active_members=8,
+        total_churned_members=2,
+        total_entries=16,
+        now=datetime(2024, 1, 7),
+    )
+
+    assert data.mrr == Decimal("200.00")
+    assert data.churn_rate == Decimal("20")
+    assert data.average_revenue_per_member == Decimal("25")
+    assert data.average_visits_per_member == Decimal("2")
+    # Before the second receivable's due date, it is still pending
+    assert data.total_overdue == Decimal("0.00")
+    assert data.total_pending == Decimal("179.90")
+
+
+def test_empty_receivables():
+    data = VectorizedOperatingDataComputer().compute_metrics_columnar(
+        pd.DataFrame([]), [], total_active_members=0, total_churned_members=0
+    )
+
+    assert data.total_paid == Decimal("0.00")
+    assert data.mrr == Decimal("0.00")
+
+
+def test_missing_column():
+    with pytest.raises(ValueError, match="dueDate"):
+        VectorizedOperatingDataComputer().compute_metrics_columnar(
+            pd.DataFrame([{"ammount": 1, "ammountPaid": 0}]),
+            [],
+            total_active_members=0,
+            total_churned_members=0,
+        )
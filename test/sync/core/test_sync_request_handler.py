@@ -312,3 +312,58 @@ def test_execute_delegates_to_make_request(sync_request_handler):
 
         assert result == {"success": True}
         mock_make_request.assert_called_once()
+
+
+@pytest.fixture
+def debug_logs():
+    """Capture debug log messages."""
+    from loguru import logger
+
+    messages = []
+    handler_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    yield messages
+    logger.remove(handler_id)
+
+
+def test_make_request_does_not_log_payloads_by_default(
+    sync_request_handler, debug_logs
+):
+    """Test that bodies are only logged when payload logging is enabled."""
+    mock_response = Mock()
+    mock_response.status = 200
+    mock_response.data = b'{"secret": "payload"}'
+    mock_response.getheaders.return_value = {"Content-Type": "application/json"}
+    mock_response.json.return_value = {"secret": "payload"}
+
+    with patch.object(
+        sync_request_handler.rest_client, "request", return_value=mock_response
+    ):
+        sync_request_handler._make_request(
+            method="POST", resource_path="/test", body={"secret": "body"}
+        )
+
+    assert any("Making POST request" in message for message in debug_logs)
+    assert not any("secret" in message for message in debug_logs)
+
+
+def test_make_request_logs_capped_payloads_when_enabled(
+    sync_request_handler, debug_logs
+):
+    """Test that enabled payload logging truncates bodies."""
+    sync_request_handler.configuration.log_payloads = True
+    sync_request_handler.configuration.log_payload_max_bytes = 8
+    mock_response = Mock()
+    mock_response.status = 200
+    mock_response.data = b'{"items": [1, 2, 3, 4, 5]}'
+    mock_response.getheaders.return_value = {"Content-Type": "application/json"}
+    mock_response.json.return_value = {"items": [1, 2, 3, 4, 5]}
+
+    with patch.object(
+        sync_request_handler.rest_client, "request", return_value=mock_response
+    ):
+        sync_request_handler._make_request(method="GET", resource_path="/test")
+
+    assert any(
+        message.startswith('Response body: {"items"... (26 bytes total)')
+        for message in debug_logs
+    )
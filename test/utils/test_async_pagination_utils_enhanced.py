@@ -1,5 +1,6 @@
 """Enhanced tests for async pagination utilities to cover missing coverage lines."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -10,6 +11,7 @@ from evo_client.utils.async_pagination_utils import (
     AsyncPaginatedApiCaller,
     AsyncRetryHandler,
     ConcurrentPaginationManager,
+    async_iter_items,
     async_paginated_api_call,
 )
 from evo_client.utils.pagination_utils import PaginationConfig, RetryConfig
@@ -199,6 +201,96 @@ class TestAsyncPaginatedApiCallerEnhanced:
             assert len(result.data) == 1
             assert result.data[0] == {"single": "result"}
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_prefetched(self):
+        """Pipelined skip/take pages come back in order and stop at a short page."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute(api_func, context, *args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            start = kwargs["skip"]
+            return list(range(start, min(start + kwargs["take"], 23)))
+
+        mock_executor = Mock()
+        mock_executor.execute_with_retry = AsyncMock(side_effect=execute)
+        caller = AsyncPaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=5, prefetch_window=3)
+
+        result = await caller.fetch_all_pages(AsyncMock(), config, "1")
+
+        assert result.success is True
+        assert result.data == list(range(23))
+        assert result.total_requests == 5
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_prefetched_single_page(self):
+        """A query that fits in one page sends no speculative requests."""
+        mock_executor = Mock()
+        mock_executor.execute_with_retry = AsyncMock(return_value=[1, 2])
+        caller = AsyncPaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=5, prefetch_window=4)
+
+        result = await caller.fetch_all_pages(AsyncMock(), config, "1")
+
+        assert result.data == [1, 2]
+        assert mock_executor.execute_with_retry.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_prefetched_error(self):
+        """A failed page returns the pages consumed before it."""
+
+        async def execute(api_func, context, *args, **kwargs):
+            if kwargs["skip"] == 5:
+                raise ApiException("boom")
+            return [kwargs["skip"]] * kwargs["take"]
+
+        mock_executor = Mock()
+        mock_executor.retry_handler.config.max_retries = 2
+        mock_executor.execute_with_retry = AsyncMock(side_effect=execute)
+        caller = AsyncPaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=5, prefetch_window=3)
+
+        result = await caller.fetch_all_pages(AsyncMock(), config, "1")
+
+        assert result.success is False
+        assert result.error_message == "boom"
+        assert result.data == [0] * 5
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_is_lazy(self):
+        """Pages are requested only as the consumer advances."""
+        mock_executor = Mock()
+        mock_executor.execute_with_retry = AsyncMock(side_effect=[[1, 2], [3]])
+        caller = AsyncPaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=2)
+
+        pages = caller.iter_pages(AsyncMock(), config, "1")
+
+        assert await pages.__anext__() == [1, 2]
+        assert mock_executor.execute_with_retry.await_count == 1
+        assert [page async for page in pages] == [[3]]
+
+    @pytest.mark.asyncio
+    async def test_async_iter_items(self):
+        """The module-level iterator streams every item of every page."""
+        mock_api_func = AsyncMock(side_effect=[[1, 2], [3]])
+        mock_api_func.__name__ = "get_things"
+
+        items = [
+            item
+            async for item in async_iter_items(
+                mock_api_func, page_size=2, branch_id_logging="1"
+            )
+        ]
+
+        assert items == [1, 2, 3]
+
 
 class TestConcurrentPaginationManagerEnhanced:
     """Enhanced tests for ConcurrentPaginationManager to cover missing coverage."""
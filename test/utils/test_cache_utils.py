@@ -0,0 +1,385 @@
+"""Tests for the TTL response cache."""
+
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from evo_client.aio.core.request_handler import AsyncRequestHandler
+from evo_client.core.configuration import Configuration
+from evo_client.core.rest import RESTClient
+from evo_client.models.bandeiras_basico_view_model import BandeirasBasicoViewModel
+from evo_client.sync.core.request_handler import SyncRequestHandler
+from evo_client.utils.cache_utils import (
+    CachedResponse,
+    DiskCache,
+    ResponseCache,
+    TTLCache,
+    clear_shared_response_caches,
+    get_shared_cache_backend,
+    response_cache_for,
+)
+
+JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+CARD_FLAGS_PATH = "/api/v1/configuration/card-flags"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_caches():
+    clear_shared_response_caches()
+    yield
+    clear_shared_response_caches()
+
+
+@pytest.fixture(params=["memory", "disk"])
+def backend_and_clock(request, tmp_path):
+    clock = FakeClock()
+    if request.param == "memory":
+        return TTLCache(max_entries=2, clock=clock), clock
+    return DiskCache(tmp_path / "cache", max_entries=2, clock=clock), clock
+
+
+def cached(body: bytes = b"[]") -> CachedResponse:
+    return CachedResponse(status=200, headers=JSON_HEADERS, data=body)
+
+
+class TestBackends:
+    """Test the in-memory and on-disk backends."""
+
+    def test_round_trip_and_expiry(self, backend_and_clock):
+        backend, clock = backend_and_clock
+        backend.set("k", cached(b'[{"id": 1}]'), ttl=10)
+
+        assert backend.get("k") == cached(b'[{"id": 1}]')
+        clock.now += 10
+        assert backend.get("k") is None
+
+    def test_evicts_beyond_max_entries(self, backend_and_clock):
+        backend, clock = backend_and_clock
+        for key in ("a", "b", "c"):
+            backend.set(key, cached(), ttl=60)
+            clock.now += 1
+
+        assert backend.get("a") is None
+        assert backend.get("b") is not None
+        assert backend.get("c") is not None
+
+    def test_delete_and_clear(self, backend_and_clock):
+        backend, _ = backend_and_clock
+        backend.set("a", cached(), ttl=60)
+        backend.set("b", cached(), ttl=60)
+
+        backend.delete("a")
+        assert backend.get("a") is None
+        backend.clear()
+        assert backend.get("b") is None
+
+    def test_lru_keeps_recently_read_entries(self):
+        cache = TTLCache(max_entries=2)
+        cache.set("a", cached(), ttl=60)
+        cache.set("b", cached(), ttl=60)
+        cache.get("a")
+        cache.set("c", cached(), ttl=60)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_disk_entries_survive_instances(self, tmp_path):
+        DiskCache(tmp_path).set("k", cached(b"\x00\xff"), ttl=60)
+        assert DiskCache(tmp_path).get("k") == cached(b"\x00\xff")
+
+    def test_disk_ignores_corrupt_entries(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("k", cached(), ttl=60)
+        cache._path("k").write_text("{not json")
+
+        assert cache.get("k") is None
+        assert not cache._path("k").exists()
+
+
+class TestResponseCache:
+    """Test which requests are cached and under which key."""
+
+    def test_ttl_only_for_configured_get_paths(self):
+        cache = ResponseCache(TTLCache(), {"/api/v1/states": 60, "/api/v1/off": 0})
+
+        assert cache.ttl_for("GET", "/api/v1/states") == 60
+        assert cache.ttl_for("get", "/api/v1/states") == 60
+        assert cache.ttl_for("POST", "/api/v1/states") == 0
+        assert cache.ttl_for("GET", "/api/v1/off") == 0
+        assert cache.ttl_for("GET", "/api/v1/members") == 0
+
+    def test_key_separates_credentials_and_queries(self):
+        gym_a = Configuration(username="gym-a")
+        gym_b = Configuration(username="gym-b")
+        key = ResponseCache.key(gym_a, "GET", "/api/v1/service", {"a": 1, "b": 2})
+
+        assert key == ResponseCache.key(
+            gym_a, "GET", "/api/v1/service", {"b": 2, "a": 1}
+        )
+        assert key != ResponseCache.key(gym_b, "GET", "/api/v1/service", {"a": 1})
+        assert key != ResponseCache.key(gym_a, "GET", "/api/v1/service", {"a": 2})
+
+    def test_key_changes_with_the_password(self):
+        old = Configuration(username="gym", password="old")
+        new = Configuration(username="gym", password="new")
+        key = ResponseCache.key(old, "GET", "/api/v1/configuration")
+
+        assert key != ResponseCache.key(new, "GET", "/api/v1/configuration")
+        assert "old" not in key
+
+    def test_put_skips_errors_and_non_json(self):
+        cache = ResponseCache(TTLCache())
+        cache.put("error", 60, 500, JSON_HEADERS, b"{}")
+        cache.put("html", 60, 200, {"content-type": "text/html"}, b"<p>")
+        cache.put("ok", 60, 200, {"content-type": "application/json"}, b"{}")
+
+        assert cache.get("error") is None
+        assert cache.get("html") is None
+        assert cache.get("ok") is not None
+
+    def test_configuration_enables_and_overrides(self, tmp_path):
+        assert response_cache_for(Configuration()) is None
+
+        configuration = Configuration(
+            response_cache_enabled=True,
+            response_cache_ttls={"/api/v1/states": 0, "/api/v1/extra": 5},
+            response_cache_dir=str(tmp_path),
+        )
+        cache = response_cache_for(configuration)
+
+        assert isinstance(cache.backend, DiskCache)
+        assert cache.ttl_for("GET", "/api/v1/states") == 0
+        assert cache.ttl_for("GET", "/api/v1/extra") == 5
+        assert cache.ttl_for("GET", CARD_FLAGS_PATH) == 86400
+
+    def test_backends_are_shared(self, tmp_path):
+        assert get_shared_cache_backend() is get_shared_cache_backend()
+        assert get_shared_cache_backend(str(tmp_path)) is get_shared_cache_backend(
+            str(tmp_path)
+        )
+        assert get_shared_cache_backend() is not get_shared_cache_backend(str(tmp_path))
+
+
+@pytest.fixture
+def cached_configuration():
+    return Configuration(
+        host="https://api.example.com",
+        username="gym",
+        password="secret",
+        response_cache_enabled=True,
+    )
+
+
+CARD_FLAGS_BODY = b'[{"value": "1", "text": "Visa"}]'
+
+
+class TestRequestHandlers:
+    """Test that the request handlers serve cached responses."""
+
+    def test_sync_handler_serves_repeat_requests_from_cache(self, cached_configuration):
+        handler = SyncRequestHandler(cached_configuration)
+        response = Mock(status=200, data=CARD_FLAGS_BODY)
+        response.getheaders.return_value = JSON_HEADERS
+        response.deserialize.side_effect = lambda response_type, record_mode: "live"
+
+        with patch.object(
+            handler.rest_client, "request", return_value=response
+        ) as request:
+            first = handler.execute(
+                List[BandeirasBasicoViewModel],
+                method="GET",
+                resource_path=CARD_FLAGS_PATH,
+            )
+            second = handler.execute(
+                List[BandeirasBasicoViewModel],
+                method="GET",
+                resource_path=CARD_FLAGS_PATH,
+            )
+
+        assert first == "live"
+        assert request.call_count == 1
+        assert second[0].text == "Visa"
+
+    def test_sync_handler_bypasses_cache_for_raw_and_uncached_paths(
+        self, cached_configuration
+    ):
+        handler = SyncRequestHandler(cached_configuration)
+        response = Mock(status=200, data=b"[]")
+        response.getheaders.return_value = JSON_HEADERS
+
+        with patch.object(
+            handler.rest_client, "request", return_value=response
+        ) as request:
+            for _ in range(2):
+                handler.execute(method="GET", resource_path="/api/v1/members")
+                handler.execute(
+                    method="GET", resource_path=CARD_FLAGS_PATH, raw_response=True
+                )
+
+        assert request.call_count == 4
+
+    async def test_async_handler_shares_cache_with_sync_handler(
+        self, cached_configuration
+    ):
+        sync_handler = SyncRequestHandler(cached_configuration)
+        response = Mock(status=200, data=CARD_FLAGS_BODY)
+        response.getheaders.return_value = JSON_HEADERS
+        with patch.object(sync_handler.rest_client, "request", return_value=response):
+            sync_handler.execute(method="GET", resource_path=CARD_FLAGS_PATH)
+
+        async_handler = AsyncRequestHandler(cached_configuration)
+        async_handler._ensure_session = AsyncMock(return_value=MagicMock())
+
+        result = await async_handler.execute(
+            List[BandeirasBasicoViewModel],
+            method="GET",
+            resource_path=CARD_FLAGS_PATH,
+        )
+
+        async_handler._ensure_session.assert_not_called()
+        assert result[0].text == "Visa"
+
+
+def http_response(status, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+@pytest.fixture
+def conditional_configuration():
+    return Configuration(
+        host="https://api.example.com",
+        username="gym",
+        password="secret",
+        conditional_requests_enabled=True,
+    )
+
+
+MEMBERSHIPS_URL = "https://api.example.com/api/v2/membership"
+VALIDATED_HEADERS = {
+    **JSON_HEADERS,
+    "ETag": '"v1"',
+    "Last-Modified": "Mon, 01 Jan 2024",
+}
+
+
+class TestConditionalRequests:
+    """Test ETag/Last-Modified revalidation."""
+
+    def test_rest_client_revalidates_and_reuses_body_on_304(
+        self, conditional_configuration
+    ):
+        client = RESTClient(conditional_configuration)
+        client.session = Mock()
+        client.session.request.side_effect = [
+            http_response(200, b'[{"id": 1}]', VALIDATED_HEADERS),
+            http_response(304),
+        ]
+
+        first = client.request("GET", MEMBERSHIPS_URL, query_params={"take": 5})
+        second = client.request("GET", MEMBERSHIPS_URL, query_params={"take": 5})
+
+        sent = client.session.request.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Mon, 01 Jan 2024"
+        assert second.status == 200
+        assert second.data == first.data
+        assert second.json() == [{"id": 1}]
+
+    def test_rest_client_without_validators_sends_plain_requests(
+        self, conditional_configuration
+    ):
+        client = RESTClient(conditional_configuration)
+        client.session = Mock()
+        client.session.request.return_value = http_response(200, b"[]", JSON_HEADERS)
+
+        client.request("GET", MEMBERSHIPS_URL)
+        client.request("GET", MEMBERSHIPS_URL)
+
+        sent = client.session.request.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in sent
+
+    def test_rest_client_replaces_changed_body(self, conditional_configuration):
+        client = RESTClient(conditional_configuration)
+        client.session = Mock()
+        client.session.request.side_effect = [
+            http_response(200, b"[1]", VALIDATED_HEADERS),
+            http_response(200, b"[2]", {**JSON_HEADERS, "ETag": '"v2"'}),
+            http_response(304),
+        ]
+
+        for _ in range(2):
+            client.request("GET", MEMBERSHIPS_URL)
+        third = client.request("GET", MEMBERSHIPS_URL)
+
+        sent = client.session.request.call_args_list[2].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v2"'
+        assert third.json() == [2]
+
+    def test_bulk_paths_are_not_revalidated(self, conditional_configuration):
+        client = RESTClient(conditional_configuration)
+        client.session = Mock()
+        client.session.request.return_value = http_response(
+            200, b"[]", VALIDATED_HEADERS
+        )
+        members_url = "https://api.example.com/api/v2/members"
+
+        client.request("GET", members_url, query_params={"skip": 0})
+        client.request("GET", members_url, query_params={"skip": 0})
+
+        sent = client.session.request.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in sent
+        assert len(client.revalidation_cache.backend) == 0
+
+    def test_revalidated_paths_are_configurable(self, conditional_configuration):
+        conditional_configuration.conditional_requests_paths = ["/api/v2/members"]
+        client = RESTClient(conditional_configuration)
+        client.session = Mock()
+        client.session.request.return_value = http_response(
+            200, b"[]", VALIDATED_HEADERS
+        )
+
+        for url in (MEMBERSHIPS_URL, "https://api.example.com/api/v2/members"):
+            client.request("GET", url)
+            client.request("GET", url)
+
+        sent = [c.kwargs["headers"] for c in client.session.request.call_args_list]
+        assert "If-None-Match" not in sent[1]
+        assert sent[3]["If-None-Match"] == '"v1"'
+
+    async def test_async_handler_reuses_body_on_304(self, conditional_configuration):
+        handler = AsyncRequestHandler(conditional_configuration)
+        responses = [
+            Mock(
+                status=200,
+                headers=VALIDATED_HEADERS,
+                url=MEMBERSHIPS_URL,
+                read=AsyncMock(return_value=b'[{"id": 1}]'),
+            ),
+            Mock(status=304, headers={}, url=MEMBERSHIPS_URL, read=AsyncMock()),
+        ]
+        session = MagicMock()
+        session.request.return_value.__aenter__.side_effect = responses
+        handler._ensure_session = AsyncMock(return_value=session)
+
+        first = await handler.execute(method="GET", resource_path="/api/v2/membership")
+        second = await handler.execute(method="GET", resource_path="/api/v2/membership")
+
+        sent = session.request.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        responses[1].read.assert_not_called()
+        assert first == second == [{"id": 1}]
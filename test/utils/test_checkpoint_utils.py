@@ -0,0 +1,186 @@
+"""Tests for resumable pagination checkpoints."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from evo_client.exceptions.api_exceptions import ApiException
+from evo_client.utils.async_pagination_utils import async_iter_items
+from evo_client.utils.checkpoint_utils import (
+    JsonCheckpointStore,
+    PaginationCheckpoint,
+    SqliteCheckpointStore,
+    checkpoint_key,
+)
+from evo_client.utils.pagination_utils import (
+    PaginatedApiCaller,
+    PaginationConfig,
+    iter_items,
+)
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        return JsonCheckpointStore(tmp_path / "checkpoints.json")
+    return SqliteCheckpointStore(tmp_path / "checkpoints.db")
+
+
+def paged_api(total_items, fail_at_skip=None):
+    """API function returning ``range(total_items)`` in skip/take pages."""
+
+    def get_things(skip=0, take=50, **filters):
+        if skip == fail_at_skip:
+            raise ApiException("boom")
+        return list(range(skip, min(skip + take, total_items)))
+
+    return Mock(side_effect=get_things, __name__="get_things")
+
+
+class TestCheckpointKey:
+    """Test checkpoint key construction."""
+
+    def test_ignores_pagination_args_and_none(self):
+        base = checkpoint_key("get_things", 1, {"a": 1}, 50)
+        assert checkpoint_key("get_things", 1, {"a": 1, "skip": 100}, 50) == base
+        assert checkpoint_key("get_things", 1, {"a": 1, "b": None}, 50) == base
+
+    def test_distinguishes_query_identity(self):
+        base = checkpoint_key("get_things", 1, {"a": 1}, 50)
+        assert checkpoint_key("get_things", 2, {"a": 1}, 50) != base
+        assert checkpoint_key("get_other", 1, {"a": 1}, 50) != base
+        assert checkpoint_key("get_things", 1, {"a": 2}, 50) != base
+        assert checkpoint_key("get_things", 1, {"a": 1}, 25) != base
+
+    def test_accepts_datetimes(self):
+        filters = {"since": datetime(2024, 1, 1)}
+        assert checkpoint_key("get_things", 1, filters, 50) == checkpoint_key(
+            "get_things", 1, dict(filters), 50
+        )
+
+
+class TestCheckpointStores:
+    """Test the JSON and SQLite stores."""
+
+    def test_round_trip(self, store):
+        assert store.get("k") is None
+        store.save("k", 3)
+        store.save("k", 4)
+        assert store.get("k") == 4
+        store.clear("k")
+        assert store.get("k") is None
+
+    def test_persists_across_instances(self, store):
+        store.save("k", 7)
+        assert type(store)(store.path).get("k") == 7
+
+    def test_clear_missing_key(self, store):
+        store.clear("missing")
+        assert store.get("missing") is None
+
+
+class TestResumablePagination:
+    """Test that paginated calls resume from their checkpoint."""
+
+    def test_failed_call_resumes_at_failed_page(self, store):
+        failing = paged_api(23, fail_at_skip=10)
+        seen = []
+        with pytest.raises(ApiException):
+            for item in iter_items(
+                failing,
+                page_size=5,
+                max_retries=1,
+                base_delay=0,
+                branch_id_logging="1",
+                checkpoint_store=store,
+            ):
+                seen.append(item)
+        assert seen == list(range(10))
+
+        healthy = paged_api(23)
+        resumed = list(
+            iter_items(
+                healthy, page_size=5, branch_id_logging="1", checkpoint_store=store
+            )
+        )
+
+        assert resumed == list(range(10, 23))
+        assert healthy.call_args_list[0].kwargs["skip"] == 10
+
+        # A query read to the end starts over next time
+        again = list(
+            iter_items(
+                paged_api(23),
+                page_size=5,
+                branch_id_logging="1",
+                checkpoint_store=store,
+            )
+        )
+        assert again == list(range(23))
+
+    def test_unprocessed_page_is_not_skipped(self, store):
+        items = iter_items(
+            paged_api(23), page_size=5, branch_id_logging="1", checkpoint_store=store
+        )
+        for _ in range(7):
+            next(items)
+        items.close()
+
+        # Page 1 was handed out but never finished, so it is fetched again
+        resumed = list(
+            iter_items(
+                paged_api(23),
+                page_size=5,
+                branch_id_logging="1",
+                checkpoint_store=store,
+            )
+        )
+        assert resumed == list(range(5, 23))
+
+    def test_prefetched_iter_pages_resumes(self, store):
+        key = checkpoint_key("get_things", "1", {}, 5)
+        store.save(key, 2)
+        mock_executor = Mock()
+        mock_executor.execute_with_retry.side_effect = (
+            lambda api_func, context, *args, **kwargs: api_func(**kwargs)
+        )
+        caller = PaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(
+            page_size=5,
+            prefetch_window=3,
+            checkpoint=PaginationCheckpoint(store, key),
+        )
+
+        pages = list(caller.iter_pages(paged_api(23), config, "1"))
+
+        assert [item for page in pages for item in page] == list(range(10, 23))
+        assert store.get(key) is None
+
+    def test_accumulating_fetch_rejects_checkpoints(self, store):
+        # A resumed list would silently miss the pages fetched before
+        config = PaginationConfig(
+            checkpoint=PaginationCheckpoint(store, checkpoint_key("f", "1", {}, 50))
+        )
+
+        with pytest.raises(ValueError, match="iter_pages"):
+            PaginatedApiCaller(executor=Mock()).fetch_all_pages(Mock(), config)
+
+    async def test_async_resume(self, store):
+        store.save(checkpoint_key("get_things", "1", {"a": 1}, 5), 4)
+        api = paged_api(23)
+        async_api = AsyncMock(side_effect=api.side_effect)
+        async_api.__name__ = "get_things"
+
+        items = [
+            item
+            async for item in async_iter_items(
+                async_api,
+                page_size=5,
+                branch_id_logging="1",
+                checkpoint_store=store,
+                a=1,
+            )
+        ]
+
+        assert items == [20, 21, 22]
@@ -0,0 +1,29 @@
+"""Tests for JSON decoding."""
+
+import json
+
+import pytest
+
+from evo_client.utils import json_utils
+
+
+@pytest.fixture(params=["orjson", "msgspec", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson" and json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    if request.param == "msgspec" and json_utils.msgspec is None:
+        pytest.skip("msgspec is not installed")
+    monkeypatch.setattr(json_utils, "JSON_BACKEND", request.param)
+    return request.param
+
+
+def test_loads_bytes_and_text(backend):
+    body = '[{"idMember": 1, "name": "Zoë", "memberships": [{"id": 2}]}]'
+
+    assert json_utils.loads(body.encode()) == json.loads(body)
+    assert json_utils.loads(body) == json.loads(body)
+
+
+def test_invalid_json_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads(b"invalid json {")
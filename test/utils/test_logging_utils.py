@@ -0,0 +1,17 @@
+"""Tests for payload logging helpers."""
+
+from evo_client.utils.logging_utils import payload_preview
+
+
+def test_short_payloads_are_rendered_whole():
+    assert payload_preview(b'{"id": 1}', 100) == '{"id": 1}'
+    assert payload_preview({"id": 1}, 100) == "{'id': 1}"
+
+
+def test_long_payloads_are_truncated_with_size():
+    assert payload_preview(b"x" * 10, 4) == "xxxx... (10 bytes total)"
+    assert payload_preview("y" * 10, 4) == "yyyy... (10 bytes total)"
+
+
+def test_invalid_utf8_is_replaced():
+    assert payload_preview(b"\xff\xfe", 10) == "��"
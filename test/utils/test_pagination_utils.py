@@ -7,6 +7,7 @@ import pytest
 
 from evo_client.exceptions.api_exceptions import ApiException
 from evo_client.utils.pagination_utils import (
+    DEFAULT_PACING_PROFILES,
     ApiCallExecutor,
     PaginatedApiCaller,
     PaginationConfig,
@@ -51,6 +52,32 @@ class TestPaginationConfig:
             PaginationConfig(max_retries=-1)
 
 
+class TestDefaultPacingProfiles:
+    """Test suite for the per-endpoint pacing defaults."""
+
+    # Largest take each endpoint accepts
+    MAX_TAKE = {"entries": 1000, "sales": 100}
+
+    def test_page_sizes_within_endpoint_limits(self):
+        """Test each profile pages as far as its endpoint allows."""
+        for endpoint, profile in DEFAULT_PACING_PROFILES.items():
+            assert profile.page_size == self.MAX_TAKE.get(endpoint, 50), endpoint
+
+    def test_reference_data_retries_less(self):
+        """Test small reference-data endpoints use fewer retries."""
+        assert DEFAULT_PACING_PROFILES["services"].max_retries == 3
+        assert DEFAULT_PACING_PROFILES["receivables"].max_retries == 5
+
+    def test_bulk_endpoints_prefetch(self):
+        """Test the bulk endpoints keep pages in flight."""
+        prefetching = {
+            endpoint
+            for endpoint, profile in DEFAULT_PACING_PROFILES.items()
+            if profile.prefetch_window > 1
+        }
+        assert prefetching == {"members", "receivables", "entries"}
+
+
 class TestRetryConfig:
     """Test suite for RetryConfig dataclass."""
 
@@ -14,6 +14,7 @@ from evo_client.utils.pagination_utils import (
     RetryConfig,
     RetryHandler,
     create_paginated_caller,
+    iter_items,
     paginated_api_call,
 )
 
@@ -401,6 +402,144 @@ class TestPaginatedApiCaller:
         mock_sleep.assert_not_called()
 
 
+class TestPrefetchedPagination:
+    """Test pipelined skip/take pagination."""
+
+    @staticmethod
+    def _paged_executor(total_items: int):
+        def execute(api_func, context, *args, **kwargs):
+            start = kwargs["skip"]
+            return list(range(start, min(start + kwargs["take"], total_items)))
+
+        mock_executor = Mock()
+        mock_executor.execute_with_retry.side_effect = execute
+        return mock_executor
+
+    def test_invalid_prefetch_window(self):
+        with pytest.raises(ValueError, match="prefetch_window must be positive"):
+            PaginationConfig(prefetch_window=0)
+
+    def test_prefetch_only_for_skip_take(self):
+        assert PaginationConfig(prefetch_window=4).prefetches is True
+        assert PaginationConfig(prefetch_window=1).prefetches is False
+        assert (
+            PaginationConfig(
+                prefetch_window=4, pagination_type="page_page_size"
+            ).prefetches
+            is False
+        )
+
+    def test_results_in_order_and_stop_after_short_page(self):
+        mock_executor = self._paged_executor(total_items=23)
+        caller = PaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=5, prefetch_window=3)
+
+        result = caller.fetch_all_pages(Mock(), config, "1", extra="value")
+
+        assert result.success is True
+        assert result.data == list(range(23))
+        assert result.total_requests == 5
+        skips = sorted(
+            c.kwargs["skip"] for c in mock_executor.execute_with_retry.call_args_list
+        )
+        # Speculation never runs more than a window past the short page
+        assert skips[:5] == [0, 5, 10, 15, 20]
+        assert len(skips) <= 5 + config.prefetch_window - 1
+        assert all(
+            c.kwargs["extra"] == "value"
+            for c in mock_executor.execute_with_retry.call_args_list
+        )
+
+    def test_single_short_page_costs_one_request(self):
+        mock_executor = self._paged_executor(total_items=3)
+        caller = PaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=5, prefetch_window=4)
+
+        result = caller.fetch_all_pages(Mock(), config, "1")
+
+        assert result.data == [0, 1, 2]
+        # The window only opens once a full page has come back
+        assert mock_executor.execute_with_retry.call_count == 1
+
+    def test_error_returns_pages_before_failure(self):
+        def execute(api_func, context, *args, **kwargs):
+            if kwargs["skip"] == 10:
+                raise ApiException("boom")
+            return [kwargs["skip"]] * kwargs["take"]
+
+        mock_executor = Mock()
+        mock_executor.retry_handler.config.max_retries = 2
+        mock_executor.execute_with_retry.side_effect = execute
+        caller = PaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=5, prefetch_window=4)
+
+        result = caller.fetch_all_pages(Mock(), config, "1")
+
+        assert result.success is False
+        assert result.error_message == "boom"
+        assert result.data == [0] * 5 + [5] * 5
+
+    @patch("evo_client.utils.pagination_utils.PaginatedApiCaller.fetch_all_pages")
+    def test_paginated_api_call_forwards_window(self, mock_fetch):
+        mock_fetch.return_value = PaginationResult(data=[])
+
+        paginated_api_call(Mock(), prefetch_window=3, branch_id_logging="1")
+
+        assert mock_fetch.call_args[0][1].prefetch_window == 3
+
+
+class TestStreamingPagination:
+    """Test lazy page and item iteration."""
+
+    def test_iter_pages_is_lazy(self):
+        mock_executor = Mock()
+        mock_executor.execute_with_retry.side_effect = [[1, 2], [3, 4], [5]]
+        caller = PaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=2)
+
+        pages = caller.iter_pages(Mock(), config, "1")
+
+        assert next(pages) == [1, 2]
+        assert mock_executor.execute_with_retry.call_count == 1
+        assert list(pages) == [[3, 4], [5]]
+        assert mock_executor.execute_with_retry.call_count == 3
+
+    def test_iter_items_raises_after_yielding_earlier_pages(self):
+        mock_executor = Mock()
+        mock_executor.retry_handler.config.max_retries = 1
+        mock_executor.execute_with_retry.side_effect = [
+            [1, 2],
+            ApiException("boom"),
+        ]
+        caller = PaginatedApiCaller(executor=mock_executor)
+        config = PaginationConfig(page_size=2)
+
+        seen = []
+        with pytest.raises(ApiException, match="boom"):
+            for item in caller.iter_items(Mock(), config, "1"):
+                seen.append(item)
+
+        assert seen == [1, 2]
+
+    def test_iter_items_wraps_single_result(self):
+        mock_executor = Mock()
+        mock_executor.execute_with_retry.return_value = {"single": "object"}
+        caller = PaginatedApiCaller(executor=mock_executor)
+
+        assert list(caller.iter_items(Mock(), PaginationConfig(), "1")) == [
+            {"single": "object"}
+        ]
+
+    def test_module_iter_items(self):
+        mock_api_func = Mock(side_effect=[[1, 2], [3]])
+        mock_api_func.__name__ = "get_things"
+
+        items = list(iter_items(mock_api_func, page_size=2, branch_id_logging="1"))
+
+        assert items == [1, 2, 3]
+        assert mock_api_func.call_args_list[1].kwargs == {"take": 2, "skip": 2}
+
+
 class TestFactoryFunctions:
     """Test factory and backward compatibility functions."""
 
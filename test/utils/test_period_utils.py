@@ -0,0 +1,57 @@
+"""Tests for reporting periods and partitioning records by period."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from evo_client.utils.period_utils import partition_by_period, rolling_periods
+
+PERIODS = rolling_periods(datetime(2024, 3, 1), count=2, days=30)
+
+
+def test_rolling_periods_are_consecutive():
+    periods = rolling_periods(datetime(2024, 3, 1), count=3, days=10)
+
+    assert periods[-1] == (datetime(2024, 2, 20), datetime(2024, 3, 1))
+    assert [start for start, _ in periods[1:]] == [end for _, end in periods[:-1]]
+
+
+def test_rolling_periods_need_one_period():
+    with pytest.raises(ValueError):
+        rolling_periods(count=0)
+
+
+def test_partition_is_half_open_except_last_end():
+    boundary = PERIODS[0][1]
+    records = [
+        PERIODS[0][0],
+        boundary - timedelta(seconds=1),
+        boundary,
+        PERIODS[1][1],
+        PERIODS[0][0] - timedelta(days=1),
+        None,
+    ]
+
+    previous, current = partition_by_period(records, PERIODS, lambda d: [d])
+
+    assert previous == records[:2]
+    assert current == records[2:4]
+
+
+def test_record_with_several_dates_counted_once_per_period():
+    dates = [PERIODS[0][0], PERIODS[0][0] + timedelta(days=1), PERIODS[1][0]]
+
+    previous, current = partition_by_period(["member"], PERIODS, lambda _: dates)
+
+    assert previous == ["member"]
+    assert current == ["member"]
+
+
+def test_aware_dates_compared_as_utc():
+    aware = PERIODS[1][0].replace(tzinfo=timezone(timedelta(hours=3)))
+
+    previous, current = partition_by_period([aware], PERIODS, lambda d: [d])
+
+    # 03:00 at UTC+3 is midnight UTC minus 3 hours, in the previous period
+    assert previous == [aware]
+    assert current == []
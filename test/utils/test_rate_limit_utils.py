@@ -0,0 +1,285 @@
+"""Tests for shared token-bucket rate limiting."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from evo_client.aio.api.members_api import AsyncMembersApi
+from evo_client.aio.core.api_client import AsyncApiClient
+from evo_client.core.configuration import Configuration
+from evo_client.sync.api.members_api import SyncMembersApi
+from evo_client.sync.core.api_client import SyncApiClient
+from evo_client.exceptions.api_exceptions import ApiException
+from evo_client.utils.async_pagination_utils import get_async_client_rate_limiter
+from evo_client.utils.pagination_utils import (
+    ApiCallExecutor,
+    PaginationConfig,
+    RetryConfig,
+    RetryHandler,
+    get_client_rate_limiter,
+)
+from evo_client.utils.rate_limit_utils import (
+    AdaptiveRateLimiter,
+    AsyncTokenBucketRateLimiter,
+    RateLimitInfo,
+    TokenBucketRateLimiter,
+    clear_shared_rate_limiters,
+    get_rate_limit_info,
+    get_shared_rate_limiter,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Isolate the process-wide limiter registry between tests."""
+    clear_shared_rate_limiters()
+    yield
+    clear_shared_rate_limiters()
+
+
+class TestTokenBucketRateLimiter:
+    """Test suite for TokenBucketRateLimiter class."""
+
+    def test_invalid_initialization(self):
+        with pytest.raises(ValueError, match="max_requests must be positive"):
+            TokenBucketRateLimiter(max_requests=0)
+        with pytest.raises(ValueError, match="time_window must be positive"):
+            TokenBucketRateLimiter(time_window=0)
+        with pytest.raises(ValueError, match="burst must be positive"):
+            TokenBucketRateLimiter(burst=0)
+
+    def test_reserve_paces_at_emission_interval(self):
+        limiter = TokenBucketRateLimiter(max_requests=40, time_window=60)
+
+        with patch("time.time", return_value=100.0):
+            delays = [limiter.reserve() for _ in range(3)]
+
+        assert delays == [0.0, 1.5, 3.0]
+
+    def test_burst_allows_back_to_back_requests(self):
+        limiter = TokenBucketRateLimiter(max_requests=4, time_window=4, burst=3)
+
+        with patch("time.time", return_value=0.0):
+            delays = [limiter.reserve() for _ in range(4)]
+
+        assert delays == [0.0, 0.0, 0.0, 1.0]
+
+    def test_idle_time_refills_bucket(self):
+        limiter = TokenBucketRateLimiter(max_requests=4, time_window=4)
+
+        with patch("time.time") as mock_time:
+            mock_time.return_value = 0.0
+            limiter.reserve()
+            mock_time.return_value = 10.0
+            assert limiter.reserve() == 0.0
+
+    def test_acquire_sleeps_outside_lock(self):
+        limiter = TokenBucketRateLimiter(max_requests=1, time_window=5)
+
+        def sleep(_):
+            # The lock must be free while the caller waits
+            assert limiter._lock.acquire(blocking=False)
+            limiter._lock.release()
+
+        with patch("time.time", return_value=0.0), patch(
+            "time.sleep", side_effect=sleep
+        ) as mock_sleep:
+            limiter.acquire()
+            limiter.acquire()
+
+        mock_sleep.assert_called_once_with(5.0)
+
+    def test_file_backed_state_is_shared(self, tmp_path):
+        state = str(tmp_path / "bucket.state")
+        first = TokenBucketRateLimiter(max_requests=2, time_window=2, state_path=state)
+        second = TokenBucketRateLimiter(max_requests=2, time_window=2, state_path=state)
+
+        with patch("time.time", return_value=50.0):
+            assert first.reserve() == 0.0
+            assert second.reserve() == 1.0
+
+        first.reset()
+        with patch("time.time", return_value=50.0):
+            assert second.reserve() == 0.0
+
+    async def test_async_wrapper_shares_budget(self):
+        limiter = TokenBucketRateLimiter(max_requests=1, time_window=3)
+        async_limiter = AsyncTokenBucketRateLimiter(limiter)
+
+        with patch("time.time", return_value=0.0), patch("asyncio.sleep") as mock_sleep:
+            limiter.acquire()
+            await async_limiter.acquire()
+
+        mock_sleep.assert_called_once_with(3.0)
+
+
+class TestSharedRateLimiters:
+    """Test credential-keyed limiter sharing between clients."""
+
+    def test_registry_returns_same_instance(self):
+        assert get_shared_rate_limiter("user:a") is get_shared_rate_limiter("user:a")
+        assert get_shared_rate_limiter("user:a") is not get_shared_rate_limiter(
+            "user:b"
+        )
+
+    def test_clients_with_same_credential_share_limiter(self):
+        sync_client = SyncApiClient(Configuration(username="gym", password="x"))
+        other_sync = SyncApiClient(Configuration(username="gym", password="y"))
+        async_client = AsyncApiClient(Configuration(username="gym", password="x"))
+        other_credential = SyncApiClient(Configuration(username="other"))
+
+        assert sync_client.rate_limiter is other_sync.rate_limiter
+        assert async_client.rate_limiter.limiter is sync_client.rate_limiter
+        assert other_credential.rate_limiter is not sync_client.rate_limiter
+
+    def test_paginated_calls_resolve_client_limiter(self):
+        client = SyncApiClient(Configuration(username="gym"))
+        async_client = AsyncApiClient(Configuration(username="gym"))
+
+        assert (
+            get_client_rate_limiter(SyncMembersApi(client).get_members)
+            is client.rate_limiter
+        )
+        assert (
+            get_async_client_rate_limiter(AsyncMembersApi(async_client).get_members)
+            is async_client.rate_limiter
+        )
+        assert get_client_rate_limiter(Mock()) is None
+
+
+class TestRateLimitInfo:
+    """Test parsing of rate-limit response headers."""
+
+    def test_retry_after_seconds_and_ratelimit_headers(self):
+        info = RateLimitInfo.from_headers(
+            429,
+            {
+                "retry-after": "12",
+                "X-RateLimit-Limit": "40",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": "30",
+            },
+        )
+
+        assert info.is_rate_limited
+        assert info.retry_after == 12.0
+        assert info.limit == 40.0
+        assert info.remaining == 0.0
+        assert info.reset_after == 30.0
+        assert info.wait_time == 12.0
+
+    def test_retry_after_http_date(self):
+        info = RateLimitInfo.from_headers(
+            429,
+            {"Retry-After": "Wed, 21 Oct 2015 07:28:30 GMT"},
+            now=1445412480.0,  # 07:28:00 GMT
+        )
+
+        assert info.retry_after == 30.0
+
+    def test_absolute_reset_and_exhausted_budget(self):
+        info = RateLimitInfo.from_headers(
+            200,
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000010"},
+            now=1700000000.0,
+        )
+
+        assert not info.is_rate_limited
+        assert info.wait_time == 10.0
+
+    def test_api_exception_exposes_headers(self):
+        http_resp = Mock()
+        http_resp.status = 429
+        http_resp.reason = "Too Many Requests"
+        http_resp.data = b""
+        http_resp.getheaders.return_value = {"Retry-After": "7"}
+
+        exc = ApiException(http_resp=http_resp)
+
+        assert exc.headers == {"Retry-After": "7"}
+        assert exc.rate_limit.retry_after == 7.0
+        assert get_rate_limit_info(exc) == exc.rate_limit
+        assert get_rate_limit_info(Exception("429")) is None
+
+    def test_retry_handler_prefers_structured_retry_after(self):
+        handler = RetryHandler(RetryConfig(base_delay=1.0))
+        exc = ApiException(status=429, headers={"Retry-After": "20"})
+
+        assert handler.compute_backoff_delay(1, exc) == 20.0
+
+
+class TestAdaptiveRateLimiter:
+    """Test AIMD adaptation of the rate limiter."""
+
+    def test_additive_increase_up_to_ceiling(self):
+        limiter = AdaptiveRateLimiter(
+            max_requests=10, time_window=60, ceiling=12, increase_every=2
+        )
+
+        for _ in range(10):
+            limiter.on_success()
+
+        assert limiter.max_requests == 12
+
+    def test_multiplicative_decrease_and_pause(self):
+        limiter = AdaptiveRateLimiter(max_requests=40, time_window=60, floor=15)
+
+        with patch("time.time", return_value=0.0):
+            limiter.on_rate_limited(RateLimitInfo(status=429, retry_after=9.0))
+            assert limiter.max_requests == 20
+            # Requests are held back until the server's Retry-After elapses
+            assert limiter.reserve() == 9.0
+
+            limiter.on_rate_limited(RateLimitInfo(status=429))
+            assert limiter.max_requests == 15
+
+    def test_advertised_limit_caps_rate(self):
+        limiter = AdaptiveRateLimiter(max_requests=100, time_window=60, floor=1)
+
+        limiter.on_rate_limited(RateLimitInfo(status=429, limit=30))
+
+        assert limiter.max_requests == 30
+
+    def test_executor_feeds_back_outcomes(self):
+        limiter = AdaptiveRateLimiter(max_requests=10, increase_every=1)
+        executor = ApiCallExecutor(
+            rate_limiter=limiter, retry_handler=RetryHandler(RetryConfig())
+        )
+        api_func = Mock(
+            side_effect=[
+                ApiException(status=429, headers={"Retry-After": "0"}),
+                ["ok"],
+            ]
+        )
+
+        with patch("time.sleep"):
+            assert executor.execute_with_retry(api_func) == ["ok"]
+
+        # Halved on the 429, then one additive step on success
+        assert limiter.max_requests == 6
+
+    def test_shared_limiter_can_be_adaptive(self):
+        client = SyncApiClient(Configuration(username="gym", rate_limit_adaptive=True))
+
+        assert isinstance(client.rate_limiter, AdaptiveRateLimiter)
+
+
+class TestLimiterGovernedPacing:
+    """Test that pacing is owned by the limiter rather than fixed delays."""
+
+    def test_no_fixed_delay_by_default(self):
+        assert PaginationConfig().post_request_delay == 0.0
+
+    def test_burst_mode_from_configuration(self):
+        client = SyncApiClient(
+            Configuration(
+                username="gym", rate_limit_burst=40, rate_limit_max_requests=40
+            )
+        )
+
+        with patch("time.time", return_value=0.0):
+            delays = [client.rate_limiter.reserve() for _ in range(41)]
+
+        # Budget is spent back to back, then the limiter paces the next request
+        assert delays[:40] == [0.0] * 40
+        assert delays[40] == 1.5
@@ -0,0 +1,132 @@
+"""Tests for the lightweight record modes."""
+
+from typing import List, Optional
+from unittest.mock import Mock
+
+import pytest
+import requests
+from pydantic import BaseModel, Field
+
+from evo_client.core.configuration import Configuration
+from evo_client.core.response import RESTResponse
+from evo_client.sync.core.request_handler import SyncRequestHandler
+from evo_client.utils.pagination_utils import PaginatedApiCaller, PaginationConfig
+from evo_client.utils.record_utils import (
+    construct_records,
+    record_mode,
+    resolve_record_mode,
+)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+BODY = b'[{"idMember": 1, "name": "Ana"}, {"idMember": 2, "name": "Bia"}]'
+
+
+class Member(BaseModel):
+    id_member: Optional[int] = Field(default=None, alias="idMember")
+    name: Optional[str] = None
+
+
+def make_response(body: bytes = BODY) -> RESTResponse:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = requests.structures.CaseInsensitiveDict(JSON_HEADERS)
+    response._content = body
+    return RESTResponse(response)
+
+
+class TestRecordMode:
+    """Test resolving the mode in effect."""
+
+    def test_defaults_to_configuration(self):
+        assert resolve_record_mode(Configuration()) == "model"
+        assert resolve_record_mode(Configuration(record_mode="dict")) == "dict"
+
+    def test_context_overrides_configuration(self):
+        configuration = Configuration(record_mode="dict")
+
+        with record_mode("construct"):
+            assert resolve_record_mode(configuration) == "construct"
+
+        assert resolve_record_mode(configuration) == "dict"
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown record mode"):
+            with record_mode("slots"):
+                pass
+        with pytest.raises(ValueError):
+            Configuration(record_mode="slots")
+
+
+class TestConstructRecords:
+    """Test building unvalidated models."""
+
+    def test_list_of_models_uses_field_names(self):
+        records = construct_records(
+            List[Member], [{"idMember": 1, "name": "Ana"}, {"idMember": 2}]
+        )
+
+        assert [record.id_member for record in records] == [1, 2]
+        assert records[0].name == "Ana"
+        assert isinstance(records[0], Member)
+
+    def test_values_are_not_validated(self):
+        record = construct_records(Member, {"idMember": "1"})
+
+        assert record.id_member == "1"
+
+    def test_other_types_return_data(self):
+        assert construct_records(List[int], [1, 2]) == [1, 2]
+        assert construct_records(dict, {"a": 1}) == {"a": 1}
+
+
+class TestDeserialize:
+    """Test the record mode of response deserialization."""
+
+    def test_dict_mode_returns_parsed_json(self):
+        data = make_response().deserialize(List[Member], "dict")
+
+        assert data == [{"idMember": 1, "name": "Ana"}, {"idMember": 2, "name": "Bia"}]
+
+    def test_construct_mode_skips_validation(self):
+        data = make_response(b'[{"idMember": "x"}]').deserialize(
+            List[Member], "construct"
+        )
+
+        assert data[0].id_member == "x"
+
+    def test_sync_handler_uses_record_mode(self):
+        handler = SyncRequestHandler(
+            Configuration(host="https://api.example.com", single_flight_enabled=False)
+        )
+        handler.rest_client.request = Mock(side_effect=lambda **kwargs: make_response())
+
+        with record_mode("dict"):
+            raw = handler.execute(
+                method="GET",
+                resource_path="/api/v1/members",
+                response_type=List[Member],
+            )
+        models = handler.execute(
+            method="GET", resource_path="/api/v1/members", response_type=List[Member]
+        )
+
+        assert raw[0] == {"idMember": 1, "name": "Ana"}
+        assert models[0] == Member(idMember=1, name="Ana")
+
+
+def test_prefetched_pages_see_caller_record_mode():
+    seen = []
+
+    def execute(api_func, context, *args, **kwargs):
+        seen.append(resolve_record_mode(Configuration()))
+        return [kwargs["skip"]] * kwargs["take"] if kwargs["skip"] < 10 else []
+
+    executor = Mock()
+    executor.retry_handler.config.max_retries = 1
+    executor.execute_with_retry.side_effect = execute
+    caller = PaginatedApiCaller(executor=executor)
+
+    with record_mode("dict"):
+        caller.fetch_all_pages(Mock(), PaginationConfig(page_size=5, prefetch_window=3))
+
+    assert seen and set(seen) == {"dict"}
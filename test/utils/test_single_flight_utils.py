@@ -0,0 +1,204 @@
+"""Tests for coalescing identical in-flight requests."""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from evo_client.aio.core.request_handler import AsyncRequestHandler
+from evo_client.core.configuration import Configuration
+from evo_client.core.response import RESTResponse
+from evo_client.sync.core.request_handler import SyncRequestHandler
+from evo_client.utils.record_utils import record_mode
+from evo_client.utils.single_flight_utils import AsyncSingleFlight, SingleFlight
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class TestSingleFlight:
+    """Test the thread-based group."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return ["memberships"]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(group.do, "k", slow) for _ in range(4)]
+            # Give every caller time to reach the group before the call ends
+            threading.Timer(0.2, release.set).start()
+            results = [future.result(5) for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_error_is_shared_and_key_released(self):
+        group = SingleFlight()
+
+        with pytest.raises(ValueError):
+            group.do("k", Mock(side_effect=ValueError("boom")))
+
+        assert group.do("k", lambda: 2) == 2
+        assert group._calls == {}
+
+    def test_sequential_calls_are_not_coalesced(self):
+        group = SingleFlight()
+        fn = Mock(return_value=1)
+
+        group.do("k", fn)
+        group.do("k", fn)
+
+        assert fn.call_count == 2
+
+
+class TestAsyncSingleFlight:
+    """Test the asyncio group."""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ["memberships"]
+
+        results = await asyncio.gather(*(group.do("k", slow) for _ in range(3)))
+
+        assert len(calls) == 1
+        assert results == [["memberships"]] * 3
+        assert group._calls == {}
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        group = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            return 1
+
+        first = asyncio.ensure_future(group.do("k", slow))
+        second = asyncio.ensure_future(group.do("k", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 1
+
+    async def test_error_is_shared(self):
+        group = AsyncSingleFlight()
+        failing = AsyncMock(side_effect=ValueError("boom"))
+
+        results = await asyncio.gather(
+            group.do("k", failing), group.do("k", failing), return_exceptions=True
+        )
+
+        assert failing.await_count == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.fixture
+def configuration():
+    return Configuration(host="https://api.example.com", username="gym")
+
+
+class TestRequestHandlers:
+    """Test that the request handlers coalesce identical GETs."""
+
+    def test_sync_handler_coalesces_concurrent_gets(self, configuration):
+        handler = SyncRequestHandler(configuration)
+        release = threading.Event()
+        response = Mock(status=200, data=b"[1]")
+        response.getheaders.return_value = JSON_HEADERS
+        response.json.return_value = [1]
+
+        def request(**kwargs):
+            release.wait(5)
+            return response
+
+        with patch.object(
+            handler.rest_client, "request", side_effect=request
+        ) as rest_request:
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                futures = [
+                    pool.submit(
+                        handler.execute,
+                        method="GET",
+                        resource_path="/api/v1/membership",
+                        query_params={"active": True},
+                    )
+                    for _ in range(3)
+                ]
+                threading.Timer(0.2, release.set).start()
+                results = [future.result(5) for future in futures]
+
+        assert rest_request.call_count == 1
+        assert results == [[1]] * 3
+
+    def test_sync_followers_get_their_own_response(self, configuration):
+        handler = SyncRequestHandler(configuration)
+        release = threading.Event()
+        response = RESTResponse.from_content(200, JSON_HEADERS, b'[{"id": 1}]')
+
+        def request(**kwargs):
+            release.wait(5)
+            return response
+
+        with patch.object(handler.rest_client, "request", side_effect=request):
+            with record_mode("dict"), ThreadPoolExecutor(max_workers=3) as pool:
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        handler.execute,
+                        method="GET",
+                        resource_path="/api/v1/membership",
+                        response_type=List[dict],
+                    )
+                    for _ in range(3)
+                ]
+                threading.Timer(0.2, release.set).start()
+                results = [future.result(5) for future in futures]
+
+        results[0][0]["id"] = 2
+        assert results[1:] == [[{"id": 1}]] * 2
+        assert len({id(result) for result in results}) == 3
+
+    def test_sync_handler_does_not_coalesce_when_disabled(self, configuration):
+        configuration.single_flight_enabled = False
+        handler = SyncRequestHandler(configuration)
+
+        assert handler.single_flight is None
+
+    async def test_async_handler_coalesces_concurrent_gets(self, configuration):
+        handler = AsyncRequestHandler(configuration)
+
+        async def read():
+            await asyncio.sleep(0.01)
+            return b"[1]"
+
+        response = Mock(
+            status=200,
+            headers=JSON_HEADERS,
+            url="https://api.example.com/api/v1/membership",
+            read=read,
+        )
+        session = MagicMock()
+        session.request.return_value.__aenter__ = AsyncMock(return_value=response)
+        handler._ensure_session = AsyncMock(return_value=session)
+
+        results = await asyncio.gather(
+            *(
+                handler.execute(method="GET", resource_path="/api/v1/membership")
+                for _ in range(3)
+            )
+        )
+
+        assert session.request.call_count == 1
+        assert results == [[1]] * 3